@@ -147,6 +147,92 @@ def test_day_session_apis():
     return session_ids
 
 
+def check(label, condition):
+    """검증 결과 출력"""
+    print(f"   {'✅' if condition else '❌'} {label}")
+    return condition
+
+def test_day_session_range_and_stats():
+    """세션 수정/상태 전이 후 기간 조회와 집계 테스트 (세션이 하나뿐인 날짜)"""
+    print("🧪 === 데이 세션 기간 조회 / 집계 테스트 ===\n")
+
+    token = get_auth_token()
+    if not token:
+        print("❌ 인증 토큰을 가져올 수 없습니다.")
+        return
+
+    headers = {"Authorization": f"Bearer {token}"}
+    day = "2025-09-15"
+    range_params = {"from": day, "to": day}
+
+    try:
+        # 이전 실행에서 남은 세션 정리
+        requests.put(f"{BASE_URL}/api/day-sessions/bulk/{day}", json={"date": day, "sessions": []}, headers=headers)
+
+        # 1. 세션 하나 생성 후 수정 → 기간 조회
+        print("1️⃣ PUT /api/day-sessions/{session_id} 후 GET /api/day-sessions?from=&to=")
+        response = requests.post(f"{BASE_URL}/api/day-sessions", json={
+            "date": day, "start_time": "", "status": "ready", "set_number": 1
+        }, headers=headers)
+        session_id = response.json()["id"]
+        requests.put(f"{BASE_URL}/api/day-sessions/{session_id}", json={"action": "코딩"}, headers=headers)
+        response = requests.get(f"{BASE_URL}/api/day-sessions", params=range_params, headers=headers)
+        records = response.json()["records"]
+        print(f"   Status: {response.status_code}")
+        check("날짜가 한 번만 포함됨", len(records) == 1)
+        check("세션 1개", len(records[0]["sessions"]) == 1 if records else False)
+        response = requests.put(f"{BASE_URL}/api/day-sessions/{session_id}", json={"start_time": None}, headers=headers)
+        check(f"start_time을 null로 수정하면 거부 ({response.status_code})", response.status_code == 422)
+        response = requests.get(f"{BASE_URL}/api/day-sessions/{day}", headers=headers)
+        check("거부된 뒤에도 날짜 조회에 남아 있음", [s["id"] for s in response.json()["sessions"]] == [session_id])
+        print()
+
+        # 2. 시작 → 완료 → 휴식 → 휴식 종료 → 마감 전이 후 기간 조회 / 집계
+        print("2️⃣ POST /api/day-sessions/{session_id}/transition 후 GET /api/day-sessions/stats")
+        steps = [
+            (session_id, "start", "2025-09-15T09:00:00"),
+            (session_id, "complete", "2025-09-15T09:25:00"),
+            (session_id, "rest", "2025-09-15T09:25:00"),
+        ]
+        for target, event, at in steps:
+            response = requests.post(
+                f"{BASE_URL}/api/day-sessions/{target}/transition", json={"event": event, "at": at}, headers=headers
+            )
+            print(f"   {event}: {response.status_code}")
+        rest_id = response.json()["next"]["id"]
+        for event, at in [("rest_end", "2025-09-15T09:30:00"), ("finish", "2025-09-15T09:30:00")]:
+            response = requests.post(
+                f"{BASE_URL}/api/day-sessions/{rest_id}/transition", json={"event": event, "at": at}, headers=headers
+            )
+            print(f"   {event}: {response.status_code}")
+
+        response = requests.get(f"{BASE_URL}/api/day-sessions", params=range_params, headers=headers)
+        records = response.json()["records"]
+        check("날짜가 한 번만 포함됨", len(records) == 1)
+        check("세션 3개 (작업, 휴식, 다음 세트)", len(records[0]["sessions"]) == 3 if records else False)
+
+        response = requests.get(f"{BASE_URL}/api/day-sessions/stats", params=range_params, headers=headers)
+        stats = response.json()
+        print(f"   Status: {response.status_code}")
+        print(f"   Response: {json.dumps(stats, indent=2, ensure_ascii=False)}")
+        check("종료된 세션 2개, 진행 전 세션 1개", (stats["sessionCount"], stats["openSessionCount"]) == (2, 1))
+        check("집중 25분, 휴식 5분", (stats["focusedSeconds"], stats["restSeconds"]) == (1500, 300))
+        print()
+
+        # 3. 모든 세션 삭제 → 빈 날짜는 기간 조회에서 빠짐
+        print("3️⃣ DELETE /api/day-sessions/{session_id} 전부 후 기간 조회")
+        for session in records[0]["sessions"] if records else []:
+            requests.delete(f"{BASE_URL}/api/day-sessions/{session['id']}", headers=headers)
+        response = requests.get(f"{BASE_URL}/api/day-sessions", params=range_params, headers=headers)
+        check("빈 날짜 없음", response.json()["records"] == [])
+        print()
+
+        print("✅ 데이 세션 기간 조회 / 집계 테스트 완료!")
+
+    except Exception as e:
+        print(f"❌ 데이 세션 기간 조회 / 집계 테스트 중 오류: {e}")
+
+
 def main():
     """메인 테스트 실행"""
     try:
@@ -160,6 +246,7 @@ def main():
         
         # 데이 세션 API 테스트
         test_day_session_apis()
+        test_day_session_range_and_stats()
         
         print("\n🎉 데이 세션 API 테스트 완료!")
         
@@ -0,0 +1,86 @@
+"""
+데이 세션 메모리 사용량 비교
+
+저장소가 세션을 pydantic DaySession 인스턴스로 보관할 때와
+SessionRecord(__slots__ 레코드)로 보관할 때의 세션당 메모리를 tracemalloc으로 잰다.
+
+사용법: python memory_benchmark.py [세션 수]
+"""
+
+import sys
+import os
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.day_session import DaySession
+from utils.session_records import SessionRecord
+
+ACTIONS = ["독서", "코딩", "운동", "명상", "영어 공부"]
+
+
+def make_sessions(count: int):
+    """타이머를 많이 쓰는 사용자의 세션 count개 (하루 40개, 작업/휴식 반복)"""
+    base = datetime(2025, 9, 1, 9, 0, 0)
+    sessions = []
+    for index in range(count):
+        day = index // 40  # 하루 40세션
+        start = base + timedelta(days=day, minutes=(index % 40) * 30)
+        end = start + timedelta(minutes=25)
+        is_rest = index % 2 == 1
+        created = datetime.now()
+        # JSON 요청에서 파싱된 값처럼 문자열을 매번 새로 만든다
+        sessions.append(dict(
+            id=f"01J{index:023d}",
+            user_id="".join(["1"]),
+            date=start.strftime("%Y-%m-%d"),
+            start_time=start.isoformat() + ".000Z",
+            end_time=end.isoformat() + ".000Z",
+            action="".join(["휴식"]) if is_rest else "".join([ACTIONS[index % len(ACTIONS)]]),
+            status="".join(["finished"]),
+            is_rest=is_rest,
+            is_new_action=False,
+            set_number=index % 40 // 2 + 1,
+            created_at=created,
+            updated_at=created,
+        ))
+    return sessions
+
+
+def measure(build, count: int) -> float:
+    """build(입력 dict 목록)가 만든 객체들이 차지하는 세션당 바이트 (문자열 등 참조하는 값 포함)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    inputs = make_sessions(count)
+    stored = build(inputs)
+    del inputs  # 요청 데이터는 버리고 저장소에 남는 것만 잰다
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert len(stored) == count
+    return total / count
+
+
+def build_models(inputs):
+    return [DaySession(**data) for data in inputs]
+
+
+def build_records(inputs):
+    return [SessionRecord.from_model(DaySession(**data)) for data in inputs]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"🧪 데이 세션 {count}개 메모리 비교\n")
+
+    model_bytes = measure(build_models, count)
+    record_bytes = measure(build_records, count)
+
+    print(f"   DaySession (pydantic)    : {model_bytes:8.1f} bytes/세션")
+    print(f"   SessionRecord (__slots__): {record_bytes:8.1f} bytes/세션")
+    print(f"   ✅ 절감: {(1 - record_bytes / model_bytes) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
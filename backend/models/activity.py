@@ -18,5 +18,15 @@ class ActivityResponse(BaseModel):
     createdAt: str
     updatedAt: str
 
+class ActivityPartialResponse(BaseModel):
+    """GET /activities 항목 (?fields=로 일부만 요청하면 그 필드와 id만 포함)"""
+    id: str
+    userId: Optional[str] = None
+    name: Optional[str] = None
+    color: Optional[str] = None
+    orderIndex: Optional[int] = None
+    createdAt: Optional[str] = None
+    updatedAt: Optional[str] = None
+
 class ActivityReorder(BaseModel):
     activityIds: List[str]  # 새로운 순서대로 정렬된 활동 ID 배열
@@ -0,0 +1,42 @@
+"""
+배치 모델 - 오프라인에서 쌓인 변경들을 한 번에 올리는 /batch 요청/응답
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+from datetime import datetime
+
+MAX_BATCH_MUTATIONS = 500  # 한 번에 올릴 수 있는 최대 변경 수
+
+class BatchMutation(BaseModel):
+    """변경 하나 (data는 각 라우터의 요청 모델과 같은 형태)
+
+    - routines / activities: create, update, delete, reorder
+    - routine_progress: set (RoutineProgressCreate)
+    - day_sessions: create, update, delete
+
+    id와 data의 routineId, routineIds, activityIds에 "$0"처럼 쓰면
+    같은 배치의 0번 create로 만들어진 ID를 가리킨다.
+    """
+    kind: Literal['routines', 'activities', 'routine_progress', 'day_sessions'] = Field(..., description="컬렉션")
+    op: Literal['create', 'update', 'delete', 'reorder', 'set'] = Field(..., description="작업")
+    id: Optional[str] = Field(None, description="update/delete 대상 ID")
+    data: Dict[str, Any] = Field(default_factory=dict, description="요청 본문")
+    clientTimestamp: datetime = Field(..., description="클라이언트에서 변경한 시각 (ISO 형식, 필드별 최신 변경 우선 병합에 사용)")
+
+class BatchRequest(BaseModel):
+    """배치 요청 (순서대로 적용)"""
+    mutations: List[BatchMutation] = Field(..., max_length=MAX_BATCH_MUTATIONS, description="변경 목록")
+
+class BatchResult(BaseModel):
+    """변경 하나의 결과"""
+    index: int = Field(0, description="요청의 mutations 안에서의 위치")
+    status: int = Field(200, description="개별 요청으로 보냈을 때와 같은 HTTP 상태 코드 (409: 서버에 더 최근 변경이 있음)")
+    id: Optional[str] = Field(None, description="대상 레코드 ID (create면 새로 발급된 ID)")
+    detail: Optional[str] = Field(None, description="실패 사유")
+    ignoredFields: List[str] = Field(default_factory=list, description="서버에 더 최근 값이 있어 적용하지 않은 필드")
+    data: Optional[Dict[str, Any]] = Field(None, description="적용 후 레코드")
+
+class BatchResponse(BaseModel):
+    """배치 응답"""
+    results: List[BatchResult] = Field(default_factory=list, description="mutations와 같은 순서의 결과")
@@ -2,7 +2,7 @@
 데이 세션 모델 - 하루 중 사용자의 활동 세션을 관리하는 모델
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, Literal
 from datetime import datetime
 
@@ -23,11 +23,6 @@ class DaySession(BaseModel):
     created_at: Optional[datetime] = Field(default_factory=datetime.now)
     updated_at: Optional[datetime] = Field(default_factory=datetime.now)
 
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
-
 class DaySessionCreate(BaseModel):
     """데이 세션 생성 요청 모델"""
     date: str = Field(..., description="YYYY-MM-DD 형식의 날짜")
@@ -53,12 +48,58 @@ class DaySessionUpdate(BaseModel):
     is_new_action: Optional[bool] = Field(None, description="새 액션으로 생성된 세션 여부")
     set_number: Optional[int] = Field(None, description="세트 번호")
 
+    @field_validator("start_time", "status")
+    @classmethod
+    def not_null(cls, value):
+        """생략은 허용하지만 null로 지울 수는 없는 필드 (DaySession에서 필수)"""
+        if value is None:
+            raise ValueError("null로 지울 수 없는 필드입니다")
+        return value
+
 class DayRecord(BaseModel):
     """하루 기록 모델 (여러 세션을 포함)"""
     date: str = Field(..., description="YYYY-MM-DD 형식의 날짜")
     sessions: list[DaySession] = Field(default_factory=list, description="해당 날짜의 세션들")
     
+class DayRecordRange(BaseModel):
+    """기간 조회 모델 (세션이 있는 날짜만 날짜순으로 포함)"""
+    startDate: str = Field(..., description="조회 시작 날짜 (YYYY-MM-DD)")
+    endDate: str = Field(..., description="조회 종료 날짜 (YYYY-MM-DD, 포함)")
+    records: list[DayRecord] = Field(default_factory=list, description="날짜별 세션들")
+    nextCursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
+
 class DayRecordUpdate(BaseModel):
     """하루 기록 전체 업데이트 모델"""
     date: str = Field(..., description="YYYY-MM-DD 형식의 날짜")
     sessions: list[DaySessionCreate] = Field(..., description="업데이트할 세션들")
+
+SessionTransitionEvent = Literal['start', 'complete', 'rest', 'rest_end', 'finish', 'continue', 'newAction']
+
+class DaySessionTransition(BaseModel):
+    """세션 상태 전이 요청 모델 (DayPage 버튼과 같은 이름)"""
+    event: SessionTransitionEvent = Field(..., description="전이 (start, complete, rest, rest_end, finish, continue, newAction)")
+    at: Optional[str] = Field(None, description="전이 시각 (ISO 형식, 없으면 서버 시각)")
+    action: Optional[str] = Field(None, description="complete: 완료한 활동, continue/newAction: 새 세션의 활동")
+
+class DaySessionTransitionResult(BaseModel):
+    """상태 전이 결과 (현재 세션과 이어서 만들어진 세션)"""
+    session: DaySession = Field(..., description="전이된 현재 세션")
+    next: Optional[DaySession] = Field(None, description="이어서 만들어진 세션 (휴식, 다음 작업, 다음 세트)")
+
+class SessionActionDuration(BaseModel):
+    """활동별 집계"""
+    action: str = Field(..., description="활동 이름 (없으면 빈 문자열)")
+    totalSeconds: int = Field(..., description="총 수행 시간 (초)")
+    sessionCount: int = Field(..., description="세션 수")
+
+class DaySessionStats(BaseModel):
+    """기간 내 데이 세션 시간 집계 (종료된 세션만 포함)"""
+    startDate: str = Field(..., description="조회 시작 날짜 (YYYY-MM-DD)")
+    endDate: str = Field(..., description="조회 종료 날짜 (YYYY-MM-DD, 포함)")
+    sessionCount: int = Field(..., description="집계된 세션 수")
+    openSessionCount: int = Field(..., description="아직 끝나지 않았거나 시각을 해석할 수 없어 제외된 세션 수")
+    focusedSeconds: int = Field(..., description="휴식이 아닌 세션의 총 시간 (초)")
+    restSeconds: int = Field(..., description="휴식 세션의 총 시간 (초)")
+    setCount: int = Field(..., description="완료된 세트(휴식이 아닌 세션) 수")
+    maxSetNumber: int = Field(..., description="가장 큰 세트 번호")
+    actions: list[SessionActionDuration] = Field(default_factory=list, description="활동별 시간 (긴 순)")
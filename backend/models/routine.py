@@ -21,5 +21,16 @@ class RoutineResponse(BaseModel):
     createdAt: str
     updatedAt: str
 
+class RoutinePartialResponse(BaseModel):
+    """GET /routines 항목 (?fields=로 일부만 요청하면 그 필드와 id만 포함)"""
+    id: str
+    userId: Optional[str] = None
+    timeAction: Optional[str] = None
+    routineText: Optional[str] = None
+    emoji: Optional[str] = None
+    orderIndex: Optional[int] = None
+    createdAt: Optional[str] = None
+    updatedAt: Optional[str] = None
+
 class RoutineReorder(BaseModel):
     routineIds: List[str]  # 새로운 순서대로 정렬된 루틴 ID 배열
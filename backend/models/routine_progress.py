@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import date
 
@@ -20,11 +20,58 @@ class RoutineProgressToggle(BaseModel):
     routineId: str
     date: str  # YYYY-MM-DD 형식
 
+class RoutineProgressBulkSet(BaseModel):
+    items: List[RoutineProgressCreate] = Field(..., max_length=2000)  # 같은 (routineId, date)가 여러 번이면 마지막 값
+
+class RoutineWithProgress(BaseModel):
+    """루틴 정보 + 해당 날짜의 완료 상태 (?fields=로 일부만 요청하면 그 필드와 id만 포함)"""
+    id: str
+    timeAction: Optional[str] = None
+    routineText: Optional[str] = None
+    emoji: Optional[str] = None
+    orderIndex: Optional[int] = None
+    isCompleted: Optional[bool] = None
+
 class DailyRoutineProgress(BaseModel):
     date: str
-    routines: List[dict]  # 루틴 정보 + 완료 상태
+    routines: List[RoutineWithProgress]  # 루틴 정보 + 완료 상태
 
 class WeeklyRoutineProgress(BaseModel):
     startDate: str
     endDate: str
     dailyProgress: List[DailyRoutineProgress]
+
+class RangeRoutineProgress(BaseModel):
+    startDate: str
+    endDate: str
+    dailyProgress: List[DailyRoutineProgress]
+
+class RoutineCompletionRate(BaseModel):
+    routineId: str
+    routineText: str
+    completedDays: int
+    totalDays: int
+    completionRate: float  # 0~100
+
+class RoutineProgressStats(BaseModel):
+    date: str
+    totalRoutines: int
+    completedRoutines: int
+    completionRate: float  # 0~100, 해당 날짜 기준
+    streak: int  # 해당 날짜까지 연속으로 모든 루틴을 완료한 일수
+    bestStreak: int  # 최고 연속 완료 일수
+    routineRates: List[RoutineCompletionRate]
+
+class RoutineYearSummary(BaseModel):
+    routineId: str
+    routineText: str
+    completedDays: int
+    longestStreak: int  # 해당 연도 안에서 가장 긴 연속 완료 일수
+    currentStreak: int  # 해당 연도의 마지막 날(올해라면 오늘)까지 이어지는 연속 완료 일수
+
+class RoutineHeatmap(BaseModel):
+    year: int
+    days: List[int]  # 1월 1일부터 날짜별 완료한 루틴 수
+    perfectDays: int  # 모든 루틴을 완료한 날 수
+    longestPerfectStreak: int
+    routines: List[RoutineYearSummary]
@@ -0,0 +1,21 @@
+"""
+동기화 모델 - 커서 이후에 바뀐 레코드만 내려주는 /sync 응답
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Literal, Optional
+
+SyncKind = Literal['routines', 'activities', 'routine_progress', 'day_sessions']
+
+class SyncChange(BaseModel):
+    """레코드 하나의 변경 (삭제면 data 없이 deleted=True인 툼스톤)"""
+    kind: SyncKind = Field(..., description="컬렉션")
+    id: str = Field(..., description="레코드 ID")
+    deleted: bool = Field(False, description="삭제 여부")
+    data: Optional[Dict[str, Any]] = Field(None, description="현재 레코드 (각 목록 조회 응답과 같은 형태)")
+
+class SyncResponse(BaseModel):
+    """동기화 응답"""
+    cursor: str = Field(..., description="다음 /sync 요청에 since로 보낼 커서")
+    reset: bool = Field(..., description="True면 로컬 데이터를 모두 버리고 changes로 다시 채운다")
+    changes: list[SyncChange] = Field(default_factory=list, description="변경 순서대로 정렬된 변경 목록")
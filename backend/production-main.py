@@ -12,6 +12,11 @@ from routes.routines import router as routines_router
 from routes.routine_progress import router as routine_progress_router
 from routes.activities import router as activities_router
 from routes.day_sessions import router as day_sessions_router
+from routes.sync import router as sync_router
+from routes.batch import router as batch_router
+from routes.events import router as events_router
+from utils.encoding import CompressionMiddleware, MsgPackMiddleware
+from utils.idempotency import IdempotencyMiddleware
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -20,6 +25,12 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 쓰기 요청 재시도 중복 방지 (Idempotency-Key 헤더), CORS 미들웨어 안쪽에서 동작
+app.add_middleware(IdempotencyMiddleware)
+# Accept: application/msgpack 응답/요청 본문 변환, 큰 응답 brotli/gzip 압축
+app.add_middleware(MsgPackMiddleware)
+app.add_middleware(CompressionMiddleware)
+
 # CORS 설정 - 배포용
 app.add_middleware(
     CORSMiddleware,
@@ -37,6 +48,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Idempotent-Replayed"],  # 클라이언트가 읽을 수 있는 응답 헤더
 )
 
 # 라우터 등록
@@ -45,6 +57,9 @@ app.include_router(routines_router)
 app.include_router(routine_progress_router)
 app.include_router(activities_router)
 app.include_router(day_sessions_router)
+app.include_router(sync_router)
+app.include_router(batch_router)
+app.include_router(events_router)
 
 # 기본 엔드포인트들
 @app.get("/")
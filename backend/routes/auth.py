@@ -16,8 +16,9 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.user import UserSignup, UserLogin, UserResponse, Token
-from utils.auth import get_password_hash, verify_password, create_access_token, get_current_user, get_user_by_email
-from utils.database import users_db
+from utils.auth import get_password_hash_async, verify_password_async, create_access_token, get_current_user, get_user_by_email
+from utils.database import store
+from utils.ids import new_id
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -36,16 +37,17 @@ params : {
 @router.post("/signup", response_model=Token)
 async def signup(user_data: UserSignup):
     # 이메일 중복 확인
-    if get_user_by_email(user_data.email, users_db):
+    if get_user_by_email(user_data.email):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="이미 존재하는 이메일입니다"
         )
     
     # 새 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+    # 해싱은 별도 스레드 풀에서 실행 (이벤트 루프 차단 방지)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = {
-        "id": str(len(users_db) + 1),
+        "id": new_id(),
         "email": user_data.email,
         "password": hashed_password,
         "name": user_data.name,
@@ -53,7 +55,12 @@ async def signup(user_data: UserSignup):
         "createdAt": datetime.now().isoformat()
     }
     
-    users_db.append(new_user)
+    # 해싱을 기다리는 동안 같은 이메일로 먼저 가입했을 수 있으므로 추가할 때 다시 확인
+    if store.add_user(new_user) is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 존재하는 이메일입니다"
+        )
     
     # JWT 토큰 생성
     access_token = create_access_token(data={"sub": user_data.email})
@@ -85,9 +92,9 @@ params : {
 
 @router.post("/login", response_model=Token)
 async def login(user_credentials: UserLogin):
-    user = get_user_by_email(user_credentials.email, users_db)
+    user = get_user_by_email(user_credentials.email)
     
-    if not user or not verify_password(user_credentials.password, user["password"]):
+    if not user or not await verify_password_async(user_credentials.password, user["password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다",
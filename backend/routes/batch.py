@@ -0,0 +1,248 @@
+"""
+배치 API 라우터
+
+오프라인에서 쌓인 루틴 토글, 세션 수정, 순서 변경 등을 한 요청으로 올린다.
+변경들은 사용자별 잠금 안에서 순서대로 적용되고, 영속 저장소에는 한 번에 커밋된다.
+수정은 필드별로 clientTimestamp가 서버에 기록된 마지막 변경보다 늦을 때만 반영한다 (last-writer-wins).
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, status
+from pydantic import ValidationError
+from datetime import datetime
+from typing import Dict
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.activity import ActivityCreate, ActivityUpdate, ActivityReorder
+from models.batch import BatchMutation, BatchRequest, BatchResponse, BatchResult
+from models.day_session import DaySession, DaySessionCreate, DaySessionUpdate
+from models.routine import RoutineCreate, RoutineUpdate, RoutineReorder
+from models.routine_progress import RoutineProgressCreate
+from routes import activities, day_sessions, routine_progress, routines
+from utils.auth import get_current_user
+from utils.database import store
+from utils.field_clocks import to_clock
+from utils.ids import new_id
+from utils.session_records import SessionRecord
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+# 컬렉션별 저장소 메서드와 요청 모델
+_COLLECTIONS = {
+    "routines": {
+        "create": routines.create_routine,
+        "create_model": RoutineCreate,
+        "update_model": RoutineUpdate,
+        "reorder_model": RoutineReorder,
+        "reorder_field": "routineIds",
+        "get": store.get_routine,
+        "update": store.update_routine,
+        "delete": store.delete_routine,
+        "reorder": store.reorder_routines,
+        "not_found": "루틴을 찾을 수 없습니다",
+    },
+    "activities": {
+        "create": activities.create_activity,
+        "create_model": ActivityCreate,
+        "update_model": ActivityUpdate,
+        "reorder_model": ActivityReorder,
+        "reorder_field": "activityIds",
+        "get": store.get_activity,
+        "update": store.update_activity,
+        "delete": store.delete_activity,
+        "reorder": store.reorder_activities,
+        "not_found": "활동을 찾을 수 없습니다",
+    },
+    "day_sessions": {
+        "create": day_sessions.create_day_session,
+        "create_model": DaySessionCreate,
+        "update_model": DaySessionUpdate,
+        "get": store.get_day_session,
+        "update": store.update_day_session,
+        "delete": store.delete_day_session,
+        "not_found": "세션을 찾을 수 없습니다",
+    },
+}
+
+STALE_DETAIL = "서버에 더 최근 변경이 있어 적용하지 않았습니다"
+
+def _resolve(value, created: Dict[int, str]):
+    """"$N" → 같은 배치 N번 create로 만들어진 ID"""
+    if isinstance(value, str) and value.startswith("$") and value[1:].isdigit():
+        created_id = created.get(int(value[1:]))
+        if created_id is None:
+            raise HTTPException(status_code=400, detail=f"참조할 수 없는 배치 항목입니다: {value}")
+        return created_id
+    return value
+
+def _dump(record) -> dict:
+    if isinstance(record, SessionRecord):
+        return record.to_dict()
+    return record.model_dump(mode="json") if isinstance(record, DaySession) else record
+
+def _get_record(collection: dict, user_id: str, record_id):
+    record = collection["get"](user_id, record_id) if record_id else None
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=collection["not_found"])
+    return record
+
+async def _create(mutation: BatchMutation, at: datetime, current_user: dict, created: Dict[int, str]) -> BatchResult:
+    collection = _COLLECTIONS[mutation.kind]
+    record = await collection["create"](collection["create_model"](**mutation.data), current_user)
+    # 오프라인에서 만든 레코드는 만든 시각을 기준으로 이후 변경과 비교
+    store.reset_clock(current_user["id"], mutation.kind, record, at)
+    data = _dump(record)
+    return BatchResult(id=data["id"], data=data)
+
+async def _update(mutation: BatchMutation, at: datetime, current_user: dict, created: Dict[int, str]) -> BatchResult:
+    collection = _COLLECTIONS[mutation.kind]
+    record_id = _resolve(mutation.id, created)
+    update_data = collection["update_model"](**mutation.data)
+    record = _get_record(collection, current_user["id"], record_id)
+
+    if mutation.kind == "day_sessions":
+        changes = update_data.model_dump(exclude_unset=True)
+    else:
+        changes = update_data.model_dump(exclude_none=True)
+    ignored = store.stale_fields(current_user["id"], mutation.kind, record, changes, at)
+    for field in ignored:
+        del changes[field]
+    if not changes:
+        return BatchResult(status=status.HTTP_409_CONFLICT, id=record_id, detail=STALE_DETAIL, ignoredFields=ignored)
+
+    if mutation.kind == "day_sessions":
+        day_sessions.ensure_no_overlap(
+            current_user["id"],
+            changes.get("start_time", record.start_time),
+            changes.get("end_time", record.end_time),
+            exclude_ids=[record_id]
+        )
+        changes["updated_at"] = datetime.now()
+    else:
+        changes["updatedAt"] = datetime.now().isoformat()
+    record = collection["update"](current_user["id"], record_id, changes, at=at)
+    return BatchResult(id=record_id, data=_dump(record), ignoredFields=ignored)
+
+async def _delete(mutation: BatchMutation, at: datetime, current_user: dict, created: Dict[int, str]) -> BatchResult:
+    collection = _COLLECTIONS[mutation.kind]
+    record_id = _resolve(mutation.id, created)
+    record = _get_record(collection, current_user["id"], record_id)
+    # 삭제 이후에 서버에서 수정된 레코드는 지우지 않는다
+    if store.changed_since(current_user["id"], mutation.kind, record, at):
+        return BatchResult(status=status.HTTP_409_CONFLICT, id=record_id, detail=STALE_DETAIL)
+    collection["delete"](current_user["id"], record_id)
+    return BatchResult(id=record_id)
+
+async def _reorder(mutation: BatchMutation, at: datetime, current_user: dict, created: Dict[int, str]) -> BatchResult:
+    collection = _COLLECTIONS[mutation.kind]
+    reorder_data = collection["reorder_model"](**mutation.data)
+    ids = [_resolve(item_id, created) for item_id in getattr(reorder_data, collection["reorder_field"])]
+    if store.order_changed_since(current_user["id"], mutation.kind, at):
+        return BatchResult(status=status.HTTP_409_CONFLICT, detail=STALE_DETAIL)
+    if not collection["reorder"](current_user["id"], ids, datetime.now().isoformat(), at=at):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=collection["not_found"])
+    return BatchResult()
+
+async def _set_progress(mutation: BatchMutation, at: datetime, current_user: dict, created: Dict[int, str]) -> BatchResult:
+    progress_data = RoutineProgressCreate(**mutation.data)
+    routine_id = _resolve(progress_data.routineId, created)
+    user_id = current_user["id"]
+    if store.get_routine(user_id, routine_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="루틴을 찾을 수 없습니다")
+    routine_progress.parse_date(progress_data.date)
+
+    now = datetime.now().isoformat()
+    progress = store.get_progress(user_id, routine_id, progress_data.date)
+    if progress is None:
+        progress = store.add_progress({
+            "id": new_id(),
+            "userId": user_id,
+            "routineId": routine_id,
+            "date": progress_data.date,
+            "isCompleted": progress_data.isCompleted,
+            "createdAt": now,
+            "updatedAt": now
+        })
+        store.reset_clock(user_id, "routine_progress", progress, at)
+    elif store.stale_fields(user_id, "routine_progress", progress, ["isCompleted"], at):
+        return BatchResult(
+            status=status.HTTP_409_CONFLICT, id=progress["id"], detail=STALE_DETAIL, ignoredFields=["isCompleted"]
+        )
+    elif progress["isCompleted"] != progress_data.isCompleted:
+        progress = store.update_progress(
+            user_id, routine_id, progress_data.date,
+            {"isCompleted": progress_data.isCompleted, "updatedAt": now}, at=at
+        )
+    return BatchResult(id=progress["id"], data=progress)
+
+_HANDLERS = {
+    ("routines", "create"): _create,
+    ("routines", "update"): _update,
+    ("routines", "delete"): _delete,
+    ("routines", "reorder"): _reorder,
+    ("activities", "create"): _create,
+    ("activities", "update"): _update,
+    ("activities", "delete"): _delete,
+    ("activities", "reorder"): _reorder,
+    ("routine_progress", "set"): _set_progress,
+    ("day_sessions", "create"): _create,
+    ("day_sessions", "update"): _update,
+    ("day_sessions", "delete"): _delete,
+}
+
+def _validation_detail(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+@router.post("", response_model=BatchResponse)
+async def apply_batch(batch_data: BatchRequest, current_user: dict = Depends(get_current_user)):
+    """
+    여러 변경을 순서대로 한 번에 적용
+
+    **Endpoint:** `POST /batch`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}, Content-Type: application/json
+    **Parameters:**
+    ```json
+    {
+        "mutations": [
+            {"kind": "routines", "op": "create", "data": {"timeAction": "07:00", "routineText": "물 마시기"}, "clientTimestamp": "2025-09-12T07:00:00Z"},
+            {"kind": "routine_progress", "op": "set", "data": {"routineId": "$0", "date": "2025-09-12", "isCompleted": true}, "clientTimestamp": "2025-09-12T07:01:00Z"},
+            {"kind": "day_sessions", "op": "update", "id": "01J...", "data": {"status": "finished"}, "clientTimestamp": "2025-09-12T08:00:00Z"}
+        ]
+    }
+    ```
+
+    한 항목이 실패해도 나머지는 계속 적용하고, 항목별 결과(status)를 같은 순서로 돌려준다.
+    """
+    results = []
+    created: Dict[int, str] = {}  # 배치 안 위치 → create로 만든 ID
+    async with store.batch_async(current_user["id"]):
+        for index, mutation in enumerate(batch_data.mutations):
+            handler = _HANDLERS.get((mutation.kind, mutation.op))
+            try:
+                if handler is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"지원하지 않는 작업입니다: {mutation.kind} {mutation.op}"
+                    )
+                result = await handler(mutation, to_clock(mutation.clientTimestamp), current_user, created)
+            except HTTPException as e:
+                result = BatchResult(status=e.status_code, id=mutation.id, detail=str(e.detail))
+            except ValidationError as e:
+                result = BatchResult(
+                    status=422, id=mutation.id, detail=_validation_detail(e)
+                )
+            except Exception as e:
+                # 예상하지 못한 오류도 항목 결과로 돌려준다 (앞선 항목들은 이미 적용되었으므로 배치를 실패시키지 않음)
+                result = BatchResult(
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR, id=mutation.id, detail=f"변경 적용 실패: {str(e)}"
+                )
+            result.index = index
+            if mutation.op == "create" and result.status == status.HTTP_200_OK:
+                created[index] = result.id
+            results.append(result)
+
+    return BatchResponse(results=results)
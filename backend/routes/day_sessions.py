@@ -2,10 +2,9 @@
 데이 세션 관리 API 라우터
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
-from datetime import datetime
-import uuid
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from typing import Iterable, List, Optional
+from datetime import datetime, timezone
 
 import sys
 import os
@@ -13,30 +12,162 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.day_session import (
     DaySession, DaySessionCreate, DaySessionUpdate, 
-    DayRecord, DayRecordUpdate
+    DayRecord, DayRecordRange, DayRecordUpdate, DaySessionStats,
+    DaySessionTransition, DaySessionTransitionResult
 )
 from utils.auth import get_current_user
+from utils.database import store
+from utils.etag import not_modified
+from utils.ids import new_id
+from utils.responses import trusted_json
+from utils.session_aggregates import aggregate_sessions
+from utils.session_intervals import parse_time, session_interval
+from utils.session_transitions import TRANSITIONS, current_set_number, follow_up_session, session_changes
 
 router = APIRouter(prefix="/api/day-sessions", tags=["day-sessions"])
 
-# 메모리 저장소 (실제 운영에서는 데이터베이스 사용)
-day_sessions_db: List[DaySession] = []
+MAX_STATS_DAYS = 366  # /stats 한 번에 집계 가능한 최대 일수
+
+def _validate_date(value: str, name: str):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} 날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)")
+
+def ensure_no_overlap(user_id: str, start_time: Optional[str], end_time: Optional[str], exclude_ids: Iterable[str] = ()):
+    """종료된 세션 구간이 다른 세션과 겹치면 409 (시작/종료 시각이 없거나 ISO 형식이 아니면 검사하지 않음)"""
+    interval = session_interval(start_time, end_time)
+    if interval is None:
+        return
+    excluded = set(exclude_ids)
+    for other in store.find_day_sessions_overlapping(user_id, *interval):
+        if other.id not in excluded:
+            raise HTTPException(status_code=409, detail=f"다른 세션과 시간이 겹칩니다 (세션 {other.id})")
+
+@router.get("", response_model=DayRecordRange)
+async def get_day_sessions_range(
+    request: Request,
+    response: Response,
+    from_date: str = Query(..., alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    to_date: str = Query(..., alias="to", description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    limit: int = Query(31, ge=1, le=366, description="한 페이지에 포함할 최대 날짜 수"),
+    current_user: dict = Depends(get_current_user)
+):
+    """기간 내 데이 세션들을 날짜별로 묶어서 조회 (세션이 있는 날짜만, 커서 페이지네이션)"""
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "day_sessions"))
+    if cached:
+        return cached
+    
+    _validate_date(from_date, "from")
+    _validate_date(to_date, "to")
+    if cursor is not None:
+        _validate_date(cursor, "cursor")
+    
+    # 날짜 인덱스에서 구간만 잘라낸 뒤 필요한 날짜의 버킷만 읽는다
+    start = max(from_date, cursor) if cursor else from_date
+    dates = store.list_day_session_dates(current_user["id"], start, to_date)
+    page, rest = dates[:limit], dates[limit:]
+    
+    # 저장소의 세션은 저장할 때 검증되었으므로 모델을 거치지 않고 바로 직렬화한다
+    records = [
+        {"date": date, "sessions": [session.to_dict() for session in store.list_day_sessions(current_user["id"], date)]}
+        for date in page
+    ]
+    
+    return trusted_json({
+        "startDate": from_date,
+        "endDate": to_date,
+        "records": records,
+        "nextCursor": rest[0] if rest else None
+    }, response)
+
+@router.get("/stats", response_model=DaySessionStats)
+async def get_day_session_stats(
+    request: Request,
+    response: Response,
+    from_date: str = Query(..., alias="from", description="시작 날짜 (YYYY-MM-DD)"),
+    to_date: str = Query(..., alias="to", description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    current_user: dict = Depends(get_current_user)
+):
+    """기간 내 집중 시간, 휴식 시간, 세트 수, 활동별 시간 집계"""
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "day_sessions"))
+    if cached:
+        return cached
+    
+    _validate_date(from_date, "from")
+    _validate_date(to_date, "to")
+    span = (datetime.strptime(to_date, "%Y-%m-%d") - datetime.strptime(from_date, "%Y-%m-%d")).days + 1
+    if span < 1 or span > MAX_STATS_DAYS:
+        raise HTTPException(status_code=400, detail=f"조회 기간은 1~{MAX_STATS_DAYS}일이어야 합니다")
+    
+    sessions = store.list_day_sessions_range(current_user["id"], from_date, to_date)
+    
+    return DaySessionStats(startDate=from_date, endDate=to_date, **aggregate_sessions(sessions))
+
+@router.get("/active", response_model=Optional[DaySession])
+async def get_active_day_session(
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user)
+):
+    """진행 중인 세션 조회 (끝나지 않은 세션 중 마지막으로 기록된 것, 없으면 null)"""
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "day_sessions"))
+    if cached:
+        return cached
+    
+    session = store.get_active_day_session(current_user["id"])
+    if session is None:
+        return trusted_json(None, response)
+    return trusted_json(session.to_dict(), response)
+
+@router.get("/at", response_model=List[DaySession])
+async def get_day_sessions_at(
+    request: Request,
+    response: Response,
+    time: str = Query(..., description="조회 시각 (ISO 형식)"),
+    until: Optional[str] = Query(None, description="구간 조회 종료 시각 (ISO 형식, 포함하지 않음)"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    특정 시각(또는 구간)에 진행되던 세션 조회
+    
+    **Endpoint:** `GET /api/day-sessions/at?time=2025-09-12T05:30:00Z&until=2025-09-12T06:00:00Z`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}
+    **Parameters:** time (query): 조회 시각, until (query, 선택): 있으면 [time, until) 구간과 겹치는 세션
+    
+    아직 끝나지 않은 세션은 조회 시각 이전에 시작했으면 포함한다.
+    """
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "day_sessions"))
+    if cached:
+        return cached
+    
+    start = parse_time(time)
+    end = parse_time(until) if until is not None else start
+    if start is None or end is None:
+        raise HTTPException(status_code=400, detail="시각 형식이 올바르지 않습니다 (ISO 형식)")
+    if end < start:
+        raise HTTPException(status_code=400, detail="until은 time보다 늦어야 합니다")
+    
+    sessions = store.find_day_sessions_overlapping(current_user["id"], start, end, include_open=True)
+    return trusted_json([session.to_dict() for session in sessions], response)
 
 @router.get("/{date}", response_model=DayRecord)
 async def get_day_sessions(
     date: str,
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user)
 ):
     """특정 날짜의 데이 세션들을 조회"""
-    user_sessions = [
-        session for session in day_sessions_db
-        if session.user_id == current_user["id"] and session.date == date
-    ]
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "day_sessions"))
+    if cached:
+        return cached
     
-    # 시작 시간순으로 정렬
-    user_sessions.sort(key=lambda x: x.start_time)
+    # 시작 시간순으로 정렬된 세션들
+    user_sessions = store.list_day_sessions(current_user["id"], date)
     
-    return DayRecord(date=date, sessions=user_sessions)
+    return trusted_json({"date": date, "sessions": [session.to_dict() for session in user_sessions]}, response)
 
 @router.post("", response_model=DaySession)
 async def create_day_session(
@@ -44,8 +175,9 @@ async def create_day_session(
     current_user: dict = Depends(get_current_user)
 ):
     """새로운 데이 세션을 생성"""
+    ensure_no_overlap(current_user["id"], session_data.start_time, session_data.end_time)
     try:
-        session_id = str(uuid.uuid4())
+        session_id = new_id()
         
         # 현재 시간 설정
         now = datetime.now()
@@ -61,8 +193,7 @@ async def create_day_session(
         
         new_session = DaySession(**session_dict)
         
-        day_sessions_db.append(new_session)
-        return new_session
+        return store.add_day_session(new_session).to_model()
     except Exception as e:
         print(f"세션 생성 중 오류: {e}")
         raise HTTPException(status_code=500, detail=f"세션 생성 실패: {str(e)}")
@@ -74,26 +205,23 @@ async def update_day_session(
     current_user: dict = Depends(get_current_user)
 ):
     """데이 세션을 업데이트"""
-    # 세션 찾기
-    session_index = None
-    for i, session in enumerate(day_sessions_db):
-        if session.id == session_id and session.user_id == current_user["id"]:
-            session_index = i
-            break
-    
-    if session_index is None:
-        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
-    
-    # 세션 업데이트
-    current_session = day_sessions_db[session_index]
     update_data = session_data.model_dump(exclude_unset=True)
+    update_data["updated_at"] = datetime.now()
     
-    for field, value in update_data.items():
-        setattr(current_session, field, value)
+    current_session = store.get_day_session(current_user["id"], session_id)
+    if current_session is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+    ensure_no_overlap(
+        current_user["id"],
+        update_data.get("start_time", current_session.start_time),
+        update_data.get("end_time", current_session.end_time),
+        exclude_ids=[session_id]
+    )
     
-    current_session.updated_at = datetime.now()
+    # 세션 찾아서 업데이트
+    current_session = store.update_day_session(current_user["id"], session_id, update_data)
     
-    return current_session
+    return current_session.to_model()
 
 @router.delete("/{session_id}")
 async def delete_day_session(
@@ -101,20 +229,70 @@ async def delete_day_session(
     current_user: dict = Depends(get_current_user)
 ):
     """데이 세션을 삭제"""
-    # 세션 찾기
-    session_index = None
-    for i, session in enumerate(day_sessions_db):
-        if session.id == session_id and session.user_id == current_user["id"]:
-            session_index = i
-            break
-    
-    if session_index is None:
+    deleted_session = store.delete_day_session(current_user["id"], session_id)
+    
+    if deleted_session is None:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
     
-    # 세션 삭제
-    deleted_session = day_sessions_db.pop(session_index)
     return {"message": "세션이 삭제되었습니다", "deleted_session_id": deleted_session.id}
 
+@router.post("/{session_id}/transition", response_model=DaySessionTransitionResult)
+async def transition_day_session(
+    session_id: str,
+    transition_data: DaySessionTransition,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    타이머 상태 전이 (현재 세션 마감 + 이어지는 세션 생성을 한 번에)
+    
+    **Endpoint:** `POST /api/day-sessions/{session_id}/transition`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}, Content-Type: application/json
+    **Parameters:**
+    ```json
+    {
+        "event": "rest",
+        "at": "2025-09-12T07:30:00.000Z"
+    }
+    ```
+    
+    현재 상태에서 할 수 없는 전이면 409를 돌려준다.
+    """
+    user_id = current_user["id"]
+    transition = TRANSITIONS[transition_data.event]
+    at = transition_data.at or datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    now = datetime.now()
+    
+    # 두 변경이 다른 요청과 섞이지 않고 한 번에 커밋되도록 사용자 잠금 안에서 적용
+    async with store.batch_async(user_id):
+        session = store.get_day_session(user_id, session_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+        if session.status not in transition.sources:
+            raise HTTPException(
+                status_code=409,
+                detail=f"'{session.status}' 상태의 세션에는 '{transition_data.event}'를 적용할 수 없습니다"
+            )
+        
+        set_number = current_set_number(session, store.list_day_sessions(user_id, session.date))
+        follow_up = follow_up_session(transition, session, set_number, at, transition_data.action)
+        changes = session_changes(session, transition, at, transition_data.action)
+        ensure_no_overlap(
+            user_id, changes.get("start_time", session.start_time), changes.get("end_time", session.end_time),
+            exclude_ids=[session_id]
+        )
+        changes["updated_at"] = now
+        session = store.update_day_session(user_id, session_id, changes)
+        
+        next_session = None
+        if follow_up is not None:
+            next_session = store.add_day_session(DaySession(
+                id=new_id(), user_id=user_id, created_at=now, updated_at=now, **follow_up
+            ))
+    
+    return DaySessionTransitionResult(
+        session=session.to_model(), next=next_session.to_model() if next_session is not None else None
+    )
+
 @router.put("/bulk/{date}", response_model=DayRecord)
 async def update_day_record(
     date: str,
@@ -124,25 +302,31 @@ async def update_day_record(
     """하루 전체 세션을 한번에 업데이트 (프론트엔드 onSessionsUpdate 지원)"""
     user_id = current_user["id"]
     
-    # 기존 해당 날짜 세션들 제거
-    day_sessions_db[:] = [
-        session for session in day_sessions_db
-        if not (session.user_id == user_id and session.date == date)
-    ]
+    # 새 세션들끼리, 그리고 다른 날짜의 세션과 겹치지 않는지 확인 (해당 날짜의 기존 세션은 교체되므로 제외)
+    replaced_ids = [session.id for session in store.list_day_sessions(user_id, date)]
+    intervals = sorted(
+        interval for interval in (
+            session_interval(session_data.start_time, session_data.end_time) for session_data in record_data.sessions
+        ) if interval is not None
+    )
+    for previous, current in zip(intervals, intervals[1:]):
+        if current[0] < previous[1]:
+            raise HTTPException(status_code=409, detail="요청한 세션들끼리 시간이 겹칩니다")
+    for session_data in record_data.sessions:
+        ensure_no_overlap(user_id, session_data.start_time, session_data.end_time, exclude_ids=replaced_ids)
     
-    # 새 세션들 추가
+    # 새 세션들 생성
     new_sessions = []
     for session_data in record_data.sessions:
-        session_id = str(uuid.uuid4())
+        session_id = new_id()
         new_session = DaySession(
             id=session_id,
             user_id=user_id,
             **session_data.model_dump()
         )
         new_sessions.append(new_session)
-        day_sessions_db.append(new_session)
     
-    # 시작 시간순으로 정렬
-    new_sessions.sort(key=lambda x: x.start_time)
+    # 기존 해당 날짜 세션들을 새 세션들로 교체 (시작 시간순으로 정렬되어 반환)
+    new_sessions = store.replace_day_sessions(user_id, date, new_sessions)
     
-    return DayRecord(date=date, sessions=new_sessions)
+    return DayRecord(date=date, sessions=[session.to_model() for session in new_sessions])
@@ -0,0 +1,161 @@
+"""
+실시간 이벤트 라우터 (WebSocket, SSE)
+
+저장소에 변경이 기록될 때마다 같은 사용자의 연결로 /sync 응답과 같은 형태의 이벤트를 보낸다.
+    {"cursor": "...", "reset": false, "changes": [SyncChange, ...]}
+브라우저의 WebSocket/EventSource는 Authorization 헤더를 붙일 수 없으므로 토큰은 token 쿼리로도 받는다.
+since(SSE는 Last-Event-ID도 가능)를 보내면 그 커서 이후의 변경을 먼저 보내고 이어서 실시간 이벤트를 보낸다.
+"""
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
+
+import asyncio
+import orjson
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routes.sync import to_change
+from utils.auth import resolve_token
+from utils.database import store
+from utils.events import Event, Subscription, bus
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+SSE_PING_SECONDS = int(os.getenv("SSE_PING_SECONDS", "15"))  # 프록시가 연결을 끊지 않도록 보내는 주석 간격
+WS_CLOSE_TRY_AGAIN_LATER = 1013  # 너무 느려서 끊은 연결 (다시 연결하면 since로 따라잡음)
+
+def _changes_event(cursor: str, reset: bool, changes) -> Event:
+    return cursor, orjson.dumps({"cursor": cursor, "reset": reset, "changes": changes})
+
+def _publish_changes(user_id: str, log_id: str, entries):
+    """저장소 변경 기록 → 이벤트 (구독 중인 연결이 있을 때만 만든다)"""
+    if not bus.has_subscribers(user_id):
+        return
+    cursor = f"{log_id}.{entries[-1][0]}"
+    bus.publish(user_id, _changes_event(
+        cursor, False, [to_change(kind, record_id, record) for _, kind, record_id, record in entries]
+    ))
+
+store.add_change_listener(_publish_changes)
+
+def _authenticate(authorization: Optional[str], token: Optional[str]) -> Optional[dict]:
+    scheme, _, header_token = (authorization or "").partition(" ")
+    if scheme.lower() == "bearer" and header_token:
+        token = header_token
+    return resolve_token(token) if token else None
+
+def _catch_up(user_id: str, since: Optional[str]) -> Optional[Event]:
+    """since 이후의 변경 (since가 없으면 보낼 것 없음)"""
+    if not since:
+        return None
+    changes, cursor, reset = store.sync_changes(user_id, since)
+    return _changes_event(cursor, reset, [to_change(kind, record_id, record) for kind, record_id, record in changes])
+
+def _sse_frame(event: Event) -> bytes:
+    cursor, body = event
+    return b"id: " + cursor.encode() + b"\nevent: changes\ndata: " + body + b"\n\n"
+
+@router.websocket("/ws")
+async def events_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None, description="JWT 토큰"),
+    since: Optional[str] = Query(None, description="마지막으로 받은 cursor")
+):
+    """
+    변경 이벤트 WebSocket
+
+    **Endpoint:** `WS /events/ws?token={JWT_TOKEN}&since={cursor}`
+
+    서버가 보내기만 하며, 이벤트를 제때 받지 못하면 1013으로 연결을 닫는다.
+    """
+    user = _authenticate(websocket.headers.get("authorization"), token)
+    if user is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="인증 토큰이 유효하지 않습니다")
+        return
+    await websocket.accept()
+
+    # 따라잡기 전에 구독해야 그 사이의 변경을 놓치지 않는다 (중복은 같은 레코드 덮어쓰기라 무해)
+    subscription = bus.subscribe(user["id"])
+    try:
+        event = _catch_up(user["id"], since)
+        if event is not None:
+            await websocket.send_text(event[1].decode())
+        await _pump_websocket(websocket, subscription)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        bus.unsubscribe(subscription)
+
+async def _pump_websocket(websocket: WebSocket, subscription: Subscription):
+    async def send_events():
+        while True:
+            event = await subscription.get()
+            if event is None:
+                await websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER, reason="이벤트를 제때 받지 못했습니다")
+                return
+            await websocket.send_text(event[1].decode())
+
+    async def wait_disconnect():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+    tasks = {asyncio.create_task(send_events()), asyncio.create_task(wait_disconnect())}
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+@router.get("/stream")
+async def events_stream(
+    request: Request,
+    token: Optional[str] = Query(None, description="JWT 토큰 (Authorization 헤더를 쓸 수 없을 때)"),
+    since: Optional[str] = Query(None, description="마지막으로 받은 cursor")
+):
+    """
+    변경 이벤트 스트림 (Server-Sent Events, WebSocket을 쓸 수 없을 때)
+
+    **Endpoint:** `GET /events/stream?token={JWT_TOKEN}&since={cursor}`
+    **Headers:** Authorization: Bearer {JWT_TOKEN} (또는 token 쿼리), Last-Event-ID (선택, since 대신)
+
+    이벤트를 제때 받지 못하면 스트림을 끝낸다. EventSource가 Last-Event-ID로 다시 연결하면 이어서 받는다.
+    """
+    user = _authenticate(request.headers.get("authorization"), token)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 토큰이 유효하지 않습니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    since = since or request.headers.get("last-event-id")
+
+    async def stream():
+        subscription = bus.subscribe(user["id"])
+        try:
+            event = _catch_up(user["id"], since)
+            if event is not None:
+                yield _sse_frame(event)
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), SSE_PING_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+                if event is None:
+                    return
+                yield _sse_frame(event)
+        finally:
+            bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
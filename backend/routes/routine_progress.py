@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from datetime import datetime, timedelta
-from typing import List, Optional
+import re
+from typing import List, Optional, Tuple
 import sys
 import os
 
@@ -10,16 +11,36 @@ from models.routine_progress import (
     RoutineProgressCreate, 
     RoutineProgressResponse, 
     RoutineProgressToggle,
+    RoutineProgressBulkSet,
+    RoutineWithProgress,
     DailyRoutineProgress,
-    WeeklyRoutineProgress
+    WeeklyRoutineProgress,
+    RangeRoutineProgress,
+    RoutineCompletionRate,
+    RoutineProgressStats,
+    RoutineYearSummary,
+    RoutineHeatmap
 )
 from utils.auth import get_current_user
-from utils.database import routine_progress_db, routines_db
+from utils.database import store
+from utils.etag import not_modified
+from utils.ids import new_id
+from utils.projection import fields_query, parse_fields
+from utils.responses import trusted_json
+from utils.progress_stats import to_ordinal
+from utils.progress_bitmaps import days_in_year, longest_run, run_ending_at, set_bit_indexes
 
 router = APIRouter(prefix="/routine-progress", tags=["routine-progress"])
 
+MAX_RANGE_DAYS = 366  # /range 한 번에 조회 가능한 최대 일수
+
+# strptime은 2025-9-1처럼 0을 채우지 않은 날짜도 받지만 집계(date.fromisoformat)는 거부하므로 형식을 먼저 확인
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 @router.get("", response_model=List[RoutineProgressResponse])
 async def get_routine_progress(
+    request: Request,
+    response: Response,
     date: str = Query(..., description="날짜 (YYYY-MM-DD 형식)"),
     current_user: dict = Depends(get_current_user)
 ):
@@ -30,11 +51,11 @@ async def get_routine_progress(
     **Headers:** Authorization: Bearer {JWT_TOKEN}
     **Parameters:** date (query): YYYY-MM-DD 형식의 날짜
     """
-    user_progress = [
-        p for p in routine_progress_db 
-        if p["userId"] == current_user["id"] and p["date"] == date
-    ]
-    return user_progress
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "routine_progress"))
+    if cached:
+        return cached
+    
+    return trusted_json(store.list_progress(current_user["id"], date), response)
 
 @router.post("", response_model=RoutineProgressResponse)
 async def toggle_routine_progress(
@@ -55,10 +76,7 @@ async def toggle_routine_progress(
     ```
     """
     # 해당 루틴이 사용자의 것인지 확인
-    routine = next(
-        (r for r in routines_db if r["id"] == progress_data.routineId and r["userId"] == current_user["id"]), 
-        None
-    )
+    routine = store.get_routine(current_user["id"], progress_data.routineId)
     
     if not routine:
         raise HTTPException(
@@ -66,24 +84,22 @@ async def toggle_routine_progress(
             detail="루틴을 찾을 수 없습니다"
         )
     
+    # 집계가 날짜 서수로 인덱싱하므로 저장하기 전에 날짜 형식 확인
+    parse_date(progress_data.date)
+    
     # 기존 진행률 찾기
-    existing_progress = next(
-        (p for p in routine_progress_db 
-         if p["userId"] == current_user["id"] 
-         and p["routineId"] == progress_data.routineId 
-         and p["date"] == progress_data.date), 
-        None
-    )
+    existing_progress = store.get_progress(current_user["id"], progress_data.routineId, progress_data.date)
     
     if existing_progress:
         # 기존 상태 토글
-        existing_progress["isCompleted"] = not existing_progress["isCompleted"]
-        existing_progress["updatedAt"] = datetime.now().isoformat()
-        return existing_progress
+        return store.update_progress(
+            current_user["id"], progress_data.routineId, progress_data.date,
+            {"isCompleted": not existing_progress["isCompleted"], "updatedAt": datetime.now().isoformat()}
+        )
     else:
         # 새로운 진행률 생성 (기본값: 완료 상태로 설정)
         new_progress = {
-            "id": str(len(routine_progress_db) + 1),
+            "id": new_id(),
             "userId": current_user["id"],
             "routineId": progress_data.routineId,
             "date": progress_data.date,
@@ -92,52 +108,152 @@ async def toggle_routine_progress(
             "updatedAt": datetime.now().isoformat()
         }
         
-        routine_progress_db.append(new_progress)
-        return new_progress
+        return store.add_progress(new_progress)
 
-@router.get("/daily", response_model=DailyRoutineProgress)
-async def get_daily_routine_progress(
-    date: str = Query(..., description="날짜 (YYYY-MM-DD 형식)"),
+@router.put("/bulk", response_model=List[RoutineProgressResponse])
+async def set_routine_progress_bulk(
+    bulk_data: RoutineProgressBulkSet,
     current_user: dict = Depends(get_current_user)
 ):
     """
-    특정 날짜의 루틴과 완료 상태를 함께 조회
+    여러 루틴/날짜의 완료 상태를 한 번에 설정 (오늘 전체 완료, 지난 기록 채우기 등)
     
-    **Endpoint:** `GET /routine-progress/daily?date=2025-09-12`
-    **Headers:** Authorization: Bearer {JWT_TOKEN}
-    **Parameters:** date (query): YYYY-MM-DD 형식의 날짜
+    **Endpoint:** `PUT /routine-progress/bulk`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}, Content-Type: application/json
+    **Parameters:**
+    ```json
+    {
+        "items": [
+            {"routineId": "1", "date": "2025-09-12", "isCompleted": true},
+            {"routineId": "2", "date": "2025-09-12", "isCompleted": false}
+        ]
+    }
+    ```
+    
+    토글이 아니라 지정한 상태로 설정하므로 같은 요청을 다시 보내도 결과가 같다.
     """
-    # 사용자의 모든 루틴 조회
-    user_routines = [r for r in routines_db if r["userId"] == current_user["id"]]
-    user_routines.sort(key=lambda x: x["orderIndex"])
+    user_id = current_user["id"]
     
-    # 해당 날짜의 진행률 조회
-    progress_map = {
-        p["routineId"]: p["isCompleted"] 
-        for p in routine_progress_db 
-        if p["userId"] == current_user["id"] and p["date"] == date
-    }
+    # 같은 (routineId, date)는 마지막 값만 사용
+    items = {(item.routineId, item.date): item for item in bulk_data.items}
     
-    # 루틴 정보와 완료 상태 결합
+    # 루틴 소유 여부는 루틴마다 한 번씩만 확인 (하나라도 아니면 아무것도 바꾸지 않음)
+    for routine_id in {routine_id for routine_id, _ in items}:
+        if store.get_routine(user_id, routine_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="루틴을 찾을 수 없습니다"
+            )
+    for date in {date for _, date in items}:
+        parse_date(date)
+    
+    now = datetime.now().isoformat()
+    records = [
+        {
+            "id": new_id(),
+            "userId": user_id,
+            "routineId": item.routineId,
+            "date": item.date,
+            "isCompleted": item.isCompleted,
+            "createdAt": now,
+            "updatedAt": now
+        }
+        for item in items.values()
+    ]
+    return store.set_progress_many(user_id, records, now)
+
+def _build_daily_progress(
+    date: str, user_routines: List[dict], progress_by_routine: dict, fields: Optional[Tuple[str, ...]] = None
+) -> dict:
+    """루틴 정보와 해당 날짜의 완료 상태 결합 (fields가 있으면 그 키만 만듦)"""
     routines_with_progress = []
     for routine in user_routines:
+        progress = progress_by_routine.get(routine["id"])
+        is_completed = progress["isCompleted"] if progress else False
+        if fields is not None:
+            routines_with_progress.append({
+                name: is_completed if name == "isCompleted" else routine.get(name) for name in fields
+            })
+            continue
         routine_with_progress = {
             "id": routine["id"],
             "timeAction": routine["timeAction"],
             "routineText": routine["routineText"],
             "emoji": routine["emoji"],
             "orderIndex": routine["orderIndex"],
-            "isCompleted": progress_map.get(routine["id"], False)
+            "isCompleted": is_completed
         }
         routines_with_progress.append(routine_with_progress)
     
-    return DailyRoutineProgress(
-        date=date,
-        routines=routines_with_progress
-    )
+    # DailyRoutineProgress 형태 (응답 모델로 다시 검증하지 않고 바로 직렬화)
+    return {
+        "date": date,
+        "routines": routines_with_progress
+    }
+
+def _build_range_progress(user_id: str, start_date: datetime, end_date: datetime) -> List[dict]:
+    """기간 내 일별 진행률 (루틴은 한 번만 조회하고 진행률은 날짜 인덱스로 한 번에 조회)"""
+    dates = []
+    current_date = start_date
+    while current_date <= end_date:
+        dates.append(current_date.strftime("%Y-%m-%d"))
+        current_date += timedelta(days=1)
+    
+    user_routines = store.list_routines(user_id)
+    progress_by_date = store.list_progress_range(user_id, dates)
+    
+    return [
+        _build_daily_progress(date_str, user_routines, progress_by_date.get(date_str, {}))
+        for date_str in dates
+    ]
+
+def parse_date(value: str) -> datetime:
+    """YYYY-MM-DD → datetime (0을 채운 형식만 허용, 아니면 400)"""
+    try:
+        if not _DATE_PATTERN.fullmatch(value):
+            raise ValueError(value)
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요."
+        )
+
+@router.get("/daily", response_model=DailyRoutineProgress)
+async def get_daily_routine_progress(
+    request: Request,
+    response: Response,
+    date: str = Query(..., description="날짜 (YYYY-MM-DD 형식)"),
+    fields: Optional[str] = fields_query(),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    특정 날짜의 루틴과 완료 상태를 함께 조회
+    
+    **Endpoint:** `GET /routine-progress/daily?date=2025-09-12&fields=id,routineText,emoji,isCompleted`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}
+    **Parameters:** date (query): YYYY-MM-DD 형식의 날짜, fields (query, 선택): 루틴 항목에 포함할 필드 (생략하면 전체)
+    """
+    selected = parse_fields(fields, RoutineWithProgress)
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "routines", "routine_progress"))
+    if cached:
+        return cached
+    
+    # 사용자의 모든 루틴 조회
+    user_routines = store.list_routines(current_user["id"])
+    
+    # 해당 날짜의 진행률 조회
+    progress_map = {
+        p["routineId"]: p
+        for p in store.list_progress(current_user["id"], date)
+    }
+    
+    return trusted_json(_build_daily_progress(date, user_routines, progress_map, selected), response)
 
 @router.get("/week", response_model=WeeklyRoutineProgress)
 async def get_weekly_routine_progress(
+    request: Request,
+    response: Response,
     startDate: str = Query(..., description="시작 날짜 (YYYY-MM-DD 형식)"),
     current_user: dict = Depends(get_current_user)
 ):
@@ -148,31 +264,157 @@ async def get_weekly_routine_progress(
     **Headers:** Authorization: Bearer {JWT_TOKEN}
     **Parameters:** startDate (query): 주의 시작 날짜 (YYYY-MM-DD)
     """
-    try:
-        start_date = datetime.strptime(startDate, "%Y-%m-%d")
-        end_date = start_date + timedelta(days=6)  # 7일간
-        
-        daily_progress_list = []
-        
-        # 7일간의 데이터 생성
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # 해당 날짜의 루틴 진행률 조회
-            daily_progress = await get_daily_routine_progress(date_str, current_user)
-            daily_progress_list.append(daily_progress)
-            
-            current_date += timedelta(days=1)
-        
-        return WeeklyRoutineProgress(
-            startDate=startDate,
-            endDate=end_date.strftime("%Y-%m-%d"),
-            dailyProgress=daily_progress_list
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "routines", "routine_progress"))
+    if cached:
+        return cached
+    
+    start_date = parse_date(startDate)
+    end_date = start_date + timedelta(days=6)  # 7일간
+    
+    return trusted_json({
+        "startDate": startDate,
+        "endDate": end_date.strftime("%Y-%m-%d"),
+        "dailyProgress": _build_range_progress(current_user["id"], start_date, end_date)
+    }, response)
+
+@router.get("/range", response_model=RangeRoutineProgress)
+async def get_range_routine_progress(
+    request: Request,
+    response: Response,
+    from_date: str = Query(..., alias="from", description="시작 날짜 (YYYY-MM-DD 형식)"),
+    to_date: str = Query(..., alias="to", description="종료 날짜 (YYYY-MM-DD 형식, 포함)"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    기간 루틴 완료 상태 조회 (월간/분기/연간 달력용, 최대 366일)
+    
+    **Endpoint:** `GET /routine-progress/range?from=2025-09-01&to=2025-09-30`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}
+    **Parameters:** from, to (query): YYYY-MM-DD 형식의 시작/종료 날짜
+    """
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "routines", "routine_progress"))
+    if cached:
+        return cached
+    
+    start_date = parse_date(from_date)
+    end_date = parse_date(to_date)
+    
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료 날짜가 시작 날짜보다 빠릅니다"
         )
-        
-    except ValueError:
+    if (end_date - start_date).days + 1 > MAX_RANGE_DAYS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요."
+            detail=f"조회 기간은 최대 {MAX_RANGE_DAYS}일입니다"
         )
+    
+    return trusted_json({
+        "startDate": from_date,
+        "endDate": to_date,
+        "dailyProgress": _build_range_progress(current_user["id"], start_date, end_date)
+    }, response)
+
+@router.get("/stats", response_model=RoutineProgressStats)
+async def get_routine_progress_stats(
+    request: Request,
+    response: Response,
+    date: Optional[str] = Query(None, description="기준 날짜 (YYYY-MM-DD 형식, 기본값: 오늘)"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    루틴 진행 통계 조회 (연속 완료 일수, 최고 기록, 완료율, 루틴별 완료율)
+    
+    **Endpoint:** `GET /routine-progress/stats?date=2025-09-12`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}
+    **Parameters:** date (query, 선택): 기준 날짜 (YYYY-MM-DD)
+    """
+    date = date or datetime.now().strftime("%Y-%m-%d")
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "routines", "routine_progress"), extra=date)
+    if cached:
+        return cached
+    
+    day = parse_date(date).toordinal()
+    
+    # 토글할 때마다 갱신되는 집계를 그대로 읽는다
+    stats = store.progress_stats(current_user["id"])
+    user_routines = store.list_routines(current_user["id"])
+    
+    total_routines = len(user_routines)
+    completed_routines = stats.completed_on(day)
+    
+    routine_rates = []
+    for routine in user_routines:
+        completed_days = stats.completed_by_routine.get(routine["id"], 0)
+        first_day = stats.first_day_by_routine.get(routine["id"], to_ordinal(routine["createdAt"][:10]))
+        total_days = max(day - first_day + 1, 0)
+        rate = min(completed_days / total_days * 100, 100) if total_days > 0 else 0
+        routine_rates.append(RoutineCompletionRate(
+            routineId=routine["id"],
+            routineText=routine["routineText"],
+            completedDays=completed_days,
+            totalDays=total_days,
+            completionRate=round(rate, 2)
+        ))
+    
+    completion_rate = completed_routines / total_routines * 100 if total_routines > 0 else 0
+    
+    return RoutineProgressStats(
+        date=date,
+        totalRoutines=total_routines,
+        completedRoutines=completed_routines,
+        completionRate=round(completion_rate, 2),
+        streak=stats.current_streak(day),
+        bestStreak=stats.best_streak(),
+        routineRates=routine_rates
+    )
+
+@router.get("/heatmap", response_model=RoutineHeatmap)
+async def get_routine_progress_heatmap(
+    request: Request,
+    response: Response,
+    year: int = Query(..., ge=1970, le=9999, description="연도 (예: 2025)"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    연간 루틴 완료 히트맵 및 루틴별 연속 기록 조회
+    
+    **Endpoint:** `GET /routine-progress/heatmap?year=2025`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}
+    **Parameters:** year (query): 연도
+    """
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "routines", "routine_progress"), extra=datetime.now().strftime("%Y-%m-%d"))
+    if cached:
+        return cached
+    
+    bitmaps = store.progress_bitmaps(current_user["id"])
+    user_routines = store.list_routines(current_user["id"])
+    
+    total_days = days_in_year(year)
+    today = datetime.now()
+    last_index = today.timetuple().tm_yday - 1 if today.year == year else total_days - 1
+    
+    days = [0] * total_days
+    perfect_bits = (1 << total_days) - 1 if user_routines else 0
+    routine_summaries = []
+    for routine in user_routines:
+        bits = bitmaps.year_bits(routine["id"], year)
+        for index in set_bit_indexes(bits):
+            days[index] += 1
+        perfect_bits &= bits  # 모든 루틴의 비트맵 AND = 모든 루틴을 완료한 날
+        routine_summaries.append(RoutineYearSummary(
+            routineId=routine["id"],
+            routineText=routine["routineText"],
+            completedDays=bits.bit_count(),
+            longestStreak=longest_run(bits),
+            currentStreak=run_ending_at(bits, last_index)
+        ))
+    
+    return RoutineHeatmap(
+        year=year,
+        days=days,
+        perfectDays=perfect_bits.bit_count(),
+        longestPerfectStreak=longest_run(perfect_bits),
+        routines=routine_summaries
+    )
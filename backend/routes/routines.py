@@ -8,33 +8,45 @@
 
 
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, status, Request, Response
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models.routine import RoutineCreate, RoutineUpdate, RoutineResponse, RoutineReorder
+from models.routine import RoutineCreate, RoutineUpdate, RoutineResponse, RoutinePartialResponse, RoutineReorder
 from utils.auth import get_current_user
-from utils.database import routines_db
+from utils.database import store
+from utils.etag import not_modified
+from utils.ids import new_id
+from utils.projection import fields_query, parse_fields, project
+from utils.responses import trusted_json
 
 router = APIRouter(prefix="/routines", tags=["routines"])
 
-@router.get("", response_model=List[RoutineResponse])
-async def get_routines(current_user: dict = Depends(get_current_user)):
+@router.get("", response_model=List[RoutinePartialResponse])
+async def get_routines(
+    request: Request,
+    response: Response,
+    fields: Optional[str] = fields_query(),
+    current_user: dict = Depends(get_current_user)
+):
     """
     사용자의 루틴 목록 조회 (순서대로 정렬)
     
-    **Endpoint:** `GET /routines`
+    **Endpoint:** `GET /routines?fields=id,routineText,emoji`
     **Headers:** Authorization: Bearer {JWT_TOKEN}
-    **Parameters:** 없음
+    **Parameters:** fields (query, 선택): 응답에 포함할 필드 (생략하면 전체)
     """
-    user_routines = [r for r in routines_db if r["userId"] == current_user["id"]]
-    # orderIndex 순으로 정렬
-    user_routines.sort(key=lambda x: x["orderIndex"])
-    return user_routines
+    selected = parse_fields(fields, RoutinePartialResponse)
+    cached = not_modified(request, response, store.collection_version(current_user["id"], "routines"))
+    if cached:
+        return cached
+    
+    # orderIndex 순으로 정렬된 사용자 루틴 (저장할 때 검증된 레코드라 그대로 직렬화)
+    return trusted_json(project(store.list_routines(current_user["id"]), selected), response)
 
 @router.post("", response_model=RoutineResponse)
 async def create_routine(routine_data: RoutineCreate, current_user: dict = Depends(get_current_user)):
@@ -53,14 +65,10 @@ async def create_routine(routine_data: RoutineCreate, current_user: dict = Depen
     ```
     """
     # 현재 사용자의 루틴 개수로 orderIndex 결정
-    user_routines_count = len([r for r in routines_db if r["userId"] == current_user["id"]])
-    
-    # 더 안전한 ID 생성 (기존 최대 ID + 1)
-    existing_ids = [int(r["id"]) for r in routines_db if r["id"].isdigit()]
-    next_id = max(existing_ids) + 1 if existing_ids else 1
+    user_routines_count = store.count_routines(current_user["id"])
     
     new_routine = {
-        "id": str(next_id),
+        "id": new_id(),
         "userId": current_user["id"],
         "timeAction": routine_data.timeAction,
         "routineText": routine_data.routineText,
@@ -70,8 +78,7 @@ async def create_routine(routine_data: RoutineCreate, current_user: dict = Depen
         "updatedAt": datetime.now().isoformat()
     }
     
-    routines_db.append(new_routine)
-    return new_routine
+    return store.add_routine(new_routine)
 
 @router.put("/reorder")
 async def reorder_routines(reorder_data: RoutineReorder, current_user: dict = Depends(get_current_user)):
@@ -90,34 +97,15 @@ async def reorder_routines(reorder_data: RoutineReorder, current_user: dict = De
     print(f"🔍 [REORDER DEBUG] 요청된 루틴 IDs: {reorder_data.routineIds}")
     print(f"🔍 [REORDER DEBUG] 현재 사용자 ID: {current_user['id']}")
     
-    user_routines = [r for r in routines_db if r["userId"] == current_user["id"]]
-    print(f"🔍 [REORDER DEBUG] 사용자 루틴 개수: {len(user_routines)}")
-    print(f"🔍 [REORDER DEBUG] 사용자 루틴 IDs: {[r['id'] for r in user_routines]}")
-    
-    # 제공된 ID들이 모두 사용자의 루틴인지 확인
-    user_routine_ids = {r["id"] for r in user_routines}
-    print(f"🔍 [REORDER DEBUG] 사용자 루틴 ID 집합: {user_routine_ids}")
-    
-    missing_ids = [rid for rid in reorder_data.routineIds if rid not in user_routine_ids]
-    if missing_ids:
-        print(f"❌ [REORDER DEBUG] 찾을 수 없는 루틴 IDs: {missing_ids}")
+    # 제공된 ID들이 모두 사용자의 루틴인지 확인 후 한 번에 새 순서 적용
+    # (요청에 없는 루틴은 기존 순서대로 뒤에 배치)
+    if not store.reorder_routines(current_user["id"], reorder_data.routineIds, datetime.now().isoformat()):
+        print(f"❌ [REORDER DEBUG] 사용자 루틴이 아닌 ID 포함: {reorder_data.routineIds}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="루틴을 찾을 수 없습니다"
         )
-    
-    # 새로운 순서로 orderIndex 업데이트
-    for new_index, routine_id in enumerate(reorder_data.routineIds):
-        routine = next((r for r in routines_db if r["id"] == routine_id), None)
-        if routine is None:
-            print(f"❌ [REORDER DEBUG] 루틴 ID {routine_id}를 찾을 수 없음")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="루틴을 찾을 수 없습니다"
-            )
-        routine["orderIndex"] = new_index
-        routine["updatedAt"] = datetime.now().isoformat()
-        print(f"✅ [REORDER DEBUG] 루틴 ID {routine_id} → orderIndex {new_index}")
+    print(f"✅ [REORDER DEBUG] 새 순서 적용: {reorder_data.routineIds}")
     
     return {"message": "루틴 순서가 변경되었습니다"}
 
@@ -141,7 +129,7 @@ async def update_routine(
     }
     ```
     """
-    routine = next((r for r in routines_db if r["id"] == routine_id and r["userId"] == current_user["id"]), None)
+    routine = store.get_routine(current_user["id"], routine_id)
     
     if not routine:
         raise HTTPException(
@@ -150,15 +138,9 @@ async def update_routine(
         )
     
     # 업데이트할 필드만 수정
-    if routine_data.timeAction is not None:
-        routine["timeAction"] = routine_data.timeAction
-    if routine_data.routineText is not None:
-        routine["routineText"] = routine_data.routineText
-    if routine_data.emoji is not None:
-        routine["emoji"] = routine_data.emoji
-    
-    routine["updatedAt"] = datetime.now().isoformat()
-    return routine
+    changes = routine_data.model_dump(exclude_none=True)
+    changes["updatedAt"] = datetime.now().isoformat()
+    return store.update_routine(current_user["id"], routine_id, changes)
 
 @router.delete("/{routine_id}")
 async def delete_routine(routine_id: str, current_user: dict = Depends(get_current_user)):
@@ -169,22 +151,13 @@ async def delete_routine(routine_id: str, current_user: dict = Depends(get_curre
     **Headers:** Authorization: Bearer {JWT_TOKEN}
     **Parameters:** URL에 routine_id 직접 입력 (예: /routines/1)
     """
-    routine_index = next(
-        (i for i, r in enumerate(routines_db) if r["id"] == routine_id and r["userId"] == current_user["id"]), 
-        None
-    )
+    # 삭제 후 뒤에 있는 루틴들의 orderIndex는 저장소에서 재정렬
+    deleted_routine = store.delete_routine(current_user["id"], routine_id)
     
-    if routine_index is None:
+    if deleted_routine is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="루틴을 찾을 수 없습니다"
         )
     
-    deleted_routine = routines_db.pop(routine_index)
-    
-    # 삭제된 루틴보다 뒤에 있는 루틴들의 orderIndex 재정렬
-    for routine in routines_db:
-        if routine["userId"] == current_user["id"] and routine["orderIndex"] > deleted_routine["orderIndex"]:
-            routine["orderIndex"] -= 1
-    
     return {"message": "루틴이 삭제되었습니다", "deletedRoutine": deleted_routine}
@@ -0,0 +1,50 @@
+"""
+동기화 API 라우터
+
+앱이 다시 열릴 때 루틴/활동/진행률/데이 세션을 통째로 받지 않고
+마지막 커서 이후에 추가, 수정, 삭제된 레코드만 받아간다.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.sync import SyncResponse
+from utils.auth import get_current_user
+from utils.database import store
+from utils.responses import trusted_json
+from utils.session_records import SessionRecord
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+def to_change(kind: str, record_id: str, record) -> dict:
+    """SyncChange 형태의 dict (응답 모델로 다시 검증하지 않고 바로 직렬화)"""
+    if record is None:
+        return {"kind": kind, "id": record_id, "deleted": True, "data": None}
+    if isinstance(record, SessionRecord):
+        record = record.to_dict()
+    return {"kind": kind, "id": record_id, "deleted": False, "data": record}
+
+@router.get("", response_model=SyncResponse)
+async def sync_changes(
+    since: Optional[str] = Query(None, description="이전 응답의 cursor (없으면 전체 동기화)"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    커서 이후의 변경 조회
+    
+    **Endpoint:** `GET /sync?since={cursor}`
+    **Headers:** Authorization: Bearer {JWT_TOKEN}
+    **Parameters:** since (query, 선택): 이전 응답의 cursor
+    
+    커서가 없거나 너무 오래되어 변경 기록이 남아 있지 않으면 reset=true와 함께 전체 데이터를 돌려준다.
+    """
+    changes, cursor, reset = store.sync_changes(current_user["id"], since)
+    return trusted_json({
+        "cursor": cursor,
+        "reset": reset,
+        "changes": [to_change(kind, record_id, record) for kind, record_id, record in changes],
+    })
@@ -0,0 +1,103 @@
+"""
+SQLite 저장소 재시작 테스트
+
+저장소를 열어 데이터를 쓰고 닫은 뒤 같은 파일로 다시 열어서
+사용자, 루틴, 진행률, 데이 세션, 변경 기록이 그대로 읽히는지 확인한다.
+
+사용법: python sqlite_store_test.py
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.day_session import DaySession
+from utils.sqlite_store import SqliteStore
+
+
+def check(label, condition):
+    """검증 결과 출력"""
+    print(f"   {'✅' if condition else '❌'} {label}")
+    return condition
+
+
+def make_user(user_id: str, email: str) -> dict:
+    return {
+        "id": user_id, "email": email, "password": "hashed", "name": "사용자",
+        "provider": "email", "createdAt": "2025-09-13T00:00:00.000000"
+    }
+
+
+def write_data(path: str):
+    """첫 번째 실행: 데이터 쓰기"""
+    store = SqliteStore(path)
+    now = datetime.now().isoformat()
+
+    print("1️⃣ 데이터 쓰기")
+    check("사용자 추가", store.add_user(make_user("u1", "a@example.com")) is not None)
+    check("같은 이메일로 다시 추가하면 None", store.add_user(make_user("u2", "a@example.com")) is None)
+
+    for index, (routine_id, text) in enumerate([("r1", "물 마시기"), ("r2", "스트레칭")]):
+        store.add_routine({
+            "id": routine_id, "userId": "u1", "timeAction": "아침", "routineText": text, "emoji": None,
+            "orderIndex": index, "createdAt": now, "updatedAt": now
+        })
+    store.update_routine("u1", "r1", {"routineText": "물 두잔 마시기", "updatedAt": now})
+    store.reorder_routines("u1", ["r2", "r1"], now)
+    store.add_progress({
+        "id": "p1", "userId": "u1", "routineId": "r1", "date": "2025-09-14",
+        "isCompleted": True, "createdAt": now, "updatedAt": now
+    })
+    store.update_progress("u1", "r1", "2025-09-14", {"isCompleted": False, "updatedAt": now})
+    store.add_day_session(DaySession(
+        id="s1", user_id="u1", date="2025-09-14", start_time="2025-09-14T09:00:00",
+        end_time="2025-09-14T09:25:00", action="코딩", status="finished",
+        created_at=datetime.now(), updated_at=datetime.now()
+    ))
+    changes, cursor, _ = store.sync_changes("u1", None)
+    store.close()
+    print()
+    return cursor
+
+
+def read_data(path: str, cursor: str):
+    """두 번째 실행: 같은 파일로 다시 열어 확인"""
+    store = SqliteStore(path)
+
+    print("2️⃣ 다시 열어서 읽기")
+    user = store.find_user_by_email("a@example.com")
+    check("사용자는 처음 추가한 것 하나", user is not None and user["id"] == "u1" and store.get_user("u2") is None)
+    try:
+        # 다른 프로세스가 메모리 확인을 지나쳐 같은 이메일을 쓰는 경우
+        store._persist("users", [make_user("u3", "a@example.com")])
+        rejected = False
+    except sqlite3.IntegrityError:
+        rejected = True
+    check("같은 이메일 행은 기존 행을 지우지 않고 거부됨", rejected and store.get_user("u1") is not None)
+    routines = store.list_routines("u1")
+    check("루틴 순서와 수정 내용 유지", [(r["id"], r["routineText"]) for r in routines] == [("r2", "스트레칭"), ("r1", "물 두잔 마시기")])
+    progress = store.get_progress("u1", "r1", "2025-09-14")
+    check("진행률 수정 내용 유지", progress is not None and progress["isCompleted"] is False)
+    sessions = store.list_day_sessions("u1", "2025-09-14")
+    check("데이 세션 유지", [(s.id, s.action, s.end_time) for s in sessions] == [("s1", "코딩", "2025-09-14T09:25:00")])
+    changes, next_cursor, reset = store.sync_changes("u1", cursor)
+    check("이전 커서 이후 변경 없음", not reset and changes == [] and next_cursor == cursor)
+    store.close()
+    print()
+
+
+def main():
+    print("🧪 SQLite 저장소 재시작 테스트\n")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bluroutine.db")
+        cursor = write_data(path)
+        read_data(path, cursor)
+    print("✅ SQLite 저장소 재시작 테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
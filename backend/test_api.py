@@ -1,5 +1,7 @@
 import requests
 import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:3001"
 
@@ -43,6 +45,16 @@ def test_api():
         print(f"   Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
         print()
         
+        # 3-1. 같은 이메일로 동시에 회원가입 (하나만 성공해야 함)
+        print("   3-1. 같은 이메일 동시 회원가입 테스트")
+        race_data = {"email": f"race-{uuid.uuid4().hex[:8]}@example.com", "password": "password123", "name": "동시 가입"}
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            statuses = sorted(pool.map(
+                lambda _: requests.post(f"{BASE_URL}/auth/signup", json=race_data).status_code, range(3)
+            ))
+        print(f"   {'✅' if statuses == [200, 409, 409] else '❌'} 상태: {statuses}")
+        print()
+        
         # 4. 다시 기본 계정으로 로그인 (메인 테스트용)
         print("4️⃣ 기본 계정으로 재로그인")
         login_data = {
@@ -321,8 +333,104 @@ def test_api():
         print(f"   Response: {json.dumps(final_activities, indent=2, ensure_ascii=False)}")
         print(f"   📊 최종 활동 개수: {len(final_activities)}개")
         print()
-        
-        
+
+        # 9. 배치 API 테스트 (생성 → $0 참조 → 오래된 수정)
+        print("9️⃣ 배치 API 테스트")
+        batch_data = {
+            "mutations": [
+                {"kind": "routines", "op": "create", "data": {"timeAction": "아침", "routineText": "스트레칭", "emoji": "🤸"},
+                 "clientTimestamp": "2025-09-12T07:00:00Z"},
+                {"kind": "routine_progress", "op": "set", "data": {"routineId": "$0", "date": "2025-09-12", "isCompleted": True},
+                 "clientTimestamp": "2025-09-12T07:01:00Z"},
+                {"kind": "routines", "op": "update", "id": "$0", "data": {"routineText": "오래된 수정"},
+                 "clientTimestamp": "2025-09-12T06:00:00Z"},
+                {"kind": "routines", "op": "update", "id": "$0", "data": {"routineText": "스트레칭 10분"},
+                 "clientTimestamp": "2025-09-12T07:02:00Z"}
+            ]
+        }
+        response = requests.post(f"{BASE_URL}/batch", json=batch_data, headers=headers)
+        print(f"   Status: {response.status_code}")
+        results = response.json()["results"]
+        print(f"   Response: {json.dumps(results, indent=2, ensure_ascii=False)}")
+        statuses = [item["status"] for item in results]
+        print(f"   {'✅' if statuses == [200, 200, 409, 200] else '❌'} 항목별 상태: {statuses}")
+        batch_routine_id = results[0]["id"]
+        print(f"   {'✅' if results[1]['data']['routineId'] == batch_routine_id else '❌'} $0 참조가 생성된 루틴 ID로 바뀜")
+        print(f"   {'✅' if results[2]['ignoredFields'] == ['routineText'] else '❌'} 오래된 수정은 무시됨")
+        response = requests.get(f"{BASE_URL}/routines", headers=headers)
+        texts = [routine["routineText"] for routine in response.json() if routine["id"] == batch_routine_id]
+        print(f"   {'✅' if texts == ['스트레칭 10분'] else '❌'} 최종 루틴: {texts}")
+        requests.delete(f"{BASE_URL}/routines/{batch_routine_id}", headers=headers)
+        print()
+
+        # 10. 잘못된 날짜 테스트 (토글, 일괄 설정, 배치 모두 400이고 이후 통계 조회가 정상이어야 함)
+        print("🔟 잘못된 날짜 테스트")
+        for bad_date in ["not-a-date", "2025-9-1"]:
+            response = requests.post(f"{BASE_URL}/routine-progress", json={"routineId": "1", "date": bad_date}, headers=headers)
+            print(f"   {'✅' if response.status_code == 400 else '❌'} POST /routine-progress ({bad_date}): {response.status_code}")
+            response = requests.get(f"{BASE_URL}/routine-progress", params={"date": bad_date}, headers=headers)
+            print(f"   {'✅' if response.json() == [] else '❌'} 저장되지 않음: {response.json()}")
+        for bad_date in ["not-a-date", "2025-9-2"]:
+            bulk_data = {"items": [{"routineId": "1", "date": bad_date, "isCompleted": True}]}
+            response = requests.put(f"{BASE_URL}/routine-progress/bulk", json=bulk_data, headers=headers)
+            print(f"   {'✅' if response.status_code == 400 else '❌'} PUT /routine-progress/bulk ({bad_date}): {response.status_code}")
+            response = requests.get(f"{BASE_URL}/routine-progress", params={"date": bad_date}, headers=headers)
+            print(f"   {'✅' if response.json() == [] else '❌'} 저장되지 않음: {response.json()}")
+        for bad_date in ["not-a-date", "2025-9-3"]:
+            batch_data = {
+                "mutations": [
+                    {"kind": "routine_progress", "op": "set", "data": {"routineId": "1", "date": bad_date, "isCompleted": True},
+                     "clientTimestamp": "2025-09-12T07:00:00Z"}
+                ]
+            }
+            response = requests.post(f"{BASE_URL}/batch", json=batch_data, headers=headers)
+            item_status = response.json()["results"][0]["status"] if response.status_code == 200 else None
+            print(f"   {'✅' if item_status == 400 else '❌'} POST /batch ({bad_date}): {response.status_code} (항목 {item_status})")
+            response = requests.get(f"{BASE_URL}/routine-progress", params={"date": bad_date}, headers=headers)
+            print(f"   {'✅' if response.json() == [] else '❌'} 저장되지 않음: {response.json()}")
+        response = requests.get(f"{BASE_URL}/routine-progress/stats", params={"date": "2025-09-12"}, headers=headers)
+        print(f"   {'✅' if response.status_code == 200 else '❌'} GET /routine-progress/stats: {response.status_code}")
+        response = requests.get(f"{BASE_URL}/routine-progress/heatmap", params={"year": 2025}, headers=headers)
+        print(f"   {'✅' if response.status_code == 200 else '❌'} GET /routine-progress/heatmap: {response.status_code}")
+        print()
+
+        # 11. 응답 형식별 ETag (JSON ETag로 MessagePack 요청이 304를 받으면 안 됨)
+        print("1️⃣1️⃣ 응답 형식별 ETag 테스트")
+        response = requests.get(f"{BASE_URL}/routines", headers=headers)
+        json_etag = response.headers.get("etag")
+        print(f"   {'✅' if 'Accept' in response.headers.get('vary', '') else '❌'} JSON 응답 Vary: {response.headers.get('vary')}")
+        msgpack_headers = {**headers, "Accept": "application/msgpack"}
+        response = requests.get(f"{BASE_URL}/routines", headers={**msgpack_headers, "If-None-Match": json_etag})
+        print(f"   {'✅' if response.status_code == 200 else '❌'} JSON ETag로 MessagePack 요청: {response.status_code}")
+        response = requests.get(f"{BASE_URL}/routines", headers={**msgpack_headers, "If-None-Match": response.headers.get("etag")})
+        print(f"   {'✅' if response.status_code == 304 else '❌'} MessagePack ETag로 MessagePack 요청: {response.status_code}")
+        print()
+
+        # 12. Idempotency-Key (재전송, 다른 본문 재사용, 동시 중복 요청)
+        print("1️⃣2️⃣ Idempotency-Key 테스트")
+        routine_data = {"timeAction": "저녁", "routineText": "산책", "emoji": "🚶"}
+        key_headers = {**headers, "Idempotency-Key": f"test-{uuid.uuid4().hex}"}
+        first = requests.post(f"{BASE_URL}/routines", json=routine_data, headers=key_headers)
+        second = requests.post(f"{BASE_URL}/routines", json=routine_data, headers=key_headers)
+        print(f"   {'✅' if first.json()['id'] == second.json()['id'] else '❌'} 같은 키로 다시 보내면 같은 루틴")
+        print(f"   {'✅' if second.headers.get('idempotent-replayed') == 'true' else '❌'} Idempotent-Replayed: {second.headers.get('idempotent-replayed')}")
+        response = requests.post(f"{BASE_URL}/routines", json={**routine_data, "routineText": "달리기"}, headers=key_headers)
+        print(f"   {'✅' if response.status_code == 422 else '❌'} 같은 키로 다른 본문: {response.status_code}")
+        requests.delete(f"{BASE_URL}/routines/{first.json()['id']}", headers=headers)
+
+        count_before = len(requests.get(f"{BASE_URL}/routines", headers=headers).json())
+        key_headers = {**headers, "Idempotency-Key": f"test-{uuid.uuid4().hex}"}
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            ids = set(pool.map(
+                lambda _: requests.post(f"{BASE_URL}/routines", json=routine_data, headers=key_headers).json()["id"], range(3)
+            ))
+        count_after = len(requests.get(f"{BASE_URL}/routines", headers=headers).json())
+        print(f"   {'✅' if len(ids) == 1 and count_after == count_before + 1 else '❌'} 동시 중복 요청은 한 번만 생성 (루틴 {count_before} → {count_after})")
+        for routine_id in ids:
+            requests.delete(f"{BASE_URL}/routines/{routine_id}", headers=headers)
+        print()
+
+
     except requests.exceptions.ConnectionError:
         print("❌ 서버에 연결할 수 없습니다.")
         print("💡 서버가 실행 중인지 확인하세요: python main.py")
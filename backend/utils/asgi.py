@@ -0,0 +1,43 @@
+"""
+ASGI 미들웨어 공용 도우미 (요청 본문 읽기/되돌려 주기, 오류 응답)
+"""
+
+import orjson
+
+
+async def read_body(receive) -> bytes:
+    """요청 본문을 끝까지 읽는다"""
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def replay_receive(body: bytes, receive):
+    """이미 읽은 본문을 다시 한 번 돌려주는 receive (이후에는 원래 receive로 연결 종료 등을 받음)"""
+    sent = False
+
+    async def replay():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+async def send_error(send, status: int, detail: str):
+    """라우터의 HTTPException과 같은 형태({"detail": ...})의 JSON 오류 응답"""
+    body = orjson.dumps({"detail": detail})
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -2,9 +2,14 @@ from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
 import os
+import threading
+import time
 import sys
 from dotenv import load_dotenv
 
@@ -19,6 +24,9 @@ load_dotenv()
 SECRET_KEY = os.getenv("JWT_SECRET", "bluroutine_jwt_secret_key_2025")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_DAYS = 7
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))  # bcrypt 전용 스레드 수
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "16"))  # 대기 가능한 작업 수
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))  # 인증 결과 캐시 최대 토큰 수
 
 # 비밀번호 해싱
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -30,6 +38,34 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+# bcrypt는 한 번에 수백 ms가 걸리므로 이벤트 루프가 아닌 전용 스레드 풀에서 실행한다.
+# 실행 중 + 대기 중인 작업이 한도를 넘으면 큐에 쌓지 않고 바로 503으로 거절한다.
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+_password_jobs = 0  # 이벤트 루프 스레드에서만 변경됨
+
+async def _run_password_job(func, *args):
+    global _password_jobs
+    if _password_jobs >= PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": "1"},
+        )
+    _password_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_jobs -= 1
+
+async def verify_password_async(plain_password, hashed_password):
+    """verify_password를 비밀번호 전용 스레드 풀에서 실행"""
+    return await _run_password_job(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password):
+    """get_password_hash를 비밀번호 전용 스레드 풀에서 실행"""
+    return await _run_password_job(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -40,27 +76,75 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_user_by_email(email: str, users_db: list):
-    return next((user for user in users_db if user["email"] == email), None)
+def get_user_by_email(email: str):
+    from utils.database import store  # 순환 import 방지
+    return store.find_user_by_email(email)
+
+# 인증 결과 캐시: token → (userId, email, exp)
+# 토큰의 exp가 지나면 만료되고, 사용자 정보(이메일)가 바뀌거나 사라지면 무효화된다.
+_token_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_token_cache_lock = threading.Lock()  # get_current_user는 스레드 풀에서 실행됨
+
+def _cached_principal(token: str) -> Optional[dict]:
+    from utils.database import store  # 순환 import 방지
+
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is None:
+            return None
+        user_id, email, expire = entry
+        user = store.get_user(user_id)
+        if expire <= time.time() or user is None or user["email"] != email:
+            del _token_cache[token]
+            return None
+        _token_cache.move_to_end(token)
+        return user
+
+def _remember_principal(token: str, user: dict, expire: float):
+    with _token_cache_lock:
+        _token_cache[token] = (user["id"], user["email"], expire)
+        _token_cache.move_to_end(token)
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+def invalidate_token_cache(user_id: Optional[str] = None):
+    """사용자의 캐시된 인증 결과 삭제 (user_id가 없으면 전체 삭제)"""
+    with _token_cache_lock:
+        if user_id is None:
+            _token_cache.clear()
+            return
+        for token in [t for t, entry in _token_cache.items() if entry[0] == user_id]:
+            del _token_cache[token]
+
+def resolve_token(token: str) -> Optional[dict]:
+    """토큰의 사용자 (유효하지 않으면 None)"""
+    # 이미 검증한 토큰이면 디코딩과 사용자 조회 생략
+    user = _cached_principal(token)
+    if user is not None:
+        return user
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    from utils.database import users_db  # 순환 import 방지
-    
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="인증 토큰이 유효하지 않습니다",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
-        raise credentials_exception
+        return None
+    email: str = payload.get("sub")
+    expire = payload.get("exp")
+    if email is None or expire is None:
+        return None
+    token_data = TokenData(email=email)
     
-    user = get_user_by_email(email=token_data.email, users_db=users_db)
+    user = get_user_by_email(email=token_data.email)
+    if user is None:
+        return None
+    _remember_principal(token, user, expire)
+    return user
+
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    user = resolve_token(credentials.credentials)
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 토큰이 유효하지 않습니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
@@ -0,0 +1,67 @@
+"""
+사용자별 변경 기록 (동기화용)
+
+저장소의 모든 쓰기/삭제가 (순번, 컬렉션, id, 레코드) 항목으로 뒤에 덧붙여진다.
+삭제는 레코드 없이 기록되어 툼스톤 역할을 한다.
+클라이언트는 마지막으로 받은 순번 이후의 항목만 받아가므로, 앱이 다시 열릴 때
+전체 데이터를 내려받지 않고 바뀐 레코드만 받는다.
+"""
+
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+# (순번, 컬렉션, 레코드 id, 레코드 또는 삭제 시 None)
+ChangeEntry = Tuple[int, str, str, object]
+
+_entry_seq = itemgetter(0)
+
+
+class ChangeLog:
+    """한 사용자의 변경 기록 (순번 오름차순)"""
+
+    __slots__ = ("entries", "seq", "floor")
+
+    def __init__(self):
+        self.entries: List[ChangeEntry] = []
+        self.seq = 0  # 마지막으로 발급한 순번
+        self.floor = 0  # 이 순번 이하의 항목은 잘려 나감 (이보다 오래된 커서는 전체 동기화)
+
+    def append(self, kind: str, changes: List[Tuple[str, object]]) -> List[ChangeEntry]:
+        """(레코드 id, 레코드 또는 None) 목록을 기록하고 새 항목들을 반환"""
+        added = []
+        for record_id, record in changes:
+            self.seq += 1
+            added.append((self.seq, kind, record_id, record))
+        self.entries.extend(added)
+        return added
+
+    def restore(self, entry: ChangeEntry):
+        """영속 저장소에서 읽어온 항목 추가 (순번 순서로 호출)"""
+        if not self.entries:
+            self.floor = entry[0] - 1
+        self.entries.append(entry)
+        self.seq = entry[0]
+
+    def trim(self, limit: int) -> Optional[int]:
+        """항목이 limit을 넘으면 오래된 절반을 버리고 새 floor 반환 (버린 게 없으면 None)"""
+        if len(self.entries) <= limit:
+            return None
+        drop = len(self.entries) - limit // 2
+        self.floor = self.entries[drop - 1][0]
+        del self.entries[:drop]
+        return self.floor
+
+    def since(self, seq: int) -> Optional[List[ChangeEntry]]:
+        """seq 이후의 변경 (레코드마다 마지막 항목 하나만, 순번 순)
+
+        seq가 이미 잘려 나간 구간이거나 발급한 적 없는 순번이면 None.
+        """
+        if seq < self.floor or seq > self.seq:
+            return None
+        latest: Dict[Tuple[str, str], ChangeEntry] = {}
+        for entry in self.entries[bisect_right(self.entries, seq, key=_entry_seq):]:
+            key = (entry[1], entry[2])
+            latest.pop(key, None)  # 다시 넣어서 마지막 변경 순서로 옮긴다
+            latest[key] = entry
+        return list(latest.values())
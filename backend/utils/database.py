@@ -1,19 +1,46 @@
-# 메모리 내 저장소 (테스트용)
-users_db = []
-routines_db = []
-routine_progress_db = []  # 루틴 완료 상태 저장소
-activities_db = []  # 사용자 활동 저장소
+import os
+from dotenv import load_dotenv
+
+from utils.store import MemoryStore
+
+# 환경변수 로드
+load_dotenv()
+
+# 저장소 설정
+# STORAGE_ENGINE=memory : 메모리 저장소 (테스트용, 서버 재시작 시 초기화)
+# STORAGE_ENGINE=sqlite : SQLite 파일에 영속 저장 (WAL 모드)
+STORAGE_ENGINE = os.getenv("STORAGE_ENGINE", "memory")
+SQLITE_PATH = os.getenv("SQLITE_PATH", "bluroutine.db")
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "4"))
+# 사용자별로 보관하는 변경 기록 수 (/sync 커서가 이보다 오래되면 전체 동기화)
+CHANGE_LOG_LIMIT = int(os.getenv("CHANGE_LOG_LIMIT", "5000"))
+
+def create_store():
+    """설정된 엔진으로 저장소 생성"""
+    if STORAGE_ENGINE == "sqlite":
+        from utils.sqlite_store import SqliteStore
+        return SqliteStore(SQLITE_PATH, pool_size=SQLITE_POOL_SIZE, change_log_limit=CHANGE_LOG_LIMIT)
+    if STORAGE_ENGINE == "memory":
+        return MemoryStore(change_log_limit=CHANGE_LOG_LIMIT)
+    raise ValueError(f"알 수 없는 STORAGE_ENGINE: {STORAGE_ENGINE}")
+
+# 사용자, 루틴, 루틴 완료 상태, 활동, 데이 세션 저장소 (사용자별 파티션)
+store = create_store()
 
 # 테스트용 고정 데이터 초기화
 def init_test_data():
     """서버 시작 시 고정된 테스트 데이터 생성"""
-    from utils.auth import get_password_hash
+    from utils.auth import get_password_hash, invalidate_token_cache
     
-    # 데이터베이스 초기화 (항상 깨끗한 상태로 시작)
-    users_db.clear()
-    routines_db.clear()
-    routine_progress_db.clear()
-    activities_db.clear()
+    # 영속 저장소는 기존 데이터를 유지하고, 고정 데이터가 없을 때만 생성
+    if store.persistent:
+        if store.find_user_by_email("test@bluroutine.com"):
+            print("🎯 기존 데이터 유지 (고정 테스트 데이터 이미 존재)")
+            return
+    else:
+        # 메모리 저장소는 항상 깨끗한 상태로 시작
+        store.clear()
+        invalidate_token_cache()
     
     # 고정 테스트 사용자 (항상 동일)
     fixed_user = {
@@ -24,7 +51,7 @@ def init_test_data():
         "provider": "email",
         "createdAt": "2025-09-13T00:00:00.000000"
     }
-    users_db.append(fixed_user)
+    store.add_user(fixed_user)
     
     # 고정 테스트 루틴들 (ID와 내용 고정)
     fixed_routines = [
@@ -59,7 +86,8 @@ def init_test_data():
             "updatedAt": "2025-09-13T00:00:00.000000"
         }
     ]
-    routines_db.extend(fixed_routines)
+    for routine in fixed_routines:
+        store.add_routine(routine)
     
     # 고정 테스트 활동들 (ID와 내용 고정)
     fixed_activities = [
@@ -91,7 +119,8 @@ def init_test_data():
             "updatedAt": "2025-09-13T00:00:00.000000"
         }
     ]
-    activities_db.extend(fixed_activities)
+    for activity in fixed_activities:
+        store.add_activity(activity)
     
     print("🎯 고정 테스트 데이터 초기화 완료!")
     print("   📧 테스트 계정: test@bluroutine.com (userId=1)")
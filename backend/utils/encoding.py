@@ -0,0 +1,193 @@
+"""
+응답/요청 인코딩 미들웨어 (MessagePack, gzip/brotli)
+
+모바일 데이터망에서는 행마다 반복되는 긴 키와 ISO 시각 문자열이 응답 크기의 대부분을 차지한다.
+- MsgPackMiddleware: Accept: application/msgpack이면 JSON 응답을 MessagePack으로 바꿔 보내고,
+  Content-Type: application/msgpack 요청 본문은 JSON으로 바꿔 라우터에 넘긴다.
+  라우터는 JSON만 다루므로 모든 라우터에 같은 방식으로 적용된다.
+- CompressionMiddleware: Accept-Encoding에 따라 큰 응답을 brotli 또는 gzip으로 압축한다.
+"""
+
+import gzip
+from typing import List, Optional, Tuple
+
+import brotli
+import msgpack
+import orjson
+from starlette.datastructures import Headers, MutableHeaders
+
+from utils.asgi import read_body, replay_receive, send_error
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "application/msgpack", "text/")
+STREAMING_MEDIA_TYPES = ("text/event-stream",)  # 끝까지 모을 수 없는 응답은 압축하지 않음
+COMPRESSION_MIN_SIZE = 1024  # 이보다 작은 응답은 압축하지 않음 (헤더 비용이 더 큼)
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 5  # 0~11, 응답마다 압축하므로 속도 위주
+
+
+def _media_type(content_type: str) -> str:
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+def _weights(header: str) -> dict:
+    """Accept/Accept-Encoding 헤더 → {값: q}"""
+    weights = {}
+    for part in header.split(","):
+        value, *params = part.strip().split(";")
+        value = value.strip().lower()
+        if not value:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, number = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(number)
+                except ValueError:
+                    q = 0.0
+        weights[value] = q
+    return weights
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """JSON보다 MessagePack을 같거나 더 선호하는지"""
+    weights = _weights(accept)
+    msgpack_q = max(weights.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES)
+    return msgpack_q > 0 and msgpack_q >= weights.get("application/json", 0.0)
+
+
+def vary_accept(headers: MutableHeaders):
+    """Vary에 Accept 추가 (이미 있으면 그대로)"""
+    vary = headers.get("vary", "")
+    if "accept" not in (value.strip().lower() for value in vary.split(",")):
+        headers.add_vary_header("Accept")
+
+
+class _BufferedResponse:
+    """응답을 끝까지 모았다가 한 번에 바꿔 보내기 위한 도우미
+
+    should_buffer(헤더, 상태 코드)가 False면 그 응답은 모으지 않고 그대로 흘려보낸다.
+    """
+
+    def __init__(self, send, should_buffer, rewrite):
+        self.send = send
+        self.should_buffer = should_buffer
+        self.rewrite = rewrite  # (headers, body) → body
+        self.start = None
+        self.chunks: List[bytes] = []
+        self.buffering = False
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            self.buffering = self.should_buffer(Headers(raw=message.get("headers", [])), message["status"])
+            if not self.buffering:
+                await self.send(message)
+            else:
+                self.start = message
+            return
+        if message["type"] != "http.response.body" or not self.buffering:
+            await self.send(message)
+            return
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+        headers = MutableHeaders(raw=list(self.start.get("headers", [])))
+        body = self.rewrite(headers, b"".join(self.chunks))
+        headers["content-length"] = str(len(body))
+        await self.send({**self.start, "headers": headers.raw})
+        await self.send({"type": "http.response.body", "body": body})
+
+
+class MsgPackMiddleware:
+    """MessagePack 요청/응답을 JSON 라우터와 이어주는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        headers = Headers(scope=scope)
+
+        if _media_type(headers.get("content-type", "")) in MSGPACK_MEDIA_TYPES:
+            try:
+                body = orjson.dumps(msgpack.unpackb(await read_body(receive), raw=False))
+            except (ValueError, TypeError, msgpack.UnpackException, orjson.JSONEncodeError):
+                return await send_error(send, 400, "MessagePack 본문을 해석할 수 없습니다")
+            request_headers = MutableHeaders(scope={**scope, "headers": list(scope["headers"])})
+            request_headers["content-type"] = "application/json"
+            request_headers["content-length"] = str(len(body))
+            scope = {**scope, "headers": request_headers.raw}
+            receive = replay_receive(body, receive)
+
+        if not accepts_msgpack(headers.get("accept", "")):
+            return await self.app(scope, receive, self._vary_json(send))
+        await self.app(scope, receive, _BufferedResponse(send, self._is_json, self._to_msgpack))
+
+    @staticmethod
+    def _is_json(headers: Headers, status: int) -> bool:
+        return _media_type(headers.get("content-type", "")) == "application/json"
+
+    @classmethod
+    def _vary_json(cls, send):
+        """JSON으로 보내는 응답에도 Vary: Accept를 붙인다 (캐시가 MessagePack 요청에 JSON 본문을 재사용하지 않도록)"""
+        async def send_with_vary(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=list(message.get("headers", [])))
+                if cls._is_json(headers, message["status"]):
+                    vary_accept(headers)
+                    message = {**message, "headers": headers.raw}
+            await send(message)
+        return send_with_vary
+
+    @staticmethod
+    def _to_msgpack(headers: MutableHeaders, body: bytes) -> bytes:
+        headers["content-type"] = "application/msgpack"
+        vary_accept(headers)
+        return msgpack.packb(orjson.loads(body), use_bin_type=True)
+
+
+def _choose_encoding(accept_encoding: str) -> Optional[str]:
+    weights = _weights(accept_encoding)
+    candidates: List[Tuple[float, str]] = [
+        (weights.get(encoding, weights.get("*", 0.0)), encoding) for encoding in ("br", "gzip")
+    ]
+    q, encoding = max(candidates)  # 같은 q면 br 우선
+    return encoding if q > 0 else None
+
+
+class CompressionMiddleware:
+    """COMPRESSION_MIN_SIZE 이상의 JSON/MessagePack 응답을 brotli 또는 gzip으로 압축하는 ASGI 미들웨어"""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        encoding = _choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        def should_buffer(headers: Headers, status: int) -> bool:
+            content_length = headers.get("content-length")
+            media_type = _media_type(headers.get("content-type", ""))
+            return (
+                "content-encoding" not in headers
+                and media_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+                and media_type not in STREAMING_MEDIA_TYPES
+                and (content_length is None or int(content_length) >= self.minimum_size)
+            )
+
+        def compress(headers: MutableHeaders, body: bytes) -> bytes:
+            if len(body) < self.minimum_size:
+                return body
+            headers["content-encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            if encoding == "br":
+                return brotli.compress(body, quality=BROTLI_QUALITY)
+            return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+        await self.app(scope, receive, _BufferedResponse(send, should_buffer, compress))
@@ -0,0 +1,39 @@
+"""
+ETag / If-None-Match 처리
+
+GET 응답의 ETag는 사용자 컬렉션 버전(저장소가 변경마다 올림)과 요청 URL로 만든다.
+같은 데이터라도 JSON과 MessagePack 응답은 본문이 다르므로 ETag에 응답 형식을 넣는다.
+클라이언트가 같은 ETag를 If-None-Match로 보내면 데이터 조회나 직렬화 없이 304를 돌려준다.
+"""
+
+from typing import Optional
+from zlib import crc32
+
+from fastapi import Request, Response
+
+from utils.encoding import accepts_msgpack
+
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def not_modified(request: Request, response: Response, version: str, extra: str = "") -> Optional[Response]:
+    """응답에 ETag를 붙이고, 클라이언트 캐시가 최신이면 304 응답을 반환
+
+    extra에는 같은 URL이라도 결과가 달라지는 값(예: 기본값으로 쓰인 오늘 날짜)을 넣는다.
+    """
+    key = crc32(f"{request.url.path}?{request.url.query}|{extra}".encode())
+    suffix = "-mp" if accepts_msgpack(request.headers.get("accept", "")) else ""
+    etag = f'W/"{version}-{key:08x}{suffix}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Accept"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {_strip_weak(tag) for tag in if_none_match.split(",")}
+        if "*" in candidates or _strip_weak(etag) in candidates:
+            return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
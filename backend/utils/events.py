@@ -0,0 +1,94 @@
+"""
+사용자별 실시간 이벤트 버스 (프로세스 내부 pub/sub)
+
+한 사용자가 휴대폰에서 타이머를 돌리면서 웹을 보고 있어도 새로고침 없이 변경이 보이도록
+저장소 변경을 그 사용자의 연결(WebSocket/SSE)마다 전달한다.
+이벤트는 발행할 때 한 번만 직렬화하고 구독자마다 같은 bytes를 넣는다.
+
+구독자마다 크기가 제한된 큐를 두고, 큐가 가득 찰 만큼 못 따라오는 연결은 끊는다 (slow consumer).
+끊긴 클라이언트는 마지막으로 받은 커서로 다시 연결하거나 /sync로 따라잡는다.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "256"))  # 연결마다 쌓아 둘 수 있는 이벤트 수
+
+Event = Tuple[str, bytes]  # (커서, JSON 본문)
+
+
+class Subscription:
+    """연결 하나의 이벤트 큐"""
+
+    __slots__ = ("user_id", "queue", "loop", "evicted")
+
+    def __init__(self, user_id: str, max_events: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(max_events + 1)  # 1칸은 종료 표시용
+        self.loop = asyncio.get_running_loop()
+        self.evicted = False  # 너무 느려서 끊겼는지
+
+    def offer(self, event: Event):
+        """이벤트 추가 (이벤트 루프 스레드에서 호출), 큐가 가득 차면 구독을 끊는다"""
+        if self.evicted:
+            return
+        if self.queue.qsize() < self.queue.maxsize - 1:
+            self.queue.put_nowait(event)
+            return
+        self.evicted = True
+        while not self.queue.empty():  # 밀린 이벤트는 버리고 종료 표시만 남긴다
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self) -> Optional[Event]:
+        """다음 이벤트, 끊겼으면 None"""
+        return await self.queue.get()
+
+
+class EventBus:
+    """userId → 구독 목록"""
+
+    def __init__(self, max_events: int = EVENT_QUEUE_SIZE):
+        self.max_events = max_events
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()  # 저장소는 스레드 풀에서도 쓰일 수 있음
+
+    def subscribe(self, user_id: str) -> Subscription:
+        subscription = Subscription(user_id, self.max_events)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def has_subscribers(self, user_id: str) -> bool:
+        """구독자가 없으면 이벤트를 만들지 않아도 된다"""
+        return user_id in self._subscriptions
+
+    def publish(self, user_id: str, event: Event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        if not subscriptions:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for subscription in subscriptions:
+            if subscription.loop is running:
+                subscription.offer(event)
+            else:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+
+
+# 앱 전체에서 쓰는 이벤트 버스
+bus = EventBus()
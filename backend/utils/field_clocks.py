@@ -0,0 +1,60 @@
+"""
+필드별 마지막 변경 시각 (last-writer-wins 병합용)
+
+오프라인에서 쌓인 변경을 나중에 올릴 때, 서버에 더 최근 변경이 있는 필드는 덮어쓰지 않도록
+(컬렉션, 레코드 id) → 필드 → 변경 시각을 기록한다.
+한 번도 기록되지 않은 필드는 레코드의 updatedAt(기준 시각) 이전에 바뀐 것으로 본다.
+시각은 프로세스 메모리에만 있으므로 재시작 후에는 레코드 단위(updatedAt)로 비교한다.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Tuple, Union
+
+ClockKey = Tuple[str, str]  # (컬렉션, 레코드 id), 컬렉션 순서는 id가 ""
+
+_BASE = ""  # 기록이 없는 필드가 쓰는 기준 시각의 키
+
+
+def to_clock(value: Union[str, datetime, None]) -> datetime:
+    """ISO 문자열/datetime → 서버 로컬 시각 (타임존 정보 없음, 서버가 기록하는 시각과 같은 기준)"""
+    if value is None:
+        return datetime.min
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+class FieldClocks:
+    """한 사용자의 필드별 변경 시각"""
+
+    __slots__ = ("_by_record",)
+
+    def __init__(self):
+        self._by_record: Dict[ClockKey, Dict[str, datetime]] = {}
+
+    def get(self, key: ClockKey, field: str, base: datetime) -> datetime:
+        clocks = self._by_record.get(key)
+        if clocks is None:
+            return base
+        return clocks.get(field, clocks[_BASE])
+
+    def latest(self, key: ClockKey, base: datetime) -> datetime:
+        """레코드에서 가장 최근에 바뀐 필드의 시각"""
+        clocks = self._by_record.get(key)
+        return base if clocks is None else max(clocks.values())
+
+    def stamp(self, key: ClockKey, fields: Iterable[str], at: datetime, base: datetime):
+        clocks = self._by_record.get(key)
+        if clocks is None:
+            clocks = self._by_record[key] = {_BASE: base}
+        for field in fields:
+            clocks[field] = max(clocks.get(field, clocks[_BASE]), at)
+
+    def reset(self, key: ClockKey, base: datetime):
+        """레코드의 기준 시각을 다시 정하고 필드별 기록을 지운다"""
+        self._by_record[key] = {_BASE: base}
+
+    def forget(self, key: ClockKey):
+        self._by_record.pop(key, None)
@@ -0,0 +1,163 @@
+"""
+Idempotency-Key 미들웨어
+
+모바일에서 타임아웃 후 같은 요청을 다시 보내면 토글이 되돌아가거나 생성이 중복된다.
+쓰기 요청에 Idempotency-Key 헤더가 있으면 (사용자, 메서드, 경로, 키) → 응답을 저장해 두고
+같은 키로 다시 오면 핸들러를 실행하지 않고 저장된 응답을 돌려준다.
+첫 요청이 아직 처리 중일 때 들어온 중복 요청은 그 결과를 기다렸다가 같은 응답을 받는다.
+
+캐시는 프로세스 메모리에 있으며 개수와 전체 바이트(LRU), 보관 시간(TTL)으로 크기를 제한한다.
+IDEMPOTENCY_MAX_ENTRY_BYTES보다 큰 응답(큰 /batch 결과 등)은 저장하지 않는다. 처리 중에 들어온
+중복 요청은 여전히 같은 응답을 받지만, 끝난 뒤의 재시도는 다시 실행된다.
+5xx 응답은 저장하지 않으므로 서버 오류 뒤의 재시도는 다시 실행된다.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+
+from utils.asgi import read_body, replay_receive, send_error
+from utils.auth import resolve_token
+
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000"))  # 저장할 최대 응답 수
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))  # 응답 보관 시간
+IDEMPOTENCY_CACHE_BYTES = int(os.getenv("IDEMPOTENCY_CACHE_BYTES", str(32 * 1024 * 1024)))  # 저장할 응답 전체 크기
+IDEMPOTENCY_MAX_ENTRY_BYTES = int(os.getenv("IDEMPOTENCY_MAX_ENTRY_BYTES", str(256 * 1024)))  # 응답 하나의 최대 크기
+IDEMPOTENT_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+MAX_KEY_LENGTH = 255
+
+CacheKey = Tuple[str, str, str, str]  # (userId, 메서드, 경로, 키)
+
+
+class CachedResponse:
+    """저장된 응답 하나"""
+
+    __slots__ = ("fingerprint", "status", "headers", "body", "expires_at", "size")
+
+    def __init__(self, fingerprint: str, status: int, headers: List[Tuple[bytes, bytes]], body: bytes, ttl: float):
+        self.fingerprint = fingerprint  # 요청 본문 해시 (같은 키로 다른 요청을 보내면 거부)
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.expires_at = time.monotonic() + ttl
+        self.size = len(body) + sum(len(name) + len(value) for name, value in headers)
+
+    async def replay(self, send):
+        await send({
+            "type": "http.response.start",
+            "status": self.status,
+            "headers": self.headers + [(b"idempotent-replayed", b"true")],
+        })
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class IdempotencyMiddleware:
+    """Idempotency-Key 헤더가 있는 쓰기 요청의 응답을 저장하고 재사용하는 ASGI 미들웨어"""
+
+    def __init__(
+        self, app, max_entries: int = IDEMPOTENCY_CACHE_SIZE, ttl_seconds: int = IDEMPOTENCY_TTL_SECONDS,
+        max_bytes: int = IDEMPOTENCY_CACHE_BYTES, max_entry_bytes: int = IDEMPOTENCY_MAX_ENTRY_BYTES
+    ):
+        self.app = app
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self._cache: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._bytes = 0  # 저장된 응답 크기 합
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}  # 처리 중인 요청 → 결과 (실패하면 None)
+
+    def _lookup(self, key: CacheKey) -> Optional[CachedResponse]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._forget(key)
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _forget(self, key: CacheKey):
+        self._bytes -= self._cache.pop(key).size
+
+    def _remember(self, key: CacheKey, entry: CachedResponse):
+        if entry.size > self.max_entry_bytes:
+            return
+        if key in self._cache:
+            self._forget(key)
+        self._cache[key] = entry
+        self._bytes += entry.size
+        while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+            _, oldest = self._cache.popitem(last=False)
+            self._bytes -= oldest.size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in IDEMPOTENT_METHODS:
+            return await self.app(scope, receive, send)
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get("idempotency-key")
+        if not idempotency_key:
+            return await self.app(scope, receive, send)
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            return await send_error(send, 400, "Idempotency-Key가 너무 깁니다")
+
+        # 인증되지 않은 요청은 그대로 보내 핸들러가 401을 돌려주게 한다
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        user = resolve_token(token) if scheme.lower() == "bearer" and token else None
+        if user is None:
+            return await self.app(scope, receive, send)
+
+        body = await read_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        key = (user["id"], scope["method"], scope["path"], idempotency_key)
+
+        while True:
+            entry = self._lookup(key)
+            if entry is None:
+                pending = self._inflight.get(key)
+                if pending is None:
+                    break
+                entry = await asyncio.shield(pending)
+                if entry is None:
+                    continue  # 처음 요청이 예외로 끝났으면 다시 확인 후 직접 실행
+            if entry.fingerprint != fingerprint:
+                return await send_error(send, 422, "같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다")
+            return await entry.replay(send)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        entry = None
+        try:
+            entry = await self._run(scope, replay_receive(body, receive), send, fingerprint)
+        finally:
+            del self._inflight[key]
+            if entry is not None and entry.status < 500:
+                self._remember(key, entry)
+            future.set_result(entry)
+
+    async def _run(self, scope, receive, send, fingerprint: str) -> Optional[CachedResponse]:
+        """핸들러를 실행하면서 응답을 그대로 보내고, 끝까지 보낸 응답이면 저장용으로 돌려준다"""
+        start = None
+        chunks: List[bytes] = []
+        complete = False
+
+        async def capture(message):
+            nonlocal start, complete
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        await self.app(scope, receive, capture)
+        if start is None or not complete:
+            return None
+        return CachedResponse(
+            fingerprint, start["status"], list(start.get("headers", [])), b"".join(chunks), self.ttl_seconds
+        )
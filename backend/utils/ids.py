@@ -0,0 +1,47 @@
+"""
+ID 발급기 (ULID 형식)
+
+모든 컬렉션이 같은 방식으로 ID를 발급한다.
+- 앞 48비트는 밀리초 타임스탬프라서 문자열 정렬 = 생성 시간 정렬
+- 뒤 80비트는 난수라서 여러 워커/서버가 같은 저장소를 써도 충돌하지 않는다
+- 같은 밀리초 안에서는 난수 부분을 1씩 올려 한 프로세스 안에서 항상 증가한다
+기존 데이터를 훑지 않으므로 발급 비용은 O(1)이다.
+"""
+
+import os
+import threading
+import time
+
+_ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"  # Crockford Base32
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        chars.append(_ENCODING[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def new_id() -> str:
+    """26자리 ULID 문자열 발급"""
+    global _last_ms, _last_random
+    with _lock:
+        now_ms = int(time.time() * 1000)
+        if now_ms <= _last_ms:
+            # 같은 밀리초(또는 시계가 뒤로 간 경우): 직전 값보다 크게 만든다
+            now_ms = _last_ms
+            random_part = _last_random + 1
+            if random_part > _RANDOM_MAX:
+                now_ms += 1
+                random_part = int.from_bytes(os.urandom(10), "big")
+        else:
+            random_part = int.from_bytes(os.urandom(10), "big")
+        _last_ms, _last_random = now_ms, random_part
+    return _encode(now_ms, 10) + _encode(random_part, 16)
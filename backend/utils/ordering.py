@@ -0,0 +1,81 @@
+"""
+사용자별 순서가 있는 컬렉션 (루틴, 활동)
+
+id → 항목 맵과 함께 화면 순서대로 정렬된 id 목록을 유지한다.
+목록 조회는 정렬 없이 순서 목록을 따라가고, 삭제/이동은 위치가 바뀐
+항목들의 orderIndex만 고치며, 바뀐 항목만 돌려주어 저장소가 그것만 기록하게 한다.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class OrderedItems:
+    """orderIndex가 0부터 빈틈없이 이어지도록 유지되는 항목 모음"""
+
+    __slots__ = ("by_id", "order")
+
+    def __init__(self):
+        self.by_id: Dict[str, dict] = {}
+        self.order: List[str] = []  # orderIndex 순서의 id 목록
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.by_id
+
+    def get(self, item_id: str) -> Optional[dict]:
+        return self.by_id.get(item_id)
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        return ((item_id, self.by_id[item_id]) for item_id in self.order)
+
+    def values(self) -> List[dict]:
+        """orderIndex 순 항목 목록 (정렬 없음)"""
+        by_id = self.by_id
+        return [by_id[item_id] for item_id in self.order]
+
+    def _renumber(self, start: int) -> List[dict]:
+        shifted = []
+        for index in range(start, len(self.order)):
+            item = self.by_id[self.order[index]]
+            if item["orderIndex"] != index:
+                item["orderIndex"] = index
+                shifted.append(item)
+        return shifted
+
+    def insert(self, item: dict) -> List[dict]:
+        """item["orderIndex"] 위치에 삽입, 뒤로 밀린 항목들을 반환 (맨 뒤 추가는 O(1))"""
+        position = min(max(item["orderIndex"], 0), len(self.order))
+        item["orderIndex"] = position
+        self.by_id[item["id"]] = item
+        if position == len(self.order):
+            self.order.append(item["id"])
+            return []
+        self.order.insert(position, item["id"])
+        return self._renumber(position + 1)
+
+    def remove(self, item_id: str) -> Tuple[Optional[dict], List[dict]]:
+        """항목 삭제, (삭제된 항목, 앞으로 당겨진 항목들) 반환"""
+        removed = self.by_id.pop(item_id, None)
+        if removed is None:
+            return None, []
+        position = removed["orderIndex"]
+        if position >= len(self.order) or self.order[position] != item_id:
+            position = self.order.index(item_id)
+        del self.order[position]
+        return removed, self._renumber(position)
+
+    def reorder(self, item_ids: List[str]) -> Optional[List[dict]]:
+        """주어진 id들을 앞에서부터 그 순서로 두고 나머지는 기존 순서대로 뒤에 둔다.
+
+        한 번의 순회로 전체 순열을 적용하고 orderIndex가 바뀐 항목들을 반환한다.
+        소유하지 않은 id가 있으면 None.
+        """
+        by_id = self.by_id
+        if not all(item_id in by_id for item_id in item_ids):
+            return None
+        front = list(dict.fromkeys(item_ids))  # 중복 제거, 순서 유지
+        placed = set(front)
+        self.order = front + [item_id for item_id in self.order if item_id not in placed]
+        return self._renumber(0)
@@ -0,0 +1,75 @@
+"""
+루틴별 연간 완료 비트맵
+
+(루틴, 연도)마다 "그 해의 n번째 날 완료 여부"를 정수 하나의 비트로 저장한다.
+1년치 기록이 50바이트 남짓이라 기록이 몇 년씩 쌓여도 메모리가 거의 늘지 않고,
+완료 일수는 popcount, 연속 기록은 비트 연산으로 구한다.
+"""
+
+from datetime import date as date_type
+from typing import Dict, List
+
+
+def day_bit(date_str: str) -> tuple:
+    """YYYY-MM-DD → (연도, 그 해의 0부터 시작하는 날짜 번호)"""
+    day = date_type.fromisoformat(date_str)
+    return day.year, day.timetuple().tm_yday - 1
+
+
+def days_in_year(year: int) -> int:
+    return 366 if date_type(year, 12, 31).timetuple().tm_yday == 366 else 365
+
+
+def longest_run(bits: int) -> int:
+    """연속된 1 비트의 최대 길이 (x & (x >> 1)을 반복할 때마다 모든 구간이 1씩 줄어든다)"""
+    run = 0
+    while bits:
+        bits &= bits >> 1
+        run += 1
+    return run
+
+
+def run_ending_at(bits: int, index: int) -> int:
+    """index 비트에서 끝나는 연속된 1 비트의 길이"""
+    mask = (1 << (index + 1)) - 1
+    zeros = ~bits & mask
+    if zeros == 0:
+        return index + 1
+    return index - (zeros.bit_length() - 1)
+
+
+def set_bit_indexes(bits: int) -> List[int]:
+    indexes = []
+    while bits:
+        low = bits & -bits
+        indexes.append(low.bit_length() - 1)
+        bits ^= low
+    return indexes
+
+
+class CompletionBitmaps:
+    """한 사용자의 루틴별 연간 완료 비트맵"""
+
+    __slots__ = ("bitmaps",)
+
+    def __init__(self, progress_by_date: Dict[str, Dict[str, dict]]):
+        self.bitmaps: Dict[str, Dict[int, int]] = {}  # routineId → 연도 → 비트맵
+        for date_str, by_routine in progress_by_date.items():
+            try:
+                day_bit(date_str)
+            except ValueError:
+                continue  # 날짜 검증이 없던 때 저장된 기록은 비트맵에서 제외
+            for routine_id, progress in by_routine.items():
+                if progress["isCompleted"]:
+                    self.set(routine_id, date_str, True)
+
+    def set(self, routine_id: str, date_str: str, completed: bool):
+        year, index = day_bit(date_str)
+        by_year = self.bitmaps.setdefault(routine_id, {})
+        if completed:
+            by_year[year] = by_year.get(year, 0) | (1 << index)
+        else:
+            by_year[year] = by_year.get(year, 0) & ~(1 << index)
+
+    def year_bits(self, routine_id: str, year: int) -> int:
+        return self.bitmaps.get(routine_id, {}).get(year, 0)
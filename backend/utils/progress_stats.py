@@ -0,0 +1,102 @@
+"""
+사용자별 루틴 진행률 집계
+
+토글할 때마다 전체 기록을 다시 훑지 않도록 날짜별/루틴별 완료 수와
+"모든 루틴을 완료한 날(완벽한 날)" 집합을 유지한다.
+루틴이 추가/삭제되면 완벽한 날의 기준이 바뀌므로 저장소가 집계를 버리고 다시 만든다.
+"""
+
+from datetime import date as date_type
+from typing import Dict, Optional, Set
+
+from utils.ordering import OrderedItems
+
+
+def to_ordinal(date_str: str) -> int:
+    """YYYY-MM-DD → 날짜 서수 (하루 차이 = 1)"""
+    return date_type.fromisoformat(date_str).toordinal()
+
+
+def is_date(date_str: str) -> bool:
+    """to_ordinal로 바꿀 수 있는 날짜인지"""
+    try:
+        date_type.fromisoformat(date_str)
+    except ValueError:
+        return False
+    return True
+
+
+class ProgressAggregates:
+    """한 사용자의 진행률 집계"""
+
+    __slots__ = (
+        "routine_count", "completed_by_date", "completed_by_routine",
+        "first_day_by_routine", "perfect_days", "_best_streak",
+    )
+
+    def __init__(self, routines: OrderedItems, progress_by_date: Dict[str, Dict[str, dict]]):
+        self.routine_count = len(routines)
+        self.completed_by_date: Dict[int, int] = {}  # 날짜 서수 → 완료한 루틴 수
+        self.completed_by_routine: Dict[str, int] = {}  # routineId → 완료한 날 수
+        self.first_day_by_routine: Dict[str, int] = {}  # routineId → 집계 시작일 서수
+        self.perfect_days: Set[int] = set()  # 모든 루틴을 완료한 날짜 서수
+        self._best_streak: Optional[int] = None  # None이면 다음 조회 때 다시 계산
+
+        for routine_id, routine in routines.items():
+            self.completed_by_routine[routine_id] = 0
+            self.first_day_by_routine[routine_id] = to_ordinal(routine["createdAt"][:10])
+        for date_str, by_routine in progress_by_date.items():
+            if not is_date(date_str):
+                continue  # 날짜 검증이 없던 때 저장된 기록은 집계에서 제외
+            for routine_id, progress in by_routine.items():
+                if routine_id in routines:
+                    self.apply(routine_id, date_str, False, progress["isCompleted"])
+
+    def apply(self, routine_id: str, date_str: str, was_completed: bool, is_completed: bool):
+        """(routineId, date) 완료 상태 변경 반영 - O(1)"""
+        day = to_ordinal(date_str)
+        if day < self.first_day_by_routine.get(routine_id, day):
+            self.first_day_by_routine[routine_id] = day
+        if was_completed == is_completed:
+            return
+        delta = 1 if is_completed else -1
+        self.completed_by_routine[routine_id] = self.completed_by_routine.get(routine_id, 0) + delta
+        completed = self.completed_by_date.get(day, 0) + delta
+        self.completed_by_date[day] = completed
+
+        if self.routine_count > 0 and completed == self.routine_count:
+            self.perfect_days.add(day)
+            if self._best_streak is not None:
+                self._best_streak = max(self._best_streak, self._run_length(day))
+        elif day in self.perfect_days:
+            self.perfect_days.discard(day)
+            self._best_streak = None  # 최고 기록이 끊겼을 수 있으므로 다시 계산
+
+    def _run_length(self, day: int) -> int:
+        start = day
+        while start - 1 in self.perfect_days:
+            start -= 1
+        end = day
+        while end + 1 in self.perfect_days:
+            end += 1
+        return end - start + 1
+
+    def current_streak(self, day: int) -> int:
+        """day부터 거꾸로 이어지는 완벽한 날 수"""
+        streak = 0
+        while day - streak in self.perfect_days:
+            streak += 1
+        return streak
+
+    def best_streak(self) -> int:
+        """가장 길었던 연속 완벽한 날 수"""
+        if self._best_streak is None:
+            best = 0
+            for day in self.perfect_days:
+                if day - 1 not in self.perfect_days:  # 연속 구간의 시작점에서만 센다
+                    best = max(best, self._run_length(day))
+            self._best_streak = best
+        return self._best_streak
+
+    def completed_on(self, day: int) -> int:
+        return self.completed_by_date.get(day, 0)
@@ -0,0 +1,46 @@
+"""
+?fields= 부분 응답 (sparse fieldsets)
+
+화면마다 필요한 필드만 요청할 수 있도록 `fields=id,routineText,emoji`처럼 받은 필드 목록으로
+응답에 들어갈 키만 골라 만든다. 직렬화 전에 필요한 키만 만들므로 CPU와 응답 크기가 함께 준다.
+목록에서 항목을 구분해야 하므로 id는 요청하지 않아도 항상 포함한다.
+"""
+
+from typing import Iterable, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+ALWAYS_INCLUDED = "id"
+
+FIELDS_QUERY_DESCRIPTION = "응답에 포함할 필드 (쉼표로 구분, 생략하면 전체). id는 항상 포함"
+
+
+def fields_query():
+    """라우터에서 `fields: Optional[str] = fields_query()`로 쓰는 쿼리 파라미터 정의"""
+    return Query(None, description=FIELDS_QUERY_DESCRIPTION)
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """`a,b,c` → 응답 모델 필드 순서의 튜플, 생략하면 None (전체 필드)
+
+    모델에 없는 필드를 요청하면 400
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"
+        )
+    requested.add(ALWAYS_INCLUDED)
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+def project(records: Iterable[dict], fields: Optional[Tuple[str, ...]]) -> List[dict]:
+    """레코드에서 요청한 키만 골라낸 새 dict 목록 (fields가 None이면 원본 그대로)"""
+    if fields is None:
+        return records if isinstance(records, list) else list(records)
+    return [{name: record.get(name) for name in fields} for record in records]
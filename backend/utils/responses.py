@@ -0,0 +1,23 @@
+"""
+검증이 끝난 데이터를 바로 JSON으로 내보내는 응답
+
+저장소의 레코드는 저장할 때 이미 요청 모델로 검증되었으므로, 자주 호출되는 목록 조회는
+response_model로 다시 검증하지 않고 orjson으로 한 번에 직렬화한다.
+response_model은 문서(OpenAPI)용으로 그대로 둔다.
+"""
+
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+
+
+def _json(body: bytes, response: Optional[Response]) -> Response:
+    # 핸들러가 response 파라미터에 붙인 헤더(ETag 등)를 그대로 옮긴다
+    headers = dict(response.headers) if response is not None else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def trusted_json(content: Any, response: Optional[Response] = None) -> Response:
+    """저장소의 dict/list를 검증 없이 orjson으로 직렬화"""
+    return _json(orjson.dumps(content), response)
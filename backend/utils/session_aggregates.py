@@ -0,0 +1,90 @@
+"""
+데이 세션 시간 집계
+
+세션들을 시작/종료 시각(epoch 초), 휴식 여부, 활동 코드 열(column)로 한 번 변환한 뒤
+열 단위 연산(map, compress, sum)으로 구간 길이와 합계를 구한다.
+세션마다 dict/모델 필드를 여러 번 꺼내며 누적하는 방식보다 파이썬 레벨 작업이 적다.
+(numpy는 의존성에 없으므로 표준 라이브러리 array를 사용)
+"""
+
+from array import array
+from itertools import compress, repeat
+from operator import sub
+from typing import Dict, Iterable, List
+
+from utils.session_intervals import parse_time
+from utils.session_records import SessionRecord
+
+
+class SessionColumns:
+    """종료된 세션들의 열 기반 표현"""
+
+    __slots__ = ("starts", "ends", "rest", "action_codes", "actions", "set_numbers", "open_count")
+
+    def __init__(self, sessions: Iterable[SessionRecord]):
+        self.starts = array("d")
+        self.ends = array("d")
+        self.rest = array("b")
+        self.action_codes = array("l")
+        self.set_numbers = array("l")
+        self.actions: List[str] = []  # 코드 → 활동 이름
+        self.open_count = 0  # 아직 끝나지 않았거나 시각이 ISO 형식이 아닌 세션 수 (집계에서 제외)
+
+        codes: Dict[str, int] = {}
+        for session in sessions:
+            start = parse_time(session.start_time)
+            end = parse_time(session.end_time)
+            if start is None or end is None:
+                self.open_count += 1
+                continue
+            self.starts.append(start)
+            self.ends.append(end)
+            self.rest.append(1 if session.is_rest else 0)
+            action = session.action or ""
+            code = codes.get(action)
+            if code is None:
+                code = codes[action] = len(self.actions)
+                self.actions.append(action)
+            self.action_codes.append(code)
+            self.set_numbers.append(session.set_number or 0)
+
+    def durations(self) -> array:
+        """세션별 길이(초), 종료가 시작보다 빠르면 0"""
+        return array("d", map(max, map(sub, self.ends, self.starts), repeat(0.0)))
+
+
+def aggregate_sessions(sessions: Iterable[SessionRecord]) -> dict:
+    """집중/휴식 시간, 세트 수, 활동별 시간 집계"""
+    columns = SessionColumns(sessions)
+    durations = columns.durations()
+    focus_mask = array("b", (1 - flag for flag in columns.rest))
+
+    focused_seconds = sum(compress(durations, focus_mask))
+    rest_seconds = sum(compress(durations, columns.rest))
+
+    action_seconds = [0.0] * len(columns.actions)
+    action_counts = [0] * len(columns.actions)
+    for code, duration in zip(compress(columns.action_codes, focus_mask), compress(durations, focus_mask)):
+        action_seconds[code] += duration
+        action_counts[code] += 1
+
+    actions = [
+        {
+            "action": columns.actions[code],
+            "totalSeconds": round(action_seconds[code]),
+            "sessionCount": action_counts[code],
+        }
+        for code in range(len(columns.actions))
+        if action_counts[code] > 0
+    ]
+    actions.sort(key=lambda x: x["totalSeconds"], reverse=True)
+
+    return {
+        "sessionCount": len(durations),
+        "openSessionCount": columns.open_count,
+        "focusedSeconds": round(focused_seconds),
+        "restSeconds": round(rest_seconds),
+        "setCount": sum(focus_mask),
+        "maxSetNumber": max(columns.set_numbers, default=0),
+        "actions": actions,
+    }
@@ -0,0 +1,70 @@
+"""
+데이 세션 시간 구간 인덱스 (겹침 검사, 시점/구간 조회)
+
+사용자마다 종료된 세션의 [시작, 종료) 구간을 시작 시각순으로 정렬해 둔다.
+지금까지 들어온 가장 긴 구간 길이를 같이 기억하므로, 구간 [a, b)와 겹칠 수 있는 세션은
+시작 시각이 (a - 최대 길이, b) 안에 있는 것뿐이고 이진 탐색으로 그 범위만 본다.
+겹치는 세션이 이미 저장되어 있어도(예전 데이터) 결과는 정확하다.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+Interval = Tuple[float, float]  # (시작, 종료) epoch 초
+IntervalEntry = Tuple[float, float, str]  # (시작, 종료, 세션 id)
+
+_entry_start = itemgetter(0)
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """ISO 시각 → epoch 초 (비어 있거나 ISO 형식이 아니면 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def session_interval(start_time: Optional[str], end_time: Optional[str]) -> Optional[Interval]:
+    """세션의 시간 구간 (시작/종료 중 하나라도 없거나 종료가 시작보다 빠르면 None)"""
+    start = parse_time(start_time)
+    end = parse_time(end_time)
+    if start is None or end is None or end < start:
+        return None
+    return start, end
+
+
+class IntervalIndex:
+    """한 사용자의 종료된 세션 구간 (시작 시각순)"""
+
+    __slots__ = ("entries", "by_id", "max_length")
+
+    def __init__(self):
+        self.entries: List[IntervalEntry] = []
+        self.by_id: Dict[str, Interval] = {}
+        self.max_length = 0.0  # 지금까지 들어온 가장 긴 구간 (지워도 줄이지 않음, 검색 범위만 넓어짐)
+
+    def add(self, session_id: str, interval: Interval):
+        start, end = interval
+        self.by_id[session_id] = interval
+        insort(self.entries, (start, end, session_id))
+        self.max_length = max(self.max_length, end - start)
+
+    def remove(self, session_id: str):
+        interval = self.by_id.pop(session_id, None)
+        if interval is None:
+            return
+        entry = (interval[0], interval[1], session_id)
+        del self.entries[bisect_left(self.entries, entry)]
+
+    def overlapping(self, start: float, end: float) -> List[str]:
+        """[start, end)와 겹치는 세션 id (시작 시각순), start == end면 그 시점을 포함하는 세션"""
+        low = bisect_right(self.entries, start - self.max_length, key=_entry_start)
+        if start == end:
+            high = bisect_right(self.entries, start, key=_entry_start)
+            return [entry[2] for entry in self.entries[low:high] if entry[1] > start]
+        high = bisect_left(self.entries, end, key=_entry_start)
+        return [entry[2] for entry in self.entries[low:high] if entry[1] > start]
@@ -0,0 +1,132 @@
+"""
+저장소 안의 데이 세션 표현 (compact record)
+
+타이머를 많이 쓰는 사용자는 하루에도 세션이 수십 개씩 쌓인다.
+pydantic DaySession 인스턴스는 필드 dict, fields_set 집합, datetime 객체 두 개를 세션마다 들고 있으므로
+저장소에는 __slots__ 레코드로 보관하고 API 응답을 만들 때만 모델(또는 JSON dict)로 바꾼다.
+- created_at/updated_at: 1970-01-01 기준 마이크로초 정수 (naive datetime과 정확히 왕복)
+- date, status, action, user_id: sys.intern으로 같은 문자열을 공유
+- start_time/end_time: 클라이언트가 보낸 문자열을 그대로 돌려줘야 하므로 문자열 유지
+"""
+
+import sys
+from datetime import datetime, timedelta
+from typing import Optional, Union
+
+from models.day_session import DaySession
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 타임존이 있는 시각은 정수로 줄이지 않고 datetime 그대로 둔다 (서버가 기록하는 시각은 항상 naive)
+Timestamp = Union[int, datetime, None]
+
+# DaySession 필드 순서 (SQLite 컬럼 순서와 같음)
+FIELDS = (
+    "id", "user_id", "date", "start_time", "end_time", "action", "status",
+    "is_rest", "is_new_action", "set_number", "created_at", "updated_at",
+)
+_INTERNED = {"user_id", "date", "action", "status"}
+
+
+def _pack_time(value: Optional[datetime]) -> Timestamp:
+    if value is None or value.tzinfo is not None:
+        return value
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _unpack_time(value: Timestamp) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class SessionRecord:
+    """저장소가 보관하는 데이 세션 하나 (DaySession과 같은 속성 이름)"""
+
+    __slots__ = (
+        "id", "user_id", "date", "start_time", "end_time", "action", "status",
+        "is_rest", "is_new_action", "set_number", "_created", "_updated",
+    )
+
+    def __init__(
+        self, id: str, user_id: str, date: str, start_time: str, end_time: Optional[str] = None,
+        action: Optional[str] = None, status: str = "ready", is_rest: Optional[bool] = False,
+        is_new_action: Optional[bool] = False, set_number: Optional[int] = None,
+        created_at: Optional[datetime] = None, updated_at: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.user_id = _intern(user_id)
+        self.date = _intern(date)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.action = _intern(action)
+        self.status = _intern(status)
+        self.is_rest = is_rest
+        self.is_new_action = is_new_action
+        self.set_number = set_number
+        self._created = _pack_time(created_at)
+        self._updated = _pack_time(updated_at)
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return _unpack_time(self._created)
+
+    @created_at.setter
+    def created_at(self, value: Optional[datetime]):
+        self._created = _pack_time(value)
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        return _unpack_time(self._updated)
+
+    @updated_at.setter
+    def updated_at(self, value: Optional[datetime]):
+        self._updated = _pack_time(value)
+
+    @classmethod
+    def from_model(cls, session: DaySession) -> "SessionRecord":
+        """검증된 DaySession → 레코드"""
+        return cls(**{field: getattr(session, field) for field in FIELDS})
+
+    @classmethod
+    def from_row(cls, row: dict) -> "SessionRecord":
+        """SQLite 행 → 레코드 (저장할 때 검증된 값이므로 다시 검증하지 않음)"""
+        row = dict(row)
+        row["is_rest"] = bool(row["is_rest"])
+        row["is_new_action"] = bool(row["is_new_action"])
+        for field in ("created_at", "updated_at"):
+            if row[field] is not None:
+                row[field] = datetime.fromisoformat(row[field])
+        return cls(**row)
+
+    def update(self, changes: dict):
+        """변경된 필드 반영 (DaySessionUpdate 필드와 updated_at)"""
+        for field, value in changes.items():
+            setattr(self, field, _intern(value) if field in _INTERNED else value)
+
+    def to_model(self) -> DaySession:
+        """API 응답용 DaySession (다시 검증하지 않음)"""
+        return DaySession.model_construct(**{field: getattr(self, field) for field in FIELDS})
+
+    def to_dict(self) -> dict:
+        """DaySession.model_dump(mode="json")과 같은 dict (orjson 직렬화, SQLite 저장용)"""
+        created_at, updated_at = self.created_at, self.updated_at
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "date": self.date,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "action": self.action,
+            "status": self.status,
+            "is_rest": self.is_rest,
+            "is_new_action": self.is_new_action,
+            "set_number": self.set_number,
+            "created_at": created_at.isoformat() if created_at is not None else None,
+            "updated_at": updated_at.isoformat() if updated_at is not None else None,
+        }
@@ -0,0 +1,76 @@
+"""
+데이 세션 타이머 상태 전이
+
+DayPage의 버튼(시작, 완료, 휴식, 휴식 종료, 마감, 새액션)과 같은 전이를 서버에서 검증하고,
+현재 세션을 닫으면서 이어지는 세션(휴식, 같은 세트의 다음 작업, 다음 세트)을 함께 만든다.
+
+    ready ─start→ started ─complete→ completed ─rest→ finished + (resting 휴식 세션)
+                                               ├newAction→ finished + (started 새 액션, 같은 세트)
+                                               └finish→ finished + (ready, 다음 세트)
+    resting ─rest_end→ rest_finished ─continue→ finished + (started, 같은 세트)
+                                     └finish→ finished + (ready, 다음 세트)
+"""
+
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional
+
+from utils.session_records import SessionRecord
+
+REST_ACTION = "휴식"
+
+
+class Transition(NamedTuple):
+    sources: FrozenSet[str]  # 전이할 수 있는 현재 상태
+    status: str  # 현재 세션의 새 상태
+    starts: bool  # 현재 세션의 start_time을 전이 시각으로 기록
+    ends: bool  # 현재 세션에 end_time이 없으면 전이 시각으로 기록
+    follow_up: Optional[str]  # 이어서 만들 세션 ('rest', 'same_set', 'new_action', 'next_set')
+
+
+TRANSITIONS: Dict[str, Transition] = {
+    "start": Transition(frozenset({"ready"}), "started", True, False, None),
+    "complete": Transition(frozenset({"started"}), "completed", False, True, None),
+    "rest": Transition(frozenset({"completed"}), "finished", False, False, "rest"),
+    "rest_end": Transition(frozenset({"resting"}), "rest_finished", False, True, None),
+    "finish": Transition(frozenset({"completed", "rest_finished"}), "finished", False, True, "next_set"),
+    "continue": Transition(frozenset({"rest_finished"}), "finished", False, False, "same_set"),
+    "newAction": Transition(frozenset({"completed"}), "finished", False, False, "new_action"),
+}
+
+
+def current_set_number(session: SessionRecord, day_sessions: Iterable[SessionRecord]) -> int:
+    """세션의 세트 번호 (기록이 없으면 그날 기록된 가장 큰 세트 번호, 그것도 없으면 1)"""
+    if session.set_number:
+        return session.set_number
+    return max((other.set_number for other in day_sessions if other.set_number), default=1)
+
+
+def session_changes(session: SessionRecord, transition: Transition, at: str, action: Optional[str]) -> dict:
+    """현재 세션에 적용할 변경"""
+    changes = {"status": transition.status}
+    if transition.starts:
+        changes["start_time"] = at
+    if transition.ends and not session.end_time:
+        changes["end_time"] = at
+    if action and transition.follow_up is None:
+        changes["action"] = action  # 완료하면서 입력한 활동 등
+    return changes
+
+
+def follow_up_session(transition: Transition, session: SessionRecord, set_number: int, at: str, action: Optional[str]) -> Optional[dict]:
+    """이어서 만들 세션의 필드 (DaySessionCreate와 같은 형태), 없으면 None"""
+    if transition.follow_up == "rest":
+        return {
+            "date": session.date, "start_time": at, "status": "resting",
+            "is_rest": True, "action": REST_ACTION, "set_number": set_number,
+        }
+    if transition.follow_up == "same_set":
+        return {"date": session.date, "start_time": at, "status": "started", "action": action, "set_number": set_number}
+    if transition.follow_up == "new_action":
+        return {
+            "date": session.date, "start_time": at, "status": "started",
+            "is_new_action": True, "action": action, "set_number": set_number,
+        }
+    if transition.follow_up == "next_set":
+        # 다음 세트는 시작 버튼을 누를 때 시작 시각이 정해진다
+        return {"date": session.date, "start_time": "", "status": "ready", "set_number": set_number + 1}
+    return None
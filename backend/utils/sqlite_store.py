@@ -0,0 +1,328 @@
+"""
+SQLite 영속 저장소 (WAL 모드)
+
+MemoryStore의 사용자별 파티션을 그대로 읽기 캐시로 사용하고, 모든 쓰기는
+SQLite에 즉시 기록(write-through)한다. 사용자 데이터는 처음 접근할 때
+(userId, ...) 인덱스를 타는 쿼리로 한 번만 읽어오므로 이후 조회는 메모리 속도로 처리된다.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence
+
+from utils.change_log import ChangeEntry
+from utils.session_records import SessionRecord
+from utils.store import MemoryStore, UserPartition
+
+# 컬렉션별 테이블 컬럼 (레코드 키와 동일)
+TABLE_COLUMNS: Dict[str, List[str]] = {
+    "users": ["id", "email", "password", "name", "provider", "createdAt"],
+    "routines": ["id", "userId", "timeAction", "routineText", "emoji", "orderIndex", "createdAt", "updatedAt"],
+    "activities": ["id", "userId", "name", "color", "orderIndex", "createdAt", "updatedAt"],
+    "routine_progress": ["id", "userId", "routineId", "date", "isCompleted", "createdAt", "updatedAt"],
+    "day_sessions": [
+        "id", "user_id", "date", "start_time", "end_time", "action", "status",
+        "is_rest", "is_new_action", "set_number", "created_at", "updated_at",
+    ],
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    password TEXT NOT NULL,
+    name TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    createdAt TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users (email);
+
+CREATE TABLE IF NOT EXISTS routines (
+    id TEXT PRIMARY KEY,
+    userId TEXT NOT NULL,
+    timeAction TEXT NOT NULL,
+    routineText TEXT NOT NULL,
+    emoji TEXT,
+    orderIndex INTEGER NOT NULL,
+    createdAt TEXT NOT NULL,
+    updatedAt TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_routines_user_order ON routines (userId, orderIndex);
+
+CREATE TABLE IF NOT EXISTS activities (
+    id TEXT PRIMARY KEY,
+    userId TEXT NOT NULL,
+    name TEXT NOT NULL,
+    color TEXT NOT NULL,
+    orderIndex INTEGER NOT NULL,
+    createdAt TEXT NOT NULL,
+    updatedAt TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_activities_user_order ON activities (userId, orderIndex);
+
+CREATE TABLE IF NOT EXISTS routine_progress (
+    id TEXT PRIMARY KEY,
+    userId TEXT NOT NULL,
+    routineId TEXT NOT NULL,
+    date TEXT NOT NULL,
+    isCompleted INTEGER NOT NULL,
+    createdAt TEXT NOT NULL,
+    updatedAt TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_routine_progress_user_date
+    ON routine_progress (userId, date, routineId);
+
+CREATE TABLE IF NOT EXISTS day_sessions (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    action TEXT,
+    status TEXT NOT NULL,
+    is_rest INTEGER,
+    is_new_action INTEGER,
+    set_number INTEGER,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_day_sessions_user_date ON day_sessions (user_id, date, start_time);
+
+CREATE TABLE IF NOT EXISTS change_log (
+    user_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    deleted INTEGER NOT NULL,
+    PRIMARY KEY (user_id, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 자주 쓰는 SQL은 고정 문자열로 만들어 두고 파라미터만 바꿔 실행한다.
+# sqlite3 모듈이 연결마다 컴파일된 statement를 캐시하므로 매번 다시 파싱하지 않는다.
+# REPLACE는 다른 유니크 인덱스(users.email 등)와 충돌한 행까지 지우므로 id 충돌만 갱신으로 처리한다.
+UPSERT_SQL = {
+    kind: "INSERT INTO {table} ({cols}) VALUES ({marks}) ON CONFLICT(id) DO UPDATE SET {updates}".format(
+        table=kind, cols=", ".join(columns), marks=", ".join("?" for _ in columns),
+        updates=", ".join(f"{column} = excluded.{column}" for column in columns if column != "id")
+    )
+    for kind, columns in TABLE_COLUMNS.items()
+}
+# 사용자는 추가만 한다 (같은 이메일이면 유니크 인덱스가 거부)
+UPSERT_SQL["users"] = "INSERT INTO users ({cols}) VALUES ({marks})".format(
+    cols=", ".join(TABLE_COLUMNS["users"]), marks=", ".join("?" for _ in TABLE_COLUMNS["users"])
+)
+DELETE_SQL = {kind: f"DELETE FROM {kind} WHERE id = ?" for kind in TABLE_COLUMNS}
+SELECT_USER_SQL = {
+    "routines": "SELECT * FROM routines WHERE userId = ? ORDER BY orderIndex",
+    "activities": "SELECT * FROM activities WHERE userId = ? ORDER BY orderIndex",
+    "routine_progress": "SELECT * FROM routine_progress WHERE userId = ? ORDER BY date",
+    "day_sessions": "SELECT * FROM day_sessions WHERE user_id = ? ORDER BY date, start_time",
+}
+SELECT_USER_BY_EMAIL_SQL = "SELECT * FROM users WHERE email = ?"
+INSERT_CHANGE_SQL = "INSERT OR REPLACE INTO change_log (user_id, seq, kind, record_id, deleted) VALUES (?, ?, ?, ?, ?)"
+TRIM_CHANGES_SQL = "DELETE FROM change_log WHERE user_id = ? AND seq <= ?"
+SELECT_CHANGES_SQL = "SELECT seq, kind, record_id, deleted FROM change_log WHERE user_id = ? ORDER BY seq"
+SELECT_USER_BY_ID_SQL = "SELECT * FROM users WHERE id = ?"
+
+
+class ConnectionPool:
+    """스레드 간에 공유하는 작은 SQLite 연결 풀"""
+
+    def __init__(self, path: str, size: int = 4):
+        self._connections: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._connections.put(self._connect(path))
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection
+
+    @contextmanager
+    def connection(self):
+        connection = self._connections.get()
+        try:
+            with connection:  # 블록이 끝나면 commit, 예외 시 rollback
+                yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self):
+        while not self._connections.empty():
+            self._connections.get_nowait().close()
+
+
+class SqliteStore(MemoryStore):
+    """SQLite에 영속 저장하는 저장소 (MemoryStore와 같은 인터페이스)"""
+
+    persistent = True
+
+    def __init__(self, path: str, pool_size: int = 4, change_log_limit: int = 5000):
+        super().__init__(change_log_limit)
+        self.path = path
+        self._pool = ConnectionPool(path, pool_size)
+        self._lock = threading.Lock()
+        # 배치 쓰기 버퍼 (스레드와 코루틴마다 따로 보이도록 ContextVar 사용)
+        self._pending: ContextVar[Optional[list]] = ContextVar(f"sqlite_pending_{id(self)}", default=None)
+        with self._pool.connection() as connection:
+            connection.executescript(SCHEMA)
+        self._load_log_id()
+
+    def _load_log_id(self):
+        """변경 기록 식별자는 파일에 저장해 재시작 후에도 클라이언트 커서가 유효하도록 한다"""
+        with self._pool.connection() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('log_id', ?)", (os.urandom(4).hex(),)
+            )
+            self.log_id = connection.execute("SELECT value FROM meta WHERE key = 'log_id'").fetchone()[0]
+
+    def clear(self):
+        """모든 데이터 삭제 (테이블 포함)"""
+        super().clear()
+        with self._pool.connection() as connection:
+            for kind in TABLE_COLUMNS:
+                connection.execute(f"DELETE FROM {kind}")
+            connection.execute("DELETE FROM change_log")
+            connection.execute("DELETE FROM meta WHERE key = 'log_id'")
+        self._load_log_id()
+
+    def close(self):
+        self._pool.close()
+
+    # ---------- 행 변환 ----------
+
+    @staticmethod
+    def _to_row(kind: str, record) -> tuple:
+        if kind == "day_sessions":
+            record = record.to_dict()
+        return tuple(record.get(column) for column in TABLE_COLUMNS[kind])
+
+    @staticmethod
+    def _from_row(kind: str, row: sqlite3.Row):
+        record = dict(row)
+        if kind == "routine_progress":
+            record["isCompleted"] = bool(record["isCompleted"])
+        elif kind == "day_sessions":
+            return SessionRecord.from_row(record)
+        return record
+
+    # ---------- MemoryStore 훅 ----------
+
+    def _load_partition(self, user_id: str, partition: UserPartition):
+        with self._pool.connection() as connection:
+            for row in connection.execute(SELECT_USER_SQL["routines"], (user_id,)):
+                partition.routines.insert(self._from_row("routines", row))
+            for row in connection.execute(SELECT_USER_SQL["activities"], (user_id,)):
+                partition.activities.insert(self._from_row("activities", row))
+            for row in connection.execute(SELECT_USER_SQL["routine_progress"], (user_id,)):
+                progress = self._from_row("routine_progress", row)
+                partition.progress.setdefault(progress["date"], {})[progress["routineId"]] = progress
+            for row in connection.execute(SELECT_USER_SQL["day_sessions"], (user_id,)):
+                partition.index_day_session(self._from_row("day_sessions", row))
+            partition.sort_open_sessions()
+            change_rows = connection.execute(SELECT_CHANGES_SQL, (user_id,)).fetchall()
+
+        # 변경 기록은 id만 저장하므로 읽어온 레코드와 다시 연결한다
+        records = {
+            "routines": partition.routines.by_id,
+            "activities": partition.activities.by_id,
+            "routine_progress": {
+                progress["id"]: progress
+                for by_routine in partition.progress.values()
+                for progress in by_routine.values()
+            },
+            "day_sessions": partition.day_sessions,
+        }
+        for seq, kind, record_id, deleted in change_rows:
+            record = None if deleted else records[kind].get(record_id)
+            partition.changes.restore((seq, kind, record_id, record))
+
+    def _partition(self, user_id: str) -> UserPartition:
+        partition = self._partitions.get(user_id)
+        if partition is not None:
+            return partition
+        # 같은 사용자를 두 스레드가 동시에 읽어오지 않도록 보호
+        with self._lock:
+            return super()._partition(user_id)
+
+    @contextmanager
+    def batch(self, user_id: str):
+        """블록 안의 쓰기를 모았다가 한 트랜잭션으로 커밋"""
+        with super().batch(user_id):
+            if self._pending.get() is not None:  # 이미 바깥 배치 안
+                yield
+                return
+            pending = []
+            token = self._pending.set(pending)
+            try:
+                yield
+            finally:
+                # 중간에 실패해도 메모리에 이미 반영된 변경은 기록해 둘이 어긋나지 않게 한다
+                self._pending.reset(token)
+                if pending:
+                    with self._pool.connection() as connection:
+                        for sql, rows in pending:
+                            connection.executemany(sql, rows)
+
+    def _execute(self, sql: str, rows: Sequence[tuple]):
+        pending = self._pending.get()
+        if pending is not None:
+            pending.append((sql, rows))
+            return
+        with self._pool.connection() as connection:
+            connection.executemany(sql, rows)
+
+    def _persist(self, kind: str, records: List):
+        self._execute(UPSERT_SQL[kind], [self._to_row(kind, record) for record in records])
+
+    def _persist_delete(self, kind: str, record_ids: List[str]):
+        self._execute(DELETE_SQL[kind], [(record_id,) for record_id in record_ids])
+
+    def _persist_changes(self, user_id: str, entries: List[ChangeEntry]):
+        rows = [(user_id, seq, kind, record_id, record is None) for seq, kind, record_id, record in entries]
+        self._execute(INSERT_CHANGE_SQL, rows)
+
+    def _persist_changes_trim(self, user_id: str, floor: int):
+        self._execute(TRIM_CHANGES_SQL, [(user_id, floor)])
+
+    # ---------- 사용자 ----------
+
+    def _fetch_user(self, sql: str, value: str) -> Optional[dict]:
+        with self._pool.connection() as connection:
+            row = connection.execute(sql, (value,)).fetchone()
+        if row is None:
+            return None
+        user = self._from_row("users", row)
+        self._remember_user(user)
+        return user
+
+    def get_user(self, user_id: str) -> Optional[dict]:
+        return super().get_user(user_id) or self._fetch_user(SELECT_USER_BY_ID_SQL, user_id)
+
+    def find_user_by_email(self, email: str) -> Optional[dict]:
+        return super().find_user_by_email(email) or self._fetch_user(SELECT_USER_BY_EMAIL_SQL, email)
+
+    def add_user(self, user: dict) -> Optional[dict]:
+        try:
+            return super().add_user(user)
+        except sqlite3.IntegrityError:
+            # 다른 프로세스가 같은 이메일로 먼저 가입한 경우 (메모리에 올린 사용자는 되돌린다)
+            self._users.pop(user["id"], None)
+            self._partitions.pop(user["id"], None)
+            if self._users_by_email.get(user["email"]) is user:
+                del self._users_by_email[user["email"]]
+            return None
@@ -0,0 +1,620 @@
+"""
+사용자별로 파티션된 메모리 저장소
+
+모든 데이터는 userId 기준으로 나뉘어 저장되며, 각 파티션 안에서는
+id → 레코드 해시맵으로 조회한다. 따라서 요청 한 번의 비용은 전체 데이터가 아니라
+요청한 사용자의 데이터 크기에만 비례한다.
+"""
+
+import asyncio
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from models.day_session import DaySession
+from utils.change_log import ChangeEntry, ChangeLog
+from utils.field_clocks import FieldClocks, to_clock
+from utils.ordering import OrderedItems
+from utils.progress_bitmaps import CompletionBitmaps
+from utils.progress_stats import ProgressAggregates
+from utils.session_intervals import IntervalIndex, parse_time, session_interval
+from utils.session_records import SessionRecord
+
+
+# (userId, 변경 기록 식별자, 추가된 항목들)
+ChangeListener = Callable[[str, str, List[ChangeEntry]], None]
+
+
+class UserPartition:
+    """한 사용자의 데이터 묶음"""
+
+    __slots__ = (
+        "routines", "activities", "progress", "progress_stats", "progress_bitmaps",
+        "day_sessions", "day_buckets", "day_dates", "open_sessions", "intervals", "versions", "changes",
+        "clocks", "lock", "async_lock",
+    )
+
+    def __init__(self):
+        self.routines = OrderedItems()  # routineId → 루틴 (orderIndex 순서 유지)
+        self.activities = OrderedItems()  # activityId → 활동 (orderIndex 순서 유지)
+        # date → routineId → 진행률, 즉 (userId, routineId, date) 인덱스
+        self.progress: Dict[str, Dict[str, dict]] = {}
+        self.progress_stats: Optional[ProgressAggregates] = None  # 처음 조회할 때 생성
+        self.progress_bitmaps: Optional[CompletionBitmaps] = None  # 처음 조회할 때 생성
+        self.day_sessions: Dict[str, SessionRecord] = {}  # sessionId → 세션 (API 응답을 만들 때 모델로 변환)
+        self.day_buckets: Dict[str, List[SessionRecord]] = {}  # date → 시작 시간순 세션 목록
+        self.day_dates: List[str] = []  # 세션이 있는 날짜들 (정렬됨, 기간 조회용)
+        # 끝나지 않은(finished가 아닌) 세션 id → 세션, 마지막으로 기록된 것이 맨 뒤 (진행 중 세션 조회용)
+        self.open_sessions: Dict[str, SessionRecord] = {}
+        self.intervals = IntervalIndex()  # 종료된 세션의 시간 구간 (겹침 검사, 시점 조회용)
+        self.versions: Dict[str, int] = {}  # 컬렉션 → 변경될 때마다 1씩 증가
+        self.changes = ChangeLog()  # 동기화용 변경 기록
+        self.clocks = FieldClocks()  # 필드별 마지막 변경 시각 (배치 병합용)
+        self.lock = threading.RLock()  # 배치 적용 중 다른 스레드의 배치와 섞이지 않도록
+        self.async_lock = asyncio.Lock()  # 같은 이벤트 루프 스레드의 코루틴끼리는 RLock이 막지 못하므로 따로 둔다
+
+    def index_day_session(self, session: SessionRecord):
+        # 실패할 수 있는 정렬 삽입(시작 시간 비교)을 먼저 해서 실패하면 아무 인덱스에도 남지 않게 한다
+        bucket = self.day_buckets.get(session.date)
+        if bucket is None:
+            bucket = [session]
+            self.day_buckets[session.date] = bucket
+            insort(self.day_dates, session.date)
+        else:
+            insort(bucket, session, key=_session_start)
+        self.day_sessions[session.id] = session
+        if session.status != "finished":
+            self.open_sessions[session.id] = session
+        interval = session_interval(session.start_time, session.end_time)
+        if interval is not None:
+            self.intervals.add(session.id, interval)
+
+    def unindex_day_session(self, session: SessionRecord):
+        del self.day_sessions[session.id]
+        self.open_sessions.pop(session.id, None)
+        self.intervals.remove(session.id)
+        bucket = self.day_buckets[session.date]
+        # 같은 시작 시간이 여러 개일 수 있으므로 이진 탐색 후 동일 객체를 찾는다
+        index = bisect_left(bucket, session.start_time, key=_session_start)
+        while bucket[index] is not session:
+            index += 1
+        del bucket[index]
+        if not bucket:
+            self.drop_day_bucket(session.date)
+
+    def sort_open_sessions(self):
+        """마지막으로 기록된 세션이 맨 뒤에 오도록 정렬 (영속 저장소에서 읽어온 뒤 호출)"""
+        self.open_sessions = dict(
+            sorted(self.open_sessions.items(), key=lambda item: item[1].updated_at or datetime.min)
+        )
+
+    def drop_day_bucket(self, date: str) -> List[SessionRecord]:
+        """날짜 버킷 제거 (id 맵은 호출한 쪽에서 정리)"""
+        bucket = self.day_buckets.pop(date, None)
+        if bucket is None:
+            return []
+        # 마지막 세션을 지운 뒤(빈 버킷)에도 날짜 목록에서 빠져야 한다
+        del self.day_dates[bisect_left(self.day_dates, date)]
+        return bucket
+
+
+def _session_start(session: SessionRecord) -> str:
+    return session.start_time
+
+
+def _record_id(record) -> str:
+    return record["id"] if isinstance(record, dict) else record.id
+
+
+def _updated_clock(record) -> datetime:
+    return to_clock(record["updatedAt"] if isinstance(record, dict) else record.updated_at)
+
+
+# 종료 시각 없이 진행 중인 세션 상태
+_RUNNING_STATUSES = {"started", "resting"}
+
+# 필드별 시각 기록에서 제외하는 필드 (변경 시각 자체)
+_CLOCK_EXCLUDED = {"updatedAt", "updated_at"}
+
+
+class MemoryStore:
+    """라우터가 사용하는 저장소 (메모리 구현)
+
+    서버가 재시작되면 데이터가 사라진다. 영속 저장이 필요하면 SqliteStore를 사용한다.
+    """
+
+    persistent = False
+
+    def __init__(self, change_log_limit: int = 5000):
+        self._users: Dict[str, dict] = {}  # userId → 사용자
+        self._users_by_email: Dict[str, dict] = {}  # email → 사용자
+        self._users_lock = threading.Lock()  # 이메일 중복 확인과 사용자 추가를 한 번에
+        self._partitions: Dict[str, UserPartition] = {}
+        self.change_log_limit = change_log_limit  # 사용자별로 보관하는 변경 기록 수
+        self.epoch = os.urandom(4).hex()  # 저장소 인스턴스 식별자 (ETag용)
+        self.log_id = self.epoch  # 변경 기록 식별자 (동기화 커서용, 데이터가 초기화되면 바뀜)
+        self._change_listeners: List[ChangeListener] = []
+
+    # ---------- 공통 ----------
+
+    def clear(self):
+        """모든 데이터 삭제"""
+        self._users.clear()
+        self._users_by_email.clear()
+        self._partitions.clear()
+        self.epoch = os.urandom(4).hex()
+        self.log_id = self.epoch
+
+    def _partition(self, user_id: str) -> UserPartition:
+        partition = self._partitions.get(user_id)
+        if partition is None:
+            partition = UserPartition()
+            self._load_partition(user_id, partition)
+            self._partitions[user_id] = partition
+        return partition
+
+    # 영속 저장소가 재정의하는 훅 (메모리 구현에서는 아무것도 하지 않음)
+
+    def _load_partition(self, user_id: str, partition: UserPartition):
+        """처음 접근한 사용자의 데이터를 채운다"""
+
+    def _persist(self, kind: str, records: List):
+        """추가/수정된 레코드 기록"""
+
+    def _persist_delete(self, kind: str, record_ids: List[str]):
+        """삭제된 레코드 기록"""
+
+    def _persist_changes(self, user_id: str, entries: List[ChangeEntry]):
+        """변경 기록 항목 추가"""
+
+    def _persist_changes_trim(self, user_id: str, floor: int):
+        """floor 이하의 변경 기록 삭제"""
+
+    # 모든 변경은 아래 두 메서드를 거친다
+
+    def _write(self, user_id: str, kind: str, records: Iterable):
+        """추가/수정된 레코드 반영"""
+        records = list(records)
+        if not records:
+            return
+        self._bump(user_id, kind)
+        self._persist(kind, records)
+        self._log(user_id, kind, [(_record_id(record), record) for record in records])
+
+    def _erase(self, user_id: str, kind: str, record_ids: Iterable[str]):
+        """삭제된 레코드 반영"""
+        record_ids = list(record_ids)
+        if not record_ids:
+            return
+        self._bump(user_id, kind)
+        self._persist_delete(kind, record_ids)
+        self._log(user_id, kind, [(record_id, None) for record_id in record_ids])
+
+    @contextmanager
+    def batch(self, user_id: str):
+        """한 사용자의 여러 변경을 묶어서 적용 (다른 스레드에서 실행되는 같은 사용자의 배치와 섞이지 않음)
+
+        영속 저장소는 블록 안의 쓰기를 모아 한 번에 커밋한다.
+        잠금이 재진입 가능한 스레드 잠금이므로 같은 스레드의 코루틴끼리는 서로 막지 못한다.
+        async 핸들러는 batch_async를 사용한다.
+        """
+        with self._partition(user_id).lock:
+            yield
+
+    @asynccontextmanager
+    async def batch_async(self, user_id: str):
+        """batch와 같지만 같은 사용자의 다른 코루틴 배치가 끝날 때까지 기다린다 (블록 안에서 await 가능)"""
+        async with self._partition(user_id).async_lock:
+            with self.batch(user_id):
+                yield
+
+    # ---------- 컬렉션 버전 (ETag) ----------
+
+    def _bump(self, user_id: str, kind: str):
+        if kind == "users":
+            return
+        versions = self._partition(user_id).versions
+        versions[kind] = versions.get(kind, 0) + 1
+
+    def collection_version(self, user_id: str, *kinds: str) -> str:
+        """사용자 컬렉션들의 현재 버전 (변경될 때마다 달라짐, 조회 비용 O(1))
+
+        버전 카운터는 프로세스 메모리에만 있으므로 재시작 후 같은 숫자가 다른 데이터를
+        가리키지 않도록 저장소마다 다른 epoch를 앞에 붙인다.
+        """
+        versions = self._partition(user_id).versions
+        return "-".join([self.epoch] + [str(versions.get(kind, 0)) for kind in kinds])
+
+    # ---------- 변경 기록 (동기화) ----------
+
+    def add_change_listener(self, listener: ChangeListener):
+        """변경 기록에 항목이 추가될 때마다 listener(user_id, log_id, 추가된 항목들) 호출 (실시간 알림용)"""
+        self._change_listeners.append(listener)
+
+    def _log(self, user_id: str, kind: str, changes: List[Tuple[str, object]]):
+        if kind == "users":
+            return
+        log = self._partition(user_id).changes
+        entries = log.append(kind, changes)
+        self._persist_changes(user_id, entries)
+        for listener in self._change_listeners:
+            listener(user_id, self.log_id, entries)
+        floor = log.trim(self.change_log_limit)
+        if floor is not None:
+            self._persist_changes_trim(user_id, floor)
+
+    def _snapshot(self, partition: UserPartition) -> List[Tuple[str, str, object]]:
+        changes = []
+        for kind, items in (("routines", partition.routines), ("activities", partition.activities)):
+            changes.extend((kind, item_id, item) for item_id, item in items.items())
+        for date in sorted(partition.progress):
+            changes.extend(
+                ("routine_progress", progress["id"], progress)
+                for progress in partition.progress[date].values()
+            )
+        for date in partition.day_dates:
+            changes.extend(("day_sessions", session.id, session) for session in partition.day_buckets[date])
+        return changes
+
+    def sync_changes(self, user_id: str, cursor: Optional[str]) -> Tuple[List[Tuple[str, str, object]], str, bool]:
+        """커서 이후의 변경 (컬렉션, id, 레코드 또는 툼스톤 None), 새 커서, 전체 동기화 여부
+
+        커서가 없거나 다른 저장소/초기화 이전의 것이거나 이미 잘려 나간 구간이면
+        현재 데이터 전체를 돌려주고 전체 동기화로 표시한다.
+        """
+        log = self._partition(user_id).changes
+        entries = None
+        if cursor:
+            log_id, _, seq = cursor.rpartition(".")
+            if log_id == self.log_id and seq.isdigit():
+                entries = log.since(int(seq))
+        next_cursor = f"{self.log_id}.{log.seq}"
+        if entries is None:
+            return self._snapshot(self._partition(user_id)), next_cursor, True
+        return [(kind, record_id, record) for _, kind, record_id, record in entries], next_cursor, False
+
+    def _insert_ordered(self, kind: str, items: OrderedItems, item: dict) -> dict:
+        shifted = items.insert(item)
+        self._write(item["userId"], kind, [item] + shifted)
+        return item
+
+    def _remove_ordered(self, kind: str, items: OrderedItems, item_id: str) -> Optional[dict]:
+        # 삭제된 항목보다 뒤에 있는 항목들의 orderIndex 재정렬
+        removed, shifted = items.remove(item_id)
+        if removed is None:
+            return None
+        self._erase(removed["userId"], kind, [item_id])
+        self._write(removed["userId"], kind, shifted)
+        return removed
+
+    def _reorder(
+        self, user_id: str, kind: str, items: OrderedItems, ids: List[str], updated_at: str,
+        at: Optional[datetime] = None,
+    ) -> bool:
+        changed = items.reorder(ids)
+        if changed is None:
+            return False
+        self._partition(user_id).clocks.stamp((kind, ""), ["orderIndex"], at or datetime.now(), datetime.min)
+        # 실제로 위치가 바뀐 항목만 수정/기록
+        for item in changed:
+            item["updatedAt"] = updated_at
+        self._write(user_id, kind, changed)
+        return True
+
+    def _apply(self, kind: str, record: dict, changes: dict, at: Optional[datetime] = None) -> dict:
+        self._stamp(record["userId"], kind, record, changes, at)
+        record.update(changes)
+        self._write(record["userId"], kind, [record])
+        return record
+
+    # ---------- 필드별 변경 시각 (last-writer-wins) ----------
+
+    def _stamp(self, user_id: str, kind: str, record, changes: dict, at: Optional[datetime]):
+        """바뀌기 직전의 레코드 기준으로 변경된 필드들의 시각 기록 (at이 없으면 지금)"""
+        fields = [field for field in changes if field not in _CLOCK_EXCLUDED]
+        self._partition(user_id).clocks.stamp(
+            (kind, _record_id(record)), fields, at or datetime.now(), _updated_clock(record)
+        )
+
+    def reset_clock(self, user_id: str, kind: str, record, at: datetime):
+        """레코드가 at 시점에 만들어진 것으로 기록 (오프라인에서 만든 레코드)"""
+        self._partition(user_id).clocks.reset((kind, _record_id(record)), at)
+
+    def stale_fields(self, user_id: str, kind: str, record, fields: Iterable[str], at: datetime) -> List[str]:
+        """at 이후에 서버에서 바뀐 필드들 (at 시점의 변경으로 덮어쓰면 안 되는 필드)"""
+        clocks = self._partition(user_id).clocks
+        key, base = (kind, _record_id(record)), _updated_clock(record)
+        return [field for field in fields if clocks.get(key, field, base) > at]
+
+    def changed_since(self, user_id: str, kind: str, record, at: datetime) -> bool:
+        """at 이후에 레코드의 어떤 필드라도 바뀌었는지"""
+        return self._partition(user_id).clocks.latest((kind, _record_id(record)), _updated_clock(record)) > at
+
+    def order_changed_since(self, user_id: str, kind: str, at: datetime) -> bool:
+        """at 이후에 컬렉션 순서가 바뀌었는지"""
+        return self._partition(user_id).clocks.get((kind, ""), "orderIndex", datetime.min) > at
+
+    # ---------- 사용자 ----------
+
+    def get_user(self, user_id: str) -> Optional[dict]:
+        return self._users.get(user_id)
+
+    def find_user_by_email(self, email: str) -> Optional[dict]:
+        return self._users_by_email.get(email)
+
+    def _remember_user(self, user: dict):
+        self._users[user["id"]] = user
+        self._users_by_email[user["email"]] = user
+
+    def add_user(self, user: dict) -> Optional[dict]:
+        """사용자 추가 (같은 이메일의 사용자가 이미 있으면 추가하지 않고 None)"""
+        with self._users_lock:
+            if self.find_user_by_email(user["email"]) is not None:
+                return None
+            self._remember_user(user)
+            self._write(user["id"], "users", [user])
+        return user
+
+    # ---------- 루틴 ----------
+
+    def list_routines(self, user_id: str) -> List[dict]:
+        """사용자의 루틴 목록 (orderIndex 순)"""
+        return self._partition(user_id).routines.values()
+
+    def count_routines(self, user_id: str) -> int:
+        return len(self._partition(user_id).routines)
+
+    def get_routine(self, user_id: str, routine_id: str) -> Optional[dict]:
+        return self._partition(user_id).routines.get(routine_id)
+
+    def add_routine(self, routine: dict) -> dict:
+        partition = self._partition(routine["userId"])
+        partition.progress_stats = None  # 루틴 수가 바뀌면 집계 기준도 바뀜
+        return self._insert_ordered("routines", partition.routines, routine)
+
+    def update_routine(
+        self, user_id: str, routine_id: str, changes: dict, at: Optional[datetime] = None
+    ) -> Optional[dict]:
+        routine = self.get_routine(user_id, routine_id)
+        if routine is None:
+            return None
+        return self._apply("routines", routine, changes, at)
+
+    def delete_routine(self, user_id: str, routine_id: str) -> Optional[dict]:
+        partition = self._partition(user_id)
+        removed = self._remove_ordered("routines", partition.routines, routine_id)
+        if removed is not None:
+            partition.progress_stats = None
+            partition.clocks.forget(("routines", routine_id))
+        return removed
+
+    def reorder_routines(
+        self, user_id: str, routine_ids: List[str], updated_at: str, at: Optional[datetime] = None
+    ) -> bool:
+        """주어진 ID들을 앞에서부터 배치하고 나머지는 기존 순서 유지 (사용자 소유가 아닌 ID가 있으면 False)"""
+        return self._reorder(user_id, "routines", self._partition(user_id).routines, routine_ids, updated_at, at)
+
+    # ---------- 활동 ----------
+
+    def list_activities(self, user_id: str) -> List[dict]:
+        """사용자의 활동 목록 (orderIndex 순)"""
+        return self._partition(user_id).activities.values()
+
+    def count_activities(self, user_id: str) -> int:
+        return len(self._partition(user_id).activities)
+
+    def get_activity(self, user_id: str, activity_id: str) -> Optional[dict]:
+        return self._partition(user_id).activities.get(activity_id)
+
+    def add_activity(self, activity: dict) -> dict:
+        return self._insert_ordered("activities", self._partition(activity["userId"]).activities, activity)
+
+    def update_activity(
+        self, user_id: str, activity_id: str, changes: dict, at: Optional[datetime] = None
+    ) -> Optional[dict]:
+        activity = self.get_activity(user_id, activity_id)
+        if activity is None:
+            return None
+        return self._apply("activities", activity, changes, at)
+
+    def delete_activity(self, user_id: str, activity_id: str) -> Optional[dict]:
+        self._partition(user_id).clocks.forget(("activities", activity_id))
+        return self._remove_ordered("activities", self._partition(user_id).activities, activity_id)
+
+    def reorder_activities(
+        self, user_id: str, activity_ids: List[str], updated_at: str, at: Optional[datetime] = None
+    ) -> bool:
+        """주어진 ID들을 앞에서부터 배치하고 나머지는 기존 순서 유지 (사용자 소유가 아닌 ID가 있으면 False)"""
+        return self._reorder(
+            user_id, "activities", self._partition(user_id).activities, activity_ids, updated_at, at
+        )
+
+    # ---------- 루틴 진행률 ----------
+
+    def get_progress(self, user_id: str, routine_id: str, date: str) -> Optional[dict]:
+        return self._partition(user_id).progress.get(date, {}).get(routine_id)
+
+    def list_progress(self, user_id: str, date: str) -> List[dict]:
+        """특정 날짜의 진행률 목록"""
+        return list(self._partition(user_id).progress.get(date, {}).values())
+
+    def list_progress_range(self, user_id: str, dates: List[str]) -> Dict[str, Dict[str, dict]]:
+        """여러 날짜의 진행률을 한 번에 조회 (date → routineId → 진행률, 기록 없는 날짜는 제외)"""
+        by_date = self._partition(user_id).progress
+        return {date: by_date[date] for date in dates if date in by_date}
+
+    def progress_stats(self, user_id: str) -> ProgressAggregates:
+        """사용자의 진행률 집계 (없으면 한 번 만들고 이후에는 쓰기 때마다 갱신)"""
+        partition = self._partition(user_id)
+        if partition.progress_stats is None:
+            partition.progress_stats = ProgressAggregates(partition.routines, partition.progress)
+        return partition.progress_stats
+
+    def progress_bitmaps(self, user_id: str) -> CompletionBitmaps:
+        """사용자의 루틴별 연간 완료 비트맵 (없으면 한 번 만들고 이후에는 쓰기 때마다 갱신)"""
+        partition = self._partition(user_id)
+        if partition.progress_bitmaps is None:
+            partition.progress_bitmaps = CompletionBitmaps(partition.progress)
+        return partition.progress_bitmaps
+
+    def add_progress(self, progress: dict) -> dict:
+        partition = self._partition(progress["userId"])
+        # 집계가 날짜를 해석하지 못하면 레코드를 넣기 전에 실패하도록 집계부터 갱신
+        if partition.progress_stats is not None:
+            partition.progress_stats.apply(progress["routineId"], progress["date"], False, progress["isCompleted"])
+        if partition.progress_bitmaps is not None:
+            partition.progress_bitmaps.set(progress["routineId"], progress["date"], progress["isCompleted"])
+        partition.progress.setdefault(progress["date"], {})[progress["routineId"]] = progress
+        self._write(progress["userId"], "routine_progress", [progress])
+        return progress
+
+    def update_progress(
+        self, user_id: str, routine_id: str, date: str, changes: dict, at: Optional[datetime] = None
+    ) -> Optional[dict]:
+        progress = self.get_progress(user_id, routine_id, date)
+        if progress is None:
+            return None
+        was_completed = progress["isCompleted"]
+        is_completed = changes.get("isCompleted", was_completed)
+        partition = self._partition(user_id)
+        if partition.progress_stats is not None:
+            partition.progress_stats.apply(routine_id, date, was_completed, is_completed)
+        if partition.progress_bitmaps is not None:
+            partition.progress_bitmaps.set(routine_id, date, is_completed)
+        return self._apply("routine_progress", progress, changes, at)
+
+    def set_progress_many(self, user_id: str, records: List[dict], updated_at: str) -> List[dict]:
+        """여러 (routineId, date)의 완료 상태를 한 번에 설정
+
+        records는 기록이 없을 때 새로 저장할 레코드들이다. 이미 같은 상태인 항목은 건드리지 않으므로
+        같은 요청을 다시 보내도 결과가 같고, 실제로 바뀐 레코드만 한 번에 기록한다.
+        """
+        partition = self._partition(user_id)
+        stats, bitmaps = partition.progress_stats, partition.progress_bitmaps
+        results, written = [], []
+        try:
+            for record in records:
+                routine_id, date, is_completed = record["routineId"], record["date"], record["isCompleted"]
+                progress = partition.progress.get(date, {}).get(routine_id)
+                was_completed = progress["isCompleted"] if progress is not None else False
+                if progress is not None and was_completed == is_completed:
+                    results.append(progress)
+                    continue
+                # 집계가 날짜를 해석하지 못하면 레코드를 바꾸기 전에 실패하도록 집계부터 갱신
+                if stats is not None:
+                    stats.apply(routine_id, date, was_completed, is_completed)
+                if bitmaps is not None:
+                    bitmaps.set(routine_id, date, is_completed)
+                if progress is None:
+                    progress = partition.progress.setdefault(date, {})[routine_id] = record
+                else:
+                    self._stamp(user_id, "routine_progress", progress, {"isCompleted": is_completed}, None)
+                    progress["isCompleted"] = is_completed
+                    progress["updatedAt"] = updated_at
+                results.append(progress)
+                written.append(progress)
+        finally:
+            # 중간 항목이 실패해도 이미 바뀐 레코드는 기록해 메모리와 저장소가 어긋나지 않게 한다
+            self._write(user_id, "routine_progress", written)
+        return results
+
+    # ---------- 데이 세션 ----------
+
+    def list_day_sessions(self, user_id: str, date: str) -> List[SessionRecord]:
+        """특정 날짜의 세션 목록 (시작 시간순)"""
+        return list(self._partition(user_id).day_buckets.get(date, ()))
+
+    def list_day_session_dates(self, user_id: str, start: str, end: str) -> List[str]:
+        """start ~ end(포함) 사이에서 세션이 있는 날짜들 (이진 탐색으로 구간만 잘라낸다)"""
+        dates = self._partition(user_id).day_dates
+        return dates[bisect_left(dates, start):bisect_right(dates, end)]
+
+    def list_day_sessions_range(self, user_id: str, start: str, end: str) -> List[SessionRecord]:
+        """start ~ end(포함) 기간의 세션들 (날짜순, 같은 날짜는 시작 시간순)"""
+        buckets = self._partition(user_id).day_buckets
+        return [
+            session
+            for date in self.list_day_session_dates(user_id, start, end)
+            for session in buckets[date]
+        ]
+
+    def get_day_session(self, user_id: str, session_id: str) -> Optional[SessionRecord]:
+        return self._partition(user_id).day_sessions.get(session_id)
+
+    def get_active_day_session(self, user_id: str) -> Optional[SessionRecord]:
+        """진행 중인 세션 (끝나지 않은 세션 중 마지막으로 기록된 것, O(1))"""
+        open_sessions = self._partition(user_id).open_sessions
+        if not open_sessions:
+            return None
+        return open_sessions[next(reversed(open_sessions))]
+
+    def find_day_sessions_overlapping(
+        self, user_id: str, start: float, end: float, include_open: bool = False
+    ) -> List[SessionRecord]:
+        """[start, end)(epoch 초)와 겹치는 세션 (시작 시각순), start == end면 그 시점을 포함하는 세션
+
+        include_open이면 타이머가 돌고 있고(started, resting) end 이전에 시작한 세션도 포함한다.
+        """
+        partition = self._partition(user_id)
+        sessions = [partition.day_sessions[session_id] for session_id in partition.intervals.overlapping(start, end)]
+        if include_open:
+            running = []
+            for session in partition.open_sessions.values():
+                started = parse_time(session.start_time)
+                if session.status in _RUNNING_STATUSES and not session.end_time and started is not None and started <= end:
+                    running.append(session)
+            if running:
+                sessions = sorted(sessions + running, key=_session_start)
+        return sessions
+
+    def add_day_session(self, session: DaySession) -> SessionRecord:
+        record = SessionRecord.from_model(session)
+        self._partition(record.user_id).index_day_session(record)
+        self._write(record.user_id, "day_sessions", [record])
+        return record
+
+    def update_day_session(
+        self, user_id: str, session_id: str, changes: dict, at: Optional[datetime] = None
+    ) -> Optional[SessionRecord]:
+        partition = self._partition(user_id)
+        session = partition.day_sessions.get(session_id)
+        if session is None:
+            return None
+        # 인덱스에서 빼기 전에 새 정렬 키를 확인 (다시 넣지 못하면 세션이 버킷에서 사라진다)
+        if not isinstance(changes.get("start_time", session.start_time), str):
+            raise ValueError("start_time은 문자열이어야 합니다")
+        self._stamp(user_id, "day_sessions", session, changes, at)
+        # 시작 시간이 바뀌면 버킷 안의 위치도 바뀌므로 뺐다가 다시 넣는다
+        partition.unindex_day_session(session)
+        session.update(changes)
+        partition.index_day_session(session)
+        self._write(user_id, "day_sessions", [session])
+        return session
+
+    def delete_day_session(self, user_id: str, session_id: str) -> Optional[SessionRecord]:
+        partition = self._partition(user_id)
+        session = partition.day_sessions.get(session_id)
+        if session is not None:
+            partition.unindex_day_session(session)
+            partition.clocks.forget(("day_sessions", session_id))
+            self._erase(user_id, "day_sessions", [session_id])
+        return session
+
+    def replace_day_sessions(self, user_id: str, date: str, sessions: List[DaySession]) -> List[SessionRecord]:
+        """해당 날짜의 세션들을 통째로 교체 (해당 날짜 버킷만 바꾼다)"""
+        partition = self._partition(user_id)
+        removed = partition.drop_day_bucket(date)
+        for session in removed:
+            del partition.day_sessions[session.id]
+            partition.open_sessions.pop(session.id, None)
+            partition.intervals.remove(session.id)
+            partition.clocks.forget(("day_sessions", session.id))
+        records = [SessionRecord.from_model(session) for session in sessions]
+        for record in records:
+            partition.index_day_session(record)
+        self._erase(user_id, "day_sessions", [s.id for s in removed])
+        self._write(user_id, "day_sessions", records)
+        return sorted(records, key=_session_start)
@@ -0,0 +1,50 @@
+import { apiClient, ApiError } from './config';
+
+// 배치 관련 타입 정의
+export type BatchKind = 'routines' | 'activities' | 'routine_progress' | 'day_sessions';
+export type BatchOp = 'create' | 'update' | 'delete' | 'reorder' | 'set';
+
+export interface BatchMutation {
+  kind: BatchKind;
+  op: BatchOp;
+  id?: string; // update/delete 대상 ID ("$0"이면 같은 배치 0번 create로 만든 ID)
+  data?: Record<string, any>; // 각 API의 요청 본문과 같은 형태
+  clientTimestamp: string; // 오프라인에서 변경한 시각 (ISO 형식)
+}
+
+export interface BatchResult {
+  index: number;
+  status: number; // 개별 요청과 같은 HTTP 상태 코드 (409: 서버에 더 최근 변경이 있음)
+  id?: string | null;
+  detail?: string | null;
+  ignoredFields: string[];
+  data?: Record<string, any> | null;
+}
+
+export interface BatchResponse {
+  results: BatchResult[];
+}
+
+// 배치 API 서비스 클래스
+export class BatchService {
+  /**
+   * 오프라인에서 쌓인 변경들을 한 번에 적용
+   */
+  static async applyBatch(mutations: BatchMutation[]): Promise<BatchResponse> {
+    try {
+      const response = await apiClient.post<BatchResponse>('/batch', { mutations });
+      return response.data;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '변경 사항 동기화 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+}
+
+// 편의 함수들
+export const batchService = BatchService;
+
+export default BatchService;
@@ -18,13 +18,27 @@ export const apiClient = axios.create({
   },
 });
 
-// 요청 인터셉터 - JWT 토큰 자동 추가
+const IDEMPOTENT_METHODS = ['POST', 'PUT', 'PATCH', 'DELETE'];
+
+const createIdempotencyKey = (): string => {
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}${Math.random().toString(36).slice(2)}`;
+};
+
+// 요청 인터셉터 - JWT 토큰, Idempotency-Key 자동 추가
 apiClient.interceptors.request.use(
   (config) => {
     const token = localStorage.getItem('access_token');
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
+    // 쓰기 요청마다 Idempotency-Key 부여 (같은 config로 재시도하면 서버가 저장된 응답을 돌려줌)
+    const method = (config.method || 'get').toUpperCase();
+    if (IDEMPOTENT_METHODS.includes(method) && !config.headers['Idempotency-Key']) {
+      config.headers['Idempotency-Key'] = createIdempotencyKey();
+    }
     return config;
   },
   (error) => {
@@ -44,11 +44,32 @@ export interface DayRecord {
   sessions: DaySession[];
 }
 
+export interface DayRecordRange {
+  startDate: string; // YYYY-MM-DD 형식
+  endDate: string; // YYYY-MM-DD 형식
+  records: DayRecord[]; // 세션이 있는 날짜만 포함
+  nextCursor?: string | null;
+}
+
 export interface DayRecordUpdate {
   date: string; // YYYY-MM-DD 형식
   sessions: DaySessionCreate[];
 }
 
+// 타이머 상태 전이 (DayPage 버튼과 같은 이름)
+export type SessionTransitionEvent = 'start' | 'complete' | 'rest' | 'rest_end' | 'finish' | 'continue' | 'newAction';
+
+export interface DaySessionTransition {
+  event: SessionTransitionEvent;
+  at?: string; // ISO 형식, 없으면 서버 시각
+  action?: string; // complete: 완료한 활동, continue/newAction: 새 세션의 활동
+}
+
+export interface DaySessionTransitionResult {
+  session: DaySession; // 전이된 현재 세션
+  next?: DaySession | null; // 이어서 만들어진 세션 (휴식, 다음 작업, 다음 세트)
+}
+
 // 세션 통계 타입
 export interface SessionStats {
   totalSessions: number;
@@ -79,6 +100,40 @@ export class DaySessionsService {
     }
   }
 
+  /**
+   * 진행 중인 세션 조회 (끝나지 않은 세션 중 마지막으로 기록된 것, 없으면 null)
+   */
+  static async getActiveSession(): Promise<DaySession | null> {
+    try {
+      const response = await apiClient.get<DaySession | null>('/api/day-sessions/active');
+      return response.data;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '진행 중인 세션 조회 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+
+  /**
+   * 특정 시각(until이 있으면 [time, until) 구간)에 진행되던 세션 조회
+   */
+  static async getSessionsAt(time: string, until?: string): Promise<DaySession[]> {
+    try {
+      const response = await apiClient.get<DaySession[]>('/api/day-sessions/at', {
+        params: until ? { time, until } : { time }
+      });
+      return response.data;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '시각별 세션 조회 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+
   /**
    * 새 데이 세션 생성
    */
@@ -126,6 +181,25 @@ export class DaySessionsService {
     }
   }
 
+  /**
+   * 세션 상태 전이 (현재 세션 마감과 이어지는 세션 생성을 한 번에, 불가능한 전이면 409)
+   */
+  static async transitionDaySession(sessionId: string, transition: DaySessionTransition): Promise<DaySessionTransitionResult> {
+    try {
+      const response = await apiClient.post<DaySessionTransitionResult>(
+        `/api/day-sessions/${sessionId}/transition`,
+        transition
+      );
+      return response.data;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '세션 상태 변경 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+
   /**
    * 하루 전체 세션 업데이트 (bulk update)
    */
@@ -288,15 +362,42 @@ export class DaySessionsService {
     }
   }
 
+  /**
+   * 기간 내 데이 세션 조회 (세션이 있는 날짜만, 커서를 따라 모든 페이지 조회)
+   */
+  static async getDaySessionsRange(from: string, to: string): Promise<DayRecord[]> {
+    try {
+      const records: DayRecord[] = [];
+      let cursor: string | null | undefined = undefined;
+      do {
+        const params: Record<string, string> = { from, to };
+        if (cursor) params.cursor = cursor;
+        const response: { data: DayRecordRange } = await apiClient.get<DayRecordRange>('/api/day-sessions', { params });
+        records.push(...response.data.records);
+        cursor = response.data.nextCursor;
+      } while (cursor);
+      return records;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '기간 세션 조회 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+
   /**
    * 주간 세션 데이터 조회
    */
   static async getWeeklySessions(startDate: string, endDate: string): Promise<DayRecord[]> {
     try {
-      const dates = this.getDateRange(startDate, endDate);
-      const promises = dates.map(date => this.getDaySessions(date));
-      const results = await Promise.all(promises);
-      return results;
+      const records = await this.getDaySessionsRange(startDate, endDate);
+      const recordMap = new Map(records.map(record => [record.date, record]));
+      
+      // 세션이 없는 날짜는 빈 기록으로 채움
+      return this.getDateRange(startDate, endDate).map(
+        date => recordMap.get(date) || { date, sessions: [] }
+      );
     } catch (error) {
       console.error('주간 세션 데이터 조회 중 오류:', error);
       return [];
@@ -0,0 +1,90 @@
+import { API_BASE_URL } from './config';
+import { SyncResponse } from './syncService';
+
+// 실시간 이벤트는 /sync 응답과 같은 형태 ({ cursor, reset, changes })
+export type ChangeEvent = SyncResponse;
+
+export interface EventSubscription {
+  close: () => void;
+}
+
+const RECONNECT_DELAY_MS = 3000;
+
+// 실시간 이벤트 서비스 클래스 (WebSocket, 안 되면 SSE)
+export class EventsService {
+  /**
+   * 다른 기기에서의 변경을 실시간으로 구독
+   * 연결이 끊기면 마지막 cursor 이후부터 다시 받는다 (서버가 느린 연결을 끊은 경우 포함)
+   */
+  static subscribe(onEvent: (event: ChangeEvent) => void, since?: string | null): EventSubscription {
+    let cursor = since || null;
+    let closed = false;
+    let socket: WebSocket | null = null;
+    let source: EventSource | null = null;
+    let retryTimer: ReturnType<typeof setTimeout> | null = null;
+
+    const handle = (data: string) => {
+      const event: ChangeEvent = JSON.parse(data);
+      cursor = event.cursor;
+      onEvent(event);
+    };
+
+    const query = () => {
+      const params = new URLSearchParams({ token: localStorage.getItem('access_token') || '' });
+      if (cursor) {
+        params.set('since', cursor);
+      }
+      return params.toString();
+    };
+
+    const scheduleReconnect = (connect: () => void) => {
+      if (!closed) {
+        retryTimer = setTimeout(connect, RECONNECT_DELAY_MS);
+      }
+    };
+
+    const connectSse = () => {
+      source = new EventSource(`${API_BASE_URL}/events/stream?${query()}`);
+      source.addEventListener('changes', (message) => handle((message as MessageEvent).data));
+      source.onerror = () => {
+        source?.close();
+        scheduleReconnect(connectSse);
+      };
+    };
+
+    const connectWebSocket = () => {
+      let opened = false;
+      socket = new WebSocket(`${API_BASE_URL.replace(/^http/, 'ws')}/events/ws?${query()}`);
+      socket.onopen = () => {
+        opened = true;
+      };
+      socket.onmessage = (message) => handle(message.data);
+      socket.onclose = () => {
+        // 한 번도 연결되지 않았으면 WebSocket을 쓸 수 없는 환경으로 보고 SSE로 전환
+        scheduleReconnect(opened ? connectWebSocket : connectSse);
+      };
+    };
+
+    if (typeof WebSocket !== 'undefined') {
+      connectWebSocket();
+    } else {
+      connectSse();
+    }
+
+    return {
+      close: () => {
+        closed = true;
+        if (retryTimer) {
+          clearTimeout(retryTimer);
+        }
+        socket?.close();
+        source?.close();
+      }
+    };
+  }
+}
+
+// 편의 함수들
+export const eventsService = EventsService;
+
+export default EventsService;
@@ -41,13 +41,30 @@ export interface WeeklyRoutineProgress {
   dailyProgress: DailyRoutineProgress[];
 }
 
+export interface RangeRoutineProgress {
+  startDate: string;
+  endDate: string;
+  dailyProgress: DailyRoutineProgress[];
+}
+
+// 루틴별 완료율 타입
+export interface RoutineCompletionRate {
+  routineId: string;
+  routineText: string;
+  completedDays: number;
+  totalDays: number;
+  completionRate: number;
+}
+
 // 진행상황 통계 타입
 export interface ProgressStats {
+  date?: string;
   totalRoutines: number;
   completedRoutines: number;
   completionRate: number;
   streak: number; // 연속 완료 일수
   bestStreak: number; // 최고 연속 완료 일수
+  routineRates: RoutineCompletionRate[]; // 루틴별 누적 완료율
 }
 
 // 루틴 진행상황 API 서비스 클래스
@@ -84,6 +101,22 @@ export class RoutineProgressService {
     }
   }
 
+  /**
+   * 여러 루틴/날짜의 완료 상태를 한 번에 설정 (같은 요청을 다시 보내도 결과 동일)
+   */
+  static async setRoutineProgressBulk(items: RoutineProgressCreate[]): Promise<RoutineProgressResponse[]> {
+    try {
+      const response = await apiClient.put<RoutineProgressResponse[]>('/routine-progress/bulk', { items });
+      return response.data;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '루틴 상태 일괄 변경 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+
   /**
    * 특정 날짜의 일일 루틴 진행상황 조회 (루틴 정보 포함)
    */
@@ -118,6 +151,24 @@ export class RoutineProgressService {
     }
   }
 
+  /**
+   * 기간 루틴 진행상황 조회 (월간/분기/연간, 최대 366일을 한 번에)
+   */
+  static async getRoutineProgressRange(from: string, to: string): Promise<RangeRoutineProgress> {
+    try {
+      const response = await apiClient.get<RangeRoutineProgress>(
+        `/routine-progress/range?from=${from}&to=${to}`
+      );
+      return response.data;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '기간 루틴 진행상황 조회 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+
   /**
    * 오늘의 루틴 진행상황 조회
    */
@@ -154,8 +205,8 @@ export class RoutineProgressService {
       const startDate = `${year}-${month.toString().padStart(2, '0')}-01`;
       const endDate = new Date(year, month, 0).toISOString().split('T')[0]; // 해당 월의 마지막 날
       
-      const weeklyProgress = await this.getWeeklyRoutineProgress(startDate, endDate);
-      return weeklyProgress.dailyProgress;
+      const rangeProgress = await this.getRoutineProgressRange(startDate, endDate);
+      return rangeProgress.dailyProgress;
     } catch (error) {
       console.error('월간 진행상황 조회 중 오류:', error);
       return [];
@@ -163,78 +214,25 @@ export class RoutineProgressService {
   }
 
   /**
-   * 진행상황 통계 계산
+   * 진행상황 통계 조회 (연속 완료 일수/최고 기록은 서버 집계를 한 번에 조회)
    */
   static async getProgressStats(date: string): Promise<ProgressStats> {
     try {
-      const dailyProgress = await this.getDailyRoutineProgress(date);
-      const totalRoutines = dailyProgress.routines.length;
-      const completedRoutines = dailyProgress.routines.filter(r => r.isCompleted).length;
-      const completionRate = totalRoutines > 0 ? (completedRoutines / totalRoutines) * 100 : 0;
-
-      // 연속 완료 일수 계산 (간단한 버전)
-      const streak = await this.calculateStreak(date);
-      const bestStreak = await this.calculateBestStreak();
-
-      return {
-        totalRoutines,
-        completedRoutines,
-        completionRate: Math.round(completionRate * 100) / 100, // 소수점 2자리
-        streak,
-        bestStreak
-      };
+      const response = await apiClient.get<ProgressStats>(`/routine-progress/stats?date=${date}`);
+      return response.data;
     } catch (error) {
-      console.error('진행상황 통계 계산 중 오류:', error);
+      console.error('진행상황 통계 조회 중 오류:', error);
       return {
         totalRoutines: 0,
         completedRoutines: 0,
         completionRate: 0,
         streak: 0,
-        bestStreak: 0
+        bestStreak: 0,
+        routineRates: []
       };
     }
   }
 
-  /**
-   * 연속 완료 일수 계산 (현재 날짜부터 역순으로)
-   */
-  private static async calculateStreak(currentDate: string): Promise<number> {
-    try {
-      let streak = 0;
-      let checkDate = new Date(currentDate);
-
-      for (let i = 0; i < 30; i++) { // 최대 30일까지만 확인
-        const dateStr = checkDate.toISOString().split('T')[0];
-        const dailyProgress = await this.getDailyRoutineProgress(dateStr);
-        
-        const totalRoutines = dailyProgress.routines.length;
-        const completedRoutines = dailyProgress.routines.filter(r => r.isCompleted).length;
-        
-        if (totalRoutines > 0 && completedRoutines === totalRoutines) {
-          streak++;
-          checkDate.setDate(checkDate.getDate() - 1);
-        } else {
-          break;
-        }
-      }
-
-      return streak;
-    } catch (error) {
-      console.error('연속 완료 일수 계산 중 오류:', error);
-      return 0;
-    }
-  }
-
-  /**
-   * 최고 연속 완료 일수 계산 (구현 복잡도로 인해 간단한 버전)
-   */
-  private static async calculateBestStreak(): Promise<number> {
-    // 실제로는 서버에서 계산하는 것이 효율적
-    // 여기서는 현재 streak을 반환 (간단한 구현)
-    const today = new Date().toISOString().split('T')[0];
-    return this.calculateStreak(today);
-  }
-
   /**
    * 완료율이 높은 루틴 조회
    */
@@ -0,0 +1,43 @@
+import { apiClient, ApiError } from './config';
+
+// 동기화 관련 타입 정의
+export type SyncKind = 'routines' | 'activities' | 'routine_progress' | 'day_sessions';
+
+export interface SyncChange {
+  kind: SyncKind;
+  id: string;
+  deleted: boolean; // true면 data 없이 삭제된 레코드 (툼스톤)
+  data?: Record<string, any> | null;
+}
+
+export interface SyncResponse {
+  cursor: string; // 다음 요청에 since로 보낼 커서
+  reset: boolean; // true면 로컬 데이터를 모두 버리고 changes로 다시 채운다
+  changes: SyncChange[];
+}
+
+// 동기화 API 서비스 클래스
+export class SyncService {
+  /**
+   * 마지막 커서 이후의 변경 조회 (커서가 없으면 전체 데이터)
+   */
+  static async getChanges(since?: string | null): Promise<SyncResponse> {
+    try {
+      const response = await apiClient.get<SyncResponse>('/sync', {
+        params: since ? { since } : undefined
+      });
+      return response.data;
+    } catch (error: any) {
+      const apiError: ApiError = {
+        detail: error.response?.data?.detail || '동기화 중 오류가 발생했습니다.',
+        status: error.response?.status
+      };
+      throw apiError;
+    }
+  }
+}
+
+// 편의 함수들
+export const syncService = SyncService;
+
+export default SyncService;
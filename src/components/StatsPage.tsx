@@ -58,11 +58,12 @@ export function StatsPage({
         const startDate = `${currentYear}-${currentMonth.toString().padStart(2, '0')}-01`;
         const endDate = new Date(currentYear, currentMonth, 0).toISOString().split('T')[0];
         
-        const weeklyProgress = await RoutineProgressService.getWeeklyRoutineProgress(startDate, endDate);
+        // 한 달치를 한 번의 요청으로 조회
+        const rangeProgress = await RoutineProgressService.getRoutineProgressRange(startDate, endDate);
         
         // API 응답을 로컬 형식으로 변환
         const convertedProgress: RoutineProgress[] = [];
-        weeklyProgress.dailyProgress.forEach(daily => {
+        rangeProgress.dailyProgress.forEach(daily => {
           daily.routines.forEach(routine => {
             convertedProgress.push({
               routineId: routine.id,